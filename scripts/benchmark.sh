@@ -0,0 +1,109 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+
+## --- Base --- ##
+_SCRIPT_DIR="$(cd -- "$(dirname -- "${BASH_SOURCE[0]:-"$0"}")" >/dev/null 2>&1 && pwd -P)"
+_PROJECT_DIR="$(cd "${_SCRIPT_DIR}/.." >/dev/null 2>&1 && pwd)"
+cd "${_PROJECT_DIR}" || exit 2
+
+
+if ! command -v python >/dev/null 2>&1; then
+	echo "[ERROR]: Not found 'python' command, please install it first!" >&2
+	exit 1
+fi
+
+if ! python -c "import pytest_benchmark" &> /dev/null; then
+	echo "[ERROR]: 'pytest-benchmark' python package is not installed!" >&2
+	exit 1
+fi
+## --- Base --- ##
+
+
+## --- Variables --- ##
+# Load from environment variables:
+BENCHMARK_JSON_PATH="${BENCHMARK_JSON_PATH:-.benchmarks/latest.json}"
+
+# Flags:
+_IS_SAVE=false
+_COMPARE_RUN=""
+## --- Variables --- ##
+
+
+## --- Menu arguments --- ##
+_usage_help() {
+	cat <<EOF
+USAGE: ${0} [options]
+
+OPTIONS:
+    -s, --save                Save results into '.benchmarks/' directory with auto-increment ID. Default: false
+    -c, --compare [RUN_ID]    Compare with saved run (latest if RUN_ID is empty), fails if mean regressed by 10%.
+    -j, --json=[PATH]         Results JSON file path. Default: ${BENCHMARK_JSON_PATH}
+    -h, --help                Show this help message.
+
+EXAMPLES:
+    ${0} -s
+    ${0} --compare
+    ${0} -c 0001 --json=.benchmarks/current.json
+EOF
+}
+
+while [ $# -gt 0 ]; do
+	case "${1}" in
+		-s | --save)
+			_IS_SAVE=true
+			shift;;
+		-c | --compare)
+			_COMPARE_RUN="latest"
+			shift
+			if [ $# -gt 0 ] && [[ "${1}" != -* ]]; then
+				_COMPARE_RUN="${1}"
+				shift
+			fi;;
+		-j=* | --json=*)
+			BENCHMARK_JSON_PATH="${1#*=}"
+			shift;;
+		-h | --help)
+			_usage_help
+			exit 0;;
+		*)
+			echo "[ERROR]: Failed to parse argument -> ${1}!" >&2
+			_usage_help
+			exit 1;;
+	esac
+done
+## --- Menu arguments --- ##
+
+
+## --- Main --- ##
+main()
+{
+	local _save_param=""
+	local _compare_param=""
+	if [ "${_IS_SAVE}" == true ]; then
+		_save_param="--benchmark-autosave"
+	fi
+
+	if [ "${_COMPARE_RUN}" == "latest" ]; then
+		_compare_param="--benchmark-compare --benchmark-compare-fail=mean:10%"
+	elif [ -n "${_COMPARE_RUN}" ]; then
+		_compare_param="--benchmark-compare=${_COMPARE_RUN} --benchmark-compare-fail=mean:10%"
+	fi
+
+	mkdir -pv "$(dirname "${BENCHMARK_JSON_PATH}")"
+
+	echo "[INFO]: Running benchmarks..."
+	# shellcheck disable=SC2086
+	python -m pytest ./tests/benchmarks \
+		-m benchmarks \
+		--benchmark-enable \
+		--benchmark-only \
+		--benchmark-sort=fullname \
+		--benchmark-columns=min,median,mean,max,ops,rounds \
+		--benchmark-json="${BENCHMARK_JSON_PATH}" \
+		${_save_param} ${_compare_param} || exit 2
+	echo "[OK]: Done."
+}
+
+main
+## --- Main --- ##
@@ -1,11 +1,44 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .__version__ import __version__
 from .constants import LogLevelEnum
-from .schemas import LoguruHandlerPM, LogHandlerPM
-from .config import get_default_handlers, LoggerConfigPM
-from ._core import Logger, logger, LoggerLoader
-from .mode import log_at
+
+if TYPE_CHECKING:
+    from .schemas import LoguruHandlerPM, LogHandlerPM
+    from .config import get_default_handlers, LoggerConfigPM
+    from ._core import Logger, logger, LoggerLoader
+    from .mode import log_at
+
+
+# Heavy modules (pydantic, potato_util, loguru) are imported on first attribute access (PEP 562):
+_LAZY_ATTRS: dict[str, str] = {
+    "LoguruHandlerPM": ".schemas",
+    "LogHandlerPM": ".schemas",
+    "get_default_handlers": ".config",
+    "LoggerConfigPM": ".config",
+    "Logger": "._core",
+    "logger": "._core",
+    "LoggerLoader": "._core",
+    "log_at": ".mode",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    import importlib
+
+    _value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = _value
+    return _value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "__version__",
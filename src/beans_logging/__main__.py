@@ -0,0 +1,148 @@
+import sys
+import datetime
+import argparse
+
+
+def _convert(args: argparse.Namespace) -> int:
+    from .binary import convert_to_json
+
+    if args.output == "-":
+        for _path in args.files:
+            convert_to_json(_path, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf8") as _output:
+            for _path in args.files:
+                convert_to_json(_path, _output)
+
+    return 0
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(
+            f"'{value}' is invalid, must be ISO format datetime (e.g. '2026-01-31T23:59:59+00:00')!"
+        ) from err
+
+
+def _parse_level(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+
+    from loguru import logger
+
+    try:
+        return logger.level(value.upper()).no
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(f"'{value}' level is not found!") from err
+
+
+def _parse_extra(value: str) -> tuple[str, str]:
+    _key, _sep, _value = value.partition("=")
+    if (not _sep) or (not _key):
+        raise argparse.ArgumentTypeError(
+            f"'{value}' is invalid, must be 'KEY=VALUE' format!"
+        )
+
+    return _key, _value
+
+
+def _query(args: argparse.Namespace) -> int:
+    from .queries import LogQuery
+
+    _log_query = LogQuery(
+        since=args.since,
+        until=args.until,
+        level_no=args.level,
+        name=args.name,
+        extra=dict(args.extra or []),
+    )
+    if args.output == "-":
+        for _line in _log_query.search_all(args.files):
+            sys.stdout.buffer.write(_line + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as _output:
+            for _line in _log_query.search_all(args.files):
+                _output.write(_line + b"\n")
+
+    return 0
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    _parser = argparse.ArgumentParser(
+        prog="python -m beans_logging", description="beans_logging command line tools."
+    )
+    _subparsers = _parser.add_subparsers(dest="command", required=True)
+
+    _convert_parser = _subparsers.add_parser(
+        "convert", help="Convert binary log files into json lines."
+    )
+    _convert_parser.add_argument(
+        "files",
+        nargs="+",
+        help="Binary log file paths, rotated files are decompressed by their extension.",
+    )
+    _convert_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Output json lines file path. Default is '-' (stdout).",
+    )
+    _convert_parser.set_defaults(func=_convert)
+
+    _query_parser = _subparsers.add_parser(
+        "query", help="Search json (or binary) log files, output matched json lines."
+    )
+    _query_parser.add_argument(
+        "files",
+        nargs="+",
+        help="Log file paths or glob patterns (e.g. 'logs/json/app.all.json.log*').",
+    )
+    _query_parser.add_argument(
+        "--since", type=_parse_datetime, help="Min datetime (ISO format, inclusive)."
+    )
+    _query_parser.add_argument(
+        "--until", type=_parse_datetime, help="Max datetime (ISO format, inclusive)."
+    )
+    _query_parser.add_argument(
+        "--level", type=_parse_level, help="Min level name or number (e.g. 'WARNING')."
+    )
+    _query_parser.add_argument(
+        "--name", help="Logger name (module) or its parent package name."
+    )
+    _query_parser.add_argument(
+        "--extra",
+        type=_parse_extra,
+        action="append",
+        metavar="KEY=VALUE",
+        help="Extra field value to match (e.g. 'request_id=abc'), can be repeated.",
+    )
+    _query_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Output json lines file path. Default is '-' (stdout).",
+    )
+    _query_parser.set_defaults(func=_query)
+
+    return _parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run beans_logging command line tools.
+
+    Args:
+        argv (list[str] | None, optional): Command line arguments. Default is None, which means `sys.argv`.
+
+    Returns:
+        int: Exit code.
+    """
+
+    _args = _get_parser().parse_args(argv)
+    return _args.func(_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
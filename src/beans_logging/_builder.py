@@ -1,32 +1,433 @@
 import os
-from typing import Any
+import functools
+from typing import TYPE_CHECKING, Any
 from pathlib import Path
 
+from loguru import logger
 from pydantic import validate_call
 
-from .constants import LogHandlerTypeEnum, LogLevelEnum
-from .schemas import LogHandlerPM
+from .constants import (
+    FILE_SINK_ATTRS,
+    LogHandlerTypeEnum,
+    LogLevelEnum,
+    DEFAULT_STD_HANDLER_NAME,
+    DEFAULT_FILE_HANDLER_NAME,
+    DEFAULT_ERR_FILE_HANDLER_NAME,
+    DEFAULT_JSON_HANDLER_NAME,
+    DEFAULT_ERR_JSON_HANDLER_NAME,
+)
+from .schemas import (
+    LogHandlerPM,
+    RingBufferPM,
+    SamplingPM,
+    MemoryPM,
+    SocketPM,
+    HttpPM,
+    SyslogPM,
+    QueuePM,
+)
 from .config import LoggerConfigPM
-from .sinks import std_sink
-from .formats import json_format
-from .filters import (
-    all_handlers_filter,
-    std_filter,
-    file_filter,
-    err_file_filter,
-    json_filter,
-    err_json_filter,
+from .sinks import (
+    std_sink,
+    BufferedStdSink,
+    MemorySink,
+    make_file_sink,
+    is_wrappable_sink,
 )
+from .buffers import RingBufferSink
+from .formats import get_json_formatter, get_text_formatter
+from .filters import build_filter, apply_sampler
 from .rotators import Rotator
+from .compressors import get_compressor
 
+if TYPE_CHECKING:
+    # Optional features are imported only by the handlers which use them:
+    from .transports import SocketSink, HttpSink, SyslogSink
+    from .samplers import Sampler
+    from .metrics import HandlerMetrics
+    from .profilers import Profiler, ProfilerSink
 
-@validate_call
-def build_handler(handler: LogHandlerPM, config: LoggerConfigPM) -> dict[str, Any]:
-    """Build handler config as dictionary for Loguru logger to add new handler.
+
+def _get_filter_names(handler: LogHandlerPM, name: str | None = None) -> list[str]:
+    """Get handler names to check 'disable_{handler_name}' extra keys in compiled filter.
+
+    Args:
+        handler (LogHandlerPM, required): Target log handler model.
+        name    (str | None  , optional): Handler name. Default is None.
+
+    Returns:
+        list[str]: Default handler name based on handler type and the handler name itself.
+    """
+
+    _names: list[str] = []
+    if handler.type_ == LogHandlerTypeEnum.STD:
+        _names.append(DEFAULT_STD_HANDLER_NAME)
+    elif handler.type_ in (LogHandlerTypeEnum.FILE, LogHandlerTypeEnum.QUEUE):
+        if handler.serialize or handler.custom_serialize:
+            if handler.error:
+                _names.append(DEFAULT_ERR_JSON_HANDLER_NAME)
+            else:
+                _names.append(DEFAULT_JSON_HANDLER_NAME)
+        else:
+            if handler.error:
+                _names.append(DEFAULT_ERR_FILE_HANDLER_NAME)
+            else:
+                _names.append(DEFAULT_FILE_HANDLER_NAME)
+
+    if name and (name not in _names):
+        _names.append(name)
+
+    return _names
+
+
+def _get_level_no(level: str | int | LogLevelEnum) -> int:
+    if isinstance(level, int):
+        return level
+
+    if isinstance(level, LogLevelEnum):
+        level = level.value
+
+    return logger.level(level).no
+
+
+def _get_sampler(
+    handler: LogHandlerPM, config: LoggerConfigPM, name: str | None = None
+) -> "Sampler | None":
+    """Get sampler for handler, handler's own 'sampling' overrides the main config 'sampling'.
 
     Args:
         handler (LogHandlerPM  , required): Target log handler model.
-        config  (LoggerConfigPM, required): Default main config model to fill missing values.
+        config  (LoggerConfigPM, required): Main config model.
+        name    (str | None    , optional): Handler name, to separate overridden sampler. Default is None.
+
+    Returns:
+        Sampler | None: Shared sampler instance or None if sampling is disabled.
+    """
+
+    _sampling: SamplingPM | None = handler.sampling
+    if _sampling is None:
+        # Handlers without override share the same sampler, so each record is sampled once:
+        _sampling, name = config.sampling, None
+
+    if (_sampling is None) or (not _sampling.enabled):
+        return None
+
+    if (_sampling.rate is None) and (not _sampling.every_n):
+        return None
+
+    from .samplers import get_sampler
+
+    return get_sampler(
+        rate=_sampling.rate,
+        burst=_sampling.burst,
+        every_n=tuple(
+            sorted(
+                (_get_level_no(_level), _n) for _level, _n in _sampling.every_n.items()
+            )
+        ),
+        exempt_level_no=_get_level_no(_sampling.exempt_level),
+        report_interval=_sampling.report_interval,
+        name=name,
+    )
+
+
+def _wrap_memory(
+    handler_dict: dict[str, Any], memory: MemoryPM, encoding: str
+) -> dict[str, Any]:
+    """Wrap handler sink (dump file path or sink) with flight recorder memory sink, records are recorded by
+    handler filter and formatted only when they are dumped.
+
+    Args:
+        handler_dict (dict[str, Any], required): Loguru handler config as dictionary.
+        memory       (MemoryPM      , required): Memory config model.
+        encoding     (str           , required): Dump file encoding.
+
+    Returns:
+        dict[str, Any]: Loguru handler config as dictionary with memory sink.
+    """
+
+    for _attr in FILE_SINK_ATTRS:
+        handler_dict.pop(_attr, None)
+
+    _sink = handler_dict["sink"]
+    if isinstance(_sink, (str, os.PathLike)):
+        handler_dict.setdefault("colorize", False)
+
+    _memory_sink = MemorySink(
+        dump_sink=_sink,
+        capacity=memory.capacity,
+        dump_level_no=_get_level_no(memory.dump_level),
+        encoding=encoding,
+        format_=handler_dict.get("format"),
+        filter_=handler_dict.get("filter"),
+    )
+    handler_dict["sink"] = _memory_sink
+    handler_dict["filter"] = _memory_sink.record
+    return handler_dict
+
+
+def _make_socket_sink(socket: SocketPM, encoding: str) -> "SocketSink":
+    """Make socket sink from socket config.
+
+    Args:
+        socket   (SocketPM, required): Socket config model.
+        encoding (str     , required): Message encoding.
+
+    Returns:
+        SocketSink: Socket sink object with its own sender thread.
+    """
+
+    from .transports import SocketSink
+
+    return SocketSink(encoding=encoding, **socket.model_dump())
+
+
+def _make_http_sink(http: HttpPM, encoding: str) -> "HttpSink":
+    """Make HTTP sink from HTTP config.
+
+    Args:
+        http     (HttpPM, required): HTTP config model.
+        encoding (str   , required): Message encoding.
+
+    Returns:
+        HttpSink: HTTP sink object with its own sender thread.
+    """
+
+    from .transports import HttpSink
+
+    return HttpSink(encoding=encoding, **http.model_dump())
+
+
+def _make_syslog_sink(syslog: SyslogPM, config: LoggerConfigPM) -> "SyslogSink":
+    """Make syslog sink from syslog config, with app name and global extra keys from main config.
+
+    Args:
+        syslog (SyslogPM      , required): Syslog config model.
+        config (LoggerConfigPM, required): Main config model.
+
+    Returns:
+        SyslogSink: Syslog sink object with its own sender thread.
+    """
+
+    from .transports import SyslogSink
+
+    return SyslogSink(
+        app_name=config.app_name,
+        sd_keys=list(config.global_extra),
+        encoding=config.file.encoding,
+        **syslog.model_dump(),
+    )
+
+
+def _wrap_queue(
+    handler_dict: dict[str, Any], queue: QueuePM, config: LoggerConfigPM
+) -> dict[str, Any]:
+    """Wrap file path sink with queue sink, file sink is created only in the queue writer process.
+
+    Args:
+        handler_dict (dict[str, Any] , required): Loguru handler config as dictionary.
+        queue        (QueuePM        , required): Queue config model.
+        config       (LoggerConfigPM , required): Main config model.
+
+    Raises:
+        ValueError: If 'sink' is not a file path.
+
+    Returns:
+        dict[str, Any]: Loguru handler config as dictionary with queue sink.
+    """
+
+    _sink = handler_dict["sink"]
+    if not isinstance(_sink, (str, os.PathLike)):
+        raise ValueError(
+            f"'sink' attribute type {type(_sink).__name__} is invalid, queue handler requires file path 'sink'!"
+        )
+
+    from .queues import QueueSink, get_default_queue_path
+
+    _file_kwargs = {
+        _attr: handler_dict.pop(_attr)
+        for _attr in FILE_SINK_ATTRS
+        if _attr in handler_dict
+    }
+    _path = os.path.abspath(_sink)
+    _queue_path = queue.path or get_default_queue_path(
+        logs_dir=config.file.logs_dir, app_name=config.app_name
+    )
+    handler_dict["sink"] = QueueSink(
+        path=_queue_path,
+        # Target file path is the channel, so same file is written by one target in the writer process:
+        channel=_path,
+        target_factory=functools.partial(make_file_sink, _path, **_file_kwargs),
+        **queue.model_dump(exclude={"path"}),
+    )
+    handler_dict.setdefault("colorize", False)
+    return handler_dict
+
+
+def _wrap_file(
+    handler_dict: dict[str, Any],
+    shared: bool = False,
+    binary: bool = False,
+    app_name: str | None = None,
+) -> dict[str, Any]:
+    """Replace file path sink with shared (coordinated rotation between multiple processes) and/or binary file sink.
+
+    Args:
+        handler_dict (dict[str, Any], required): Loguru handler config as dictionary.
+        shared       (bool          , optional): Use shared file sink. Default is False.
+        binary       (bool          , optional): Use binary file sink. Default is False.
+        app_name     (str | None    , optional): Application name to write into binary file header.
+                                                    Default is None.
+
+    Returns:
+        dict[str, Any]: Loguru handler config as dictionary with file sink object.
+    """
+
+    _sink = handler_dict["sink"]
+    if not isinstance(_sink, (str, os.PathLike)):
+        return handler_dict
+
+    _file_kwargs = {
+        _attr: handler_dict.pop(_attr)
+        for _attr in FILE_SINK_ATTRS
+        if _attr in handler_dict
+    }
+    if binary:
+        _file_kwargs["app_name"] = app_name
+
+    handler_dict["sink"] = make_file_sink(
+        _sink, shared=shared, binary=binary, **_file_kwargs
+    )
+    handler_dict.setdefault("colorize", False)
+    return handler_dict
+
+
+def _wrap_ring_buffer(
+    handler_dict: dict[str, Any], ring_buffer: RingBufferPM
+) -> dict[str, Any]:
+    """Wrap handler sink with ring buffer sink, file path sink is opened as loguru file sink first.
+
+    Args:
+        handler_dict (dict[str, Any], required): Loguru handler config as dictionary.
+        ring_buffer  (RingBufferPM  , required): Ring buffer config model.
+
+    Returns:
+        dict[str, Any]: Loguru handler config as dictionary with ring buffer sink.
+    """
+
+    _sink = handler_dict["sink"]
+    if isinstance(_sink, (str, os.PathLike)):
+        _file_kwargs = {
+            _attr: handler_dict.pop(_attr)
+            for _attr in FILE_SINK_ATTRS
+            if _attr in handler_dict
+        }
+        _sink = make_file_sink(_sink, **_file_kwargs)
+        handler_dict.setdefault("colorize", False)
+
+    handler_dict["sink"] = RingBufferSink(
+        sink=_sink,
+        capacity=ring_buffer.capacity,
+        policy=ring_buffer.policy,
+        drop_level_no=_get_level_no(ring_buffer.drop_level),
+    )
+    handler_dict["enqueue"] = False
+    return handler_dict
+
+
+def _wrap_metrics(
+    handler_dict: dict[str, Any], metrics: "HandlerMetrics"
+) -> dict[str, Any]:
+    """Wrap handler filter, rotation and sink to collect handler metrics, file path sink is opened first.
+
+    Args:
+        handler_dict (dict[str, Any] , required): Loguru handler config as dictionary.
+        metrics      (HandlerMetrics, required): Handler metrics to collect into.
+
+    Returns:
+        dict[str, Any]: Loguru handler config as dictionary with metrics filter and sink.
+    """
+
+    _filter = handler_dict.get("filter")
+    if (_filter is None) or callable(_filter):
+        handler_dict["filter"] = metrics.wrap_filter(_filter)
+
+    _rotation = handler_dict.get("rotation")
+    if callable(_rotation):
+        handler_dict["rotation"] = metrics.wrap_rotation(_rotation)
+
+    handler_dict = _wrap_file(handler_dict=handler_dict)
+    if is_wrappable_sink(handler_dict["sink"]):
+        # Logging handler sinks are written by loguru itself, only their filter is counted:
+        handler_dict["sink"] = metrics.wrap_sink(handler_dict["sink"]).as_sink()
+
+    return handler_dict
+
+
+def _wrap_profiler(
+    handler_dict: dict[str, Any], profiler: "Profiler", name: str, sync: bool
+) -> dict[str, Any]:
+    """Wrap handler filter, dynamic format and sink to profile sampled records, file path sink is opened first.
+
+    Args:
+        handler_dict (dict[str, Any], required): Loguru handler config as dictionary.
+        profiler     (Profiler      , required): Profiler to add measured times into.
+        name         (str           , required): Handler name.
+        sync         (bool          , required): Whether sink is written by the logging thread.
+
+    Returns:
+        dict[str, Any]: Loguru handler config as dictionary with profiling filter and sink.
+    """
+
+    _filter = handler_dict.get("filter")
+    if (_filter is not None) and (not callable(_filter)):
+        # Sampling is decided by the filter, string and dict filters are not profiled:
+        return handler_dict
+
+    handler_dict = _wrap_file(handler_dict=handler_dict)
+    _profiler_sink: "ProfilerSink | None" = None
+    if is_wrappable_sink(handler_dict["sink"]):
+        _profiler_sink = profiler.wrap_sink(handler_dict["sink"], handler=name)
+        # Coroutine sinks are written later by event loop tasks:
+        sync = sync and (not _profiler_sink.async_)
+    else:
+        # Logging handler sinks are written by loguru itself, only filter and format are profiled:
+        sync = False
+
+    _profiler_filter = profiler.wrap_filter(_filter, handler=name, sync=sync)
+    handler_dict["filter"] = _profiler_filter
+
+    _format = handler_dict.get("format")
+    if (not sync) and callable(_format):
+        handler_dict["format"] = profiler.wrap_format(_format, handler=name)
+
+    if _profiler_sink is not None:
+        if sync:
+            _profiler_sink.filter_key = _profiler_filter.record_key
+
+        handler_dict["sink"] = _profiler_sink.as_sink()
+
+    return handler_dict
+
+
+@validate_call(config={"arbitrary_types_allowed": True})
+def build_handler(
+    handler: LogHandlerPM,
+    config: LoggerConfigPM,
+    name: str | None = None,
+    metrics: Any = None,
+    profiler: Any = None,
+) -> dict[str, Any]:
+    """Build handler config as dictionary for Loguru logger to add new handler.
+
+    Args:
+        handler  (LogHandlerPM         , required): Target log handler model.
+        config   (LoggerConfigPM       , required): Default main config model to fill missing values.
+        name     (str | None           , optional): Handler name, used for 'disable_{name}' extra key.
+                                                     Default is None.
+        metrics  (HandlerMetrics | None, optional): Handler metrics to collect into. Default is None.
+        profiler (Profiler | None      , optional): Profiler to profile sampled records of handler.
+                                                     Default is None.
 
     Raises:
         ValueError: 'sink' attribute is empty, required for any log handler except std and file handlers!
@@ -36,11 +437,34 @@ def build_handler(handler: LogHandlerPM, config: LoggerConfigPM) -> dict[str, An
     """
 
     if handler.sink is None:
-        if handler.type_ == LogHandlerTypeEnum.STD:
-            handler.sink = std_sink
+        if handler.type_ == LogHandlerTypeEnum.MEMORY:
+            handler.sink = "{app_name}.dump.log"
+        elif (handler.type_ == LogHandlerTypeEnum.SOCKET) and (
+            handler.socket is not None
+        ):
+            handler.sink = _make_socket_sink(
+                socket=handler.socket, encoding=config.file.encoding
+            )
+        elif (handler.type_ == LogHandlerTypeEnum.HTTP) and (handler.http is not None):
+            handler.sink = _make_http_sink(
+                http=handler.http, encoding=config.file.encoding
+            )
+        elif handler.type_ == LogHandlerTypeEnum.SYSLOG:
+            handler.sink = _make_syslog_sink(
+                syslog=handler.syslog or SyslogPM(), config=config
+            )
+        elif handler.type_ == LogHandlerTypeEnum.STD:
+            if handler.buffer is not None:
+                handler.sink = BufferedStdSink(
+                    buffer_size=handler.buffer.size,
+                    flush_interval=handler.buffer.interval,
+                )
+            else:
+                handler.sink = std_sink
         else:
             raise ValueError(
-                "'sink' attribute is empty, required for any log handler except std handler!"
+                "'sink' attribute is empty, required for any log handler except std, memory and syslog handlers "
+                "(and socket or http handlers with 'socket' or 'http' attribute)!"
             )
 
     _sink = handler.sink
@@ -62,32 +486,65 @@ def build_handler(handler: LogHandlerPM, config: LoggerConfigPM) -> dict[str, An
         else:
             handler.level = config.level.base
 
+    if (
+        (handler.type_ == LogHandlerTypeEnum.HTTP)
+        and (handler.format_ is None)
+        and (handler.serialize is None)
+        and (handler.custom_serialize is None)
+    ):
+        # HTTP batches are JSON lines by default:
+        handler.custom_serialize = True
+
+    if handler.binary:
+        # Records are encoded by the binary file sink, formatted messages are not used:
+        from .binary import binary_format
+
+        handler.format_ = binary_format
+
     if (handler.custom_serialize is None) and handler.serialize:
         handler.custom_serialize = config.custom_serialize
 
     if handler.custom_serialize:
         handler.serialize = False
-        handler.format_ = json_format
+        handler.format_ = get_json_formatter(backend=config.json_backend)
 
     if (handler.format_ is None) and (not handler.serialize):
-        handler.format_ = config.default_format
+        if handler.type_ == LogHandlerTypeEnum.SYSLOG:
+            # Time and level are already in syslog header:
+            handler.format_ = "{name}:{line}: {message}"
+        else:
+            handler.format_ = config.default_format
+
+    if isinstance(handler.format_, str):
+        _text_formatter = get_text_formatter(handler.format_)
+        if _text_formatter.cached:
+            # Time and level parts are rendered once per second and level, instead of every record:
+            handler.format_ = _text_formatter
 
+    _sampler = _get_sampler(handler=handler, config=config, name=name)
     if handler.filter_ is None:
-        if handler.type_ == LogHandlerTypeEnum.STD:
-            handler.filter_ = std_filter
-        elif handler.type_ == LogHandlerTypeEnum.FILE:
-            if handler.serialize or handler.custom_serialize:
-                if handler.error:
-                    handler.filter_ = err_json_filter
-                else:
-                    handler.filter_ = json_filter
-            else:
-                if handler.error:
-                    handler.filter_ = err_file_filter
-                else:
-                    handler.filter_ = file_filter
-        else:
-            handler.filter_ = all_handlers_filter
+        handler.filter_ = build_filter(
+            *_get_filter_names(handler=handler, name=name),
+            sampler=_sampler,
+            context=config.context.enabled,
+        )
+    elif (_sampler is not None) and callable(handler.filter_):
+        handler.filter_ = apply_sampler(filter_=handler.filter_, sampler=_sampler)
+
+    _dedup = None
+    if (
+        (handler.dedup is not None)
+        and handler.dedup.enabled
+        and (handler.filter_ is not None)
+        and callable(handler.filter_)
+    ):
+        from .deduplicators import Deduplicator
+
+        # Each handler has its own deduplicator, summary records are written only by the same handler's sink:
+        _dedup = Deduplicator(
+            window=handler.dedup.window, filter_=handler.filter_, name=name
+        )
+        handler.filter_ = _dedup
 
     if handler.backtrace is None:
         handler.backtrace = True
@@ -99,16 +556,46 @@ def build_handler(handler: LogHandlerPM, config: LoggerConfigPM) -> dict[str, An
     else:
         handler.diagnose = False
 
-    if handler.type_ == LogHandlerTypeEnum.FILE:
-        if handler.enqueue is None:
+    if handler.type_ in (LogHandlerTypeEnum.FILE, LogHandlerTypeEnum.QUEUE):
+        if (
+            (handler.type_ == LogHandlerTypeEnum.FILE)
+            and (handler.enqueue is None)
+            and (handler.ring_buffer is None)
+        ):
             handler.enqueue = True
 
         if handler.rotation is None:
             handler.rotation = Rotator(
                 rotate_size=config.file.rotate_size,
                 rotate_time=config.file.rotate_time,
+                rotate_interval=config.file.rotate_interval,
+                # Shared files also grow by other processes' messages:
+                sync_interval=1.0 if config.file.rotate_shared else None,
             ).should_rotate
 
+        if (handler.compression is None) and (config.file.compression is not None):
+            _compressor = get_compressor(
+                format_=config.file.compression,
+                level=config.file.compression_level,
+                workers=config.file.compression_workers,
+            )
+            handler.compression = _compressor.compress
+            if handler.retention is None:
+                handler.retention = _compressor.make_retention(config.file.retention)
+
+        if (
+            (handler.type_ == LogHandlerTypeEnum.FILE)
+            and (handler.serialize or handler.custom_serialize)
+            and (config.file.index_every is not None)
+            and ((handler.compression is None) or callable(handler.compression))
+        ):
+            from .queries import make_rotation_indexer
+
+            # Rotated json files are indexed (before compression) for time range queries:
+            handler.compression = make_rotation_indexer(
+                every=config.file.index_every, compression=handler.compression
+            )
+
         if handler.retention is None:
             handler.retention = config.file.retention
 
@@ -123,9 +610,71 @@ def build_handler(handler: LogHandlerPM, config: LoggerConfigPM) -> dict[str, An
             "type_",
             "error",
             "custom_serialize",
+            "binary",
+            "buffer",
+            "ring_buffer",
+            "sampling",
+            "dedup",
+            "memory",
+            "socket",
+            "http",
+            "syslog",
+            "queue",
         },
     )
 
+    if handler.type_ == LogHandlerTypeEnum.MEMORY:
+        _handler_dict = _wrap_memory(
+            handler_dict=_handler_dict,
+            memory=handler.memory or MemoryPM(),
+            encoding=handler.encoding or config.file.encoding,
+        )
+
+    if handler.type_ == LogHandlerTypeEnum.QUEUE:
+        _handler_dict = _wrap_queue(
+            handler_dict=_handler_dict,
+            queue=handler.queue or QueuePM(),
+            config=config,
+        )
+
+    if (handler.type_ == LogHandlerTypeEnum.FILE) and (
+        config.file.rotate_shared or handler.binary
+    ):
+        _handler_dict = _wrap_file(
+            handler_dict=_handler_dict,
+            shared=config.file.rotate_shared,
+            binary=bool(handler.binary),
+            app_name=config.app_name,
+        )
+
+    if _dedup is not None:
+        _handler_dict = _wrap_file(handler_dict=_handler_dict)
+        _handler_dict["sink"] = _dedup.wrap_sink(
+            _handler_dict["sink"],
+            format_=_handler_dict.get("format"),
+            serialize=bool(_handler_dict.get("serialize")),
+        )
+
+    if metrics is not None:
+        # Innermost sink is measured, so write latency is the real write (not ring buffer put):
+        _handler_dict = _wrap_metrics(handler_dict=_handler_dict, metrics=metrics)
+
+    if profiler is not None:
+        _handler_dict = _wrap_profiler(
+            handler_dict=_handler_dict,
+            profiler=profiler,
+            name=name or repr(handler.sink),
+            # Enqueued and ring buffered sinks are written by writer thread:
+            sync=(not _handler_dict.get("enqueue")) and (handler.ring_buffer is None),
+        )
+
+    if handler.ring_buffer is not None:
+        _handler_dict = _wrap_ring_buffer(
+            handler_dict=_handler_dict, ring_buffer=handler.ring_buffer
+        )
+        if metrics is not None:
+            metrics.sink = _handler_dict["sink"]
+
     return _handler_dict
 
 
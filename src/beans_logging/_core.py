@@ -1,7 +1,9 @@
 # Standard libraries
 import os
 import copy
+import time
 import uuid
+import threading
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
@@ -17,18 +19,38 @@ from pydantic import validate_call
 from potato_util import io as io_utils
 
 # Internal modules
-from .constants import DEFAULT_LOGURU_HANDLER_NAME, DEFAULT_NO_HANDLER_NAME_PREFIX
+from .constants import (
+    DEFAULT_LOGURU_HANDLER_NAME,
+    DEFAULT_NO_HANDLER_NAME_PREFIX,
+    ReportFormatEnum,
+)
 from .schemas import LogHandlerPM, LoguruHandlerPM
 from .config import LoggerConfigPM
+from .caches import ConfigCache, get_default_cache_dir
 from ._builder import build_handler
+from .contexts import ContextFields, set_context_fields
 from .intercepters import add_intercepter
+from .sinks import MemorySink, unwrap_sink
+from .deduplicators import Deduplicator
+from .metrics import (
+    HandlerMetrics,
+    MetricsFilter,
+    MetricsExporter,
+    format_prometheus,
+)
+from .profilers import Profiler, ProfilerFilter
+from .watchers import ConfigWatcher
 
 
 class LoggerLoader:
     """LoggerLoader class for setting up loguru logger.
 
     Attributes:
-        _CONFIG_PATH (str): Default config file path. Default is '${PWD}/configs/logger.yml'.
+        _CONFIG_PATH      (str       ): Default config file path. Default is '${PWD}/configs/logger.yml'.
+        _CONFIG_CACHE_DIR (str | None): Validated config snapshots directory, None to disable caching.
+                                            Default is '${BEANS_LOGGING_CACHE_DIR}' or None (disabled).
+        _HANDOFF_DELAY    (float     ): Seconds to keep replaced handler on reload, so logging calls which already
+                                            took the old handler list finish writing into it. Default is 0.05.
 
         handlers_map (dict[str, int]): Map of handler names to their IDs. Default is {'default.loguru_handler': 0}.
         config       (LoggerConfigPM): Main logger configuration model. Default is LoggerConfigPM().
@@ -36,13 +58,26 @@ class LoggerLoader:
 
     Methods:
         load()             : Load logger handlers based on logger config.
+        reload()           : Reload logger config and apply only changed handlers.
+        watch_config()     : Watch config file and reload changed handlers when it is changed.
+        unwatch_config()   : Stop watching config file.
         _load_config_file(): Load logger config from file.
         update_config()    : Update current logger config with new config values.
+        _merge_config()    : Merge new config values into current logger config.
         remove_handler()   : Remove handler from logger.
         add_handler()      : Add handler to logger.
+        get_handler_sink() : Get sink object of added handler.
+        dump_memory()      : Dump recorded messages of memory (flight recorder) handlers.
+        stats()            : Get runtime metrics of handlers.
+        export_metrics()   : Get runtime metrics of handlers in Prometheus text format.
+        start_profiling()  : Start sampled profiling of time spent in handlers.
+        stop_profiling()   : Stop profiling, collected profile is kept for report.
+        profile_report()   : Get top call-sites and handlers by profiled time as table or JSON.
     """
 
     _CONFIG_PATH = os.path.join(os.getcwd(), "configs", "logger.yml")
+    _CONFIG_CACHE_DIR = get_default_cache_dir()
+    _HANDOFF_DELAY = 0.05
 
     @validate_call
     def __init__(
@@ -54,14 +89,37 @@ class LoggerLoader:
     ) -> None:
 
         self.handlers_map = {DEFAULT_LOGURU_HANDLER_NAME: 0}
+        self._sinks_map: dict[str, Any] = {}
+        self._dedups_map: dict[str, Deduplicator] = {}
+        self._metrics_map: dict[str, HandlerMetrics] = {}
+        self._metrics_exporter: MetricsExporter | None = None
+        self._metrics_exporter_config: dict[str, Any] | None = None
+        # Profiling wrappers are installed once into handlers, profiling only toggles the flag:
+        self._profiler = Profiler(enabled=False)
+        # Serializes config watcher reloads with manual reload, config update and profiling:
+        self._reload_lock = threading.RLock()
         if not config:
-            config = LoggerConfigPM()
+            config = {}
+
+        if isinstance(config, dict):
+            # Validate raw config only once, together with keyword arguments:
+            if kwargs:
+                config = utils.deep_merge(config, kwargs)
+                kwargs = {}
+
+            # Freshly validated model, no need to copy it in setter:
+            self.__config = LoggerConfigPM(**config)
+        else:
+            self.config = config
 
-        self.config = config
         if kwargs:
-            self.update_config(config=kwargs)
+            self._merge_config(config=kwargs)
 
         self.config_path = config_path
+        # Config before loading config file, so reload starts from it (removed file keys are reverted):
+        self._base_config = self.config.model_copy(deep=True)
+        self._handler_fingerprints: dict[str, Any] = {}
+        self._config_watcher: ConfigWatcher | None = None
 
         if auto_load:
             self.load(load_config_file=True)
@@ -78,37 +136,301 @@ class LoggerLoader:
             Logger: Main loguru logger instance.
         """
 
-        self.remove_handler()
-        if load_config_file:
-            self._load_config_file()
+        with self._reload_lock:
+            self.remove_handler()
+            if load_config_file:
+                self._load_config_file()
+
+            self._configure_context()
+            for _key, _handler in self.config.handlers.items():
+                if self.add_handler(name=_key, handler=_handler) is not None:
+                    self._handler_fingerprints[_key] = self._get_handler_fingerprint(
+                        _handler
+                    )
+
+            add_intercepter(config=self.config)
+            self._start_metrics_exporter()
+
+        return logger
+
+    def _configure_context(self) -> None:
+        """Configure global extra of logger and default context fields of middlewares, if context is enabled.
+
+        Patcher of logger is not touched, records are enriched by handler filters.
+        """
+
+        if self.config.context.enabled:
+            set_context_fields(
+                ContextFields(
+                    fields=self.config.context.fields,
+                    id_field=self.config.context.id_field,
+                )
+            )
 
         logger.configure(extra=self.config.global_extra)
-        for _key, _handler in self.config.handlers.items():
-            self.add_handler(name=_key, handler=_handler)
+        return
+
+    def _get_handler_fingerprint(self, handler: LogHandlerPM) -> Any:
+        """Get fingerprint of handler with current config, to detect changed handlers on reload.
+
+        Args:
+            handler (LogHandlerPM, required): Handler model from config.
+
+        Returns:
+            Any: Handler fingerprint, comparable with '=='.
+        """
+
+        # Handlers are built from handler and config values (except these, only global extra keys are used by
+        # syslog handlers), so any change requires rebuild:
+        return (
+            self.config.model_dump(
+                exclude={"handlers", "global_extra", "intercept", "context", "metrics"}
+            ),
+            sorted(self.config.global_extra),
+            self.config.context.enabled,
+            self.config.metrics.enabled,
+            handler.model_dump(),
+        )
+
+    @validate_call
+    def reload(
+        self,
+        config: LoggerConfigPM | dict[str, Any] | None = None,
+        load_config_file: bool = True,
+    ) -> "Logger":
+        """Reload logger config and apply only changed handlers, without touching unchanged handlers.
+
+        Changed handler is added before the old one is removed (after `_HANDOFF_DELAY`), so records logged in between
+        are not lost (they may be written by both). If any handler fails to be added, added handlers are removed, and previous handlers and
+        config are kept. Handlers which are not from config (added by `add_handler()` directly) are kept.
+
+        Args:
+            config           (LoggerConfigPM | dict | None, optional): New config to use instead of base config.
+                                                                            Default is None.
+            load_config_file (bool                        , optional): Whether to load config file on top of
+                                                                            base config. Default is True.
+
+        Returns:
+            Logger: Main loguru logger instance.
+        """
+
+        with self._reload_lock:
+            _old_config = self.config
+            _old_fingerprints = dict(self._handler_fingerprints)
+            try:
+                self.config = config if config is not None else self._base_config
+                if (config is None) and load_config_file:
+                    self._load_config_file()
+            except Exception:
+                self.__config = _old_config
+                raise
+
+            _fingerprints: dict[str, Any] = {}
+            # Changed handlers with their detached old handler (None for new handlers):
+            _changed: list[tuple[str, tuple | None]] = []
+            try:
+                self._configure_context()
+                for _name, _handler in self.config.handlers.items():
+                    if not _handler.enabled:
+                        continue
+
+                    _fingerprint = self._get_handler_fingerprint(_handler)
+                    if (_name in self.handlers_map) and (
+                        self._handler_fingerprints.get(_name) == _fingerprint
+                    ):
+                        _fingerprints[_name] = _fingerprint
+                        continue
+
+                    _old_handler = None
+                    if _name in self.handlers_map:
+                        _old_handler = self._detach_handler(_name)
+
+                    _changed.append((_name, _old_handler))
+                    if self.add_handler(name=_name, handler=_handler) is not None:
+                        _fingerprints[_name] = _fingerprint
+            except Exception:
+                for _name, _old_handler in reversed(_changed):
+                    if _name in self.handlers_map:
+                        self.remove_handler(_name)
+
+                    if _old_handler is not None:
+                        self._attach_handler(_name, _old_handler)
+
+                self.__config = _old_config
+                self._handler_fingerprints = _old_fingerprints
+                self._configure_context()
+                raise
+
+            if any(_old_handler is not None for _, _old_handler in _changed):
+                # Loguru logging calls iterate a snapshot of handlers, old handler drops records after it is stopped:
+                time.sleep(LoggerLoader._HANDOFF_DELAY)
+
+            for _name, _old_handler in _changed:
+                if _old_handler is not None:
+                    # Pending dedup summary is flushed into the old handler before it is removed:
+                    self._remove_detached_handler(_old_handler)
+
+            for _name in list(self._handler_fingerprints):
+                if (_name not in _fingerprints) and (_name in self.handlers_map):
+                    self.remove_handler(_name)
+
+            self._handler_fingerprints = _fingerprints
+            add_intercepter(config=self.config)
+            self._start_metrics_exporter()
 
-        add_intercepter(config=self.config)
         return logger
 
+    def _detach_handler(self, name: str) -> tuple:
+        """Detach handler from maps, so new handler with the same name can be added before it is removed.
+
+        Args:
+            name (str, required): Handler name.
+
+        Returns:
+            tuple: Detached handler ID, sink, metrics and deduplicator.
+        """
+
+        return (
+            self.handlers_map.pop(name),
+            self._sinks_map.pop(name, None),
+            self._metrics_map.pop(name, None),
+            self._dedups_map.pop(name, None),
+        )
+
+    def _attach_handler(self, name: str, detached: tuple) -> None:
+        """Attach detached handler back into maps.
+
+        Args:
+            name     (str  , required): Handler name.
+            detached (tuple, required): Detached handler from `_detach_handler()`.
+        """
+
+        _handler_id, _sink, _metrics, _dedup = detached
+        self.handlers_map[name] = _handler_id
+        if _sink is not None:
+            self._sinks_map[name] = _sink
+
+        if _metrics is not None:
+            self._metrics_map[name] = _metrics
+
+        if _dedup is not None:
+            self._dedups_map[name] = _dedup
+
+        return
+
+    def _remove_detached_handler(self, detached: tuple) -> None:
+        """Remove detached handler from logger.
+
+        Args:
+            detached (tuple, required): Detached handler from `_detach_handler()`.
+        """
+
+        _handler_id, _, _, _dedup = detached
+        if _dedup is not None:
+            _dedup.stop()
+
+        logger.remove(_handler_id)
+        return
+
+    def watch_config(self, interval: float = 1.0) -> None:
+        """Watch config file and reload changed handlers when it is changed.
+
+        Args:
+            interval (float, optional): Polling interval (seconds) when inotify is not available. Default is 1.0.
+        """
+
+        self.unwatch_config()
+        self._config_watcher = ConfigWatcher(
+            path=self.config_path, callback=self._on_config_change, interval=interval
+        )
+        self._config_watcher.start()
+        return
+
+    def unwatch_config(self) -> None:
+        """Stop watching config file."""
+
+        if self._config_watcher is not None:
+            self._config_watcher.stop()
+            self._config_watcher = None
+
+        return
+
+    def _on_config_change(self) -> None:
+        try:
+            self.reload()
+            logger.debug(f"Reloaded logger config from '{self.config_path}' file.")
+        except Exception:
+            logger.exception(
+                f"Failed to reload logger config from '{self.config_path}' file, keeping current config!"
+            )
+
+        return
+
     def _load_config_file(self) -> None:
-        """Load logger config from file."""
+        """Load logger config from file.
+        Validated config is cached as snapshot, so unchanged config file skips parsing and validation.
+        """
 
         if self.config_path and os.path.isfile(self.config_path):
+            _config_cache: ConfigCache | None = None
+            _cache_key: dict[str, Any] | None = None
+            if LoggerLoader._CONFIG_CACHE_DIR:
+                _config_cache = ConfigCache(cache_dir=LoggerLoader._CONFIG_CACHE_DIR)
+                _cache_key = _config_cache.get_key(
+                    config_path=self.config_path, base_config=self.config
+                )
+                if _cache_key:
+                    _config = _config_cache.load(key=_cache_key)
+                    if _config is not None:
+                        self.config = _config
+                        return
+
             _config_data = io_utils.read_config_file(config_path=self.config_path)
             if _config_data and ("logger" in _config_data):
                 _config_data = _config_data.get("logger", {})
                 if _config_data:
-                    self.update_config(config=_config_data)
+                    _base_config = self.config
+                    self._merge_config(config=_config_data)
+
+                    # Skip saving if config file is changed while parsing:
+                    if (
+                        _config_cache
+                        and _cache_key
+                        and (
+                            _config_cache.get_key(
+                                config_path=self.config_path, base_config=_base_config
+                            )
+                            == _cache_key
+                        )
+                    ):
+                        _config_cache.save(key=_cache_key, config=self.config)
 
         return
 
     @validate_call
     def update_config(self, config: dict[str, Any]) -> None:
         """Update current logger config with new config values.
+        Base config is updated too, so values are kept when config file is reloaded.
 
         Args:
             config (dict[str, Any], required): New config values to update current logger config.
         """
 
+        with self._reload_lock:
+            self._merge_config(config=config)
+            self._base_config = LoggerConfigPM(
+                **utils.deep_merge(self._base_config.model_dump(), config)
+            )
+
+        return
+
+    def _merge_config(self, config: dict[str, Any]) -> None:
+        """Merge new config values into current logger config.
+
+        Args:
+            config (dict[str, Any], required): New config values to merge into current logger config.
+        """
+
         _config_dict = self.config.model_dump()
         _merged_dict = utils.deep_merge(_config_dict, config)
         try:
@@ -137,8 +459,12 @@ class LoggerLoader:
             if isinstance(handler, str):
                 if handler in self.handlers_map:
                     _handler_id = self.handlers_map.get(handler)
+                    self._stop_dedup(handler)
                     logger.remove(_handler_id)
                     self.handlers_map.pop(handler)
+                    self._sinks_map.pop(handler, None)
+                    self._metrics_map.pop(handler, None)
+                    self._handler_fingerprints.pop(handler, None)
                 else:
                     raise ValueError(
                         f"Not found handler name '{handler}' in handlers map!"
@@ -146,18 +472,28 @@ class LoggerLoader:
 
             elif isinstance(handler, int):
                 if handler in self.handlers_map.values():
-                    logger.remove(handler)
                     for _handler_name, _handler_id in list(self.handlers_map.items()):
                         if handler == _handler_id:
+                            self._stop_dedup(_handler_name)
+                            logger.remove(handler)
                             self.handlers_map.pop(_handler_name)
+                            self._sinks_map.pop(_handler_name, None)
+                            self._metrics_map.pop(_handler_name, None)
+                            self._handler_fingerprints.pop(_handler_name, None)
                             break
                 else:
                     raise ValueError(
                         f"Not found handler ID '{handler}' in handlers map!"
                     )
         else:
+            for _handler_name in list(self._dedups_map):
+                self._stop_dedup(_handler_name)
+
             logger.remove()
             self.handlers_map.clear()
+            self._sinks_map.clear()
+            self._metrics_map.clear()
+            self._handler_fingerprints.clear()
 
         return
 
@@ -188,7 +524,21 @@ class LoggerLoader:
                 )
 
             if handler.enabled:
-                _handler_dict = build_handler(handler=handler, config=self.config)
+                if not name:
+                    name = f"{DEFAULT_NO_HANDLER_NAME_PREFIX}{uuid.uuid4().hex}"
+
+                _metrics: HandlerMetrics | None = None
+                if self.config.metrics.enabled:
+                    _metrics = HandlerMetrics(name=name)
+
+                # Build from a copy, so stateful defaults (sinks, rotators) are re-created on every load:
+                _handler_dict = build_handler(
+                    handler=handler.model_copy(),
+                    config=self.config,
+                    name=name,
+                    metrics=_metrics,
+                    profiler=self._profiler,
+                )
                 _sink = _handler_dict.get("sink")
                 if isinstance(_sink, (str, Path)):
                     _logs_dir = os.path.dirname(_sink)
@@ -196,10 +546,24 @@ class LoggerLoader:
                         io_utils.create_dir(create_dir=_logs_dir)
 
                 _handler_id = logger.add(**_handler_dict)
-                if not name:
-                    name = f"{DEFAULT_NO_HANDLER_NAME_PREFIX}{uuid.uuid4().hex}"
-
                 self.handlers_map[name] = _handler_id
+                _sink = unwrap_sink(_sink)
+                self._sinks_map[name] = _sink
+                _filter = _handler_dict.get("filter")
+                while isinstance(_filter, (ProfilerFilter, MetricsFilter)):
+                    _filter = _filter.filter_
+
+                if isinstance(_sink, MemorySink):
+                    # Memory sink records by its own filter method, which wraps the handler filter:
+                    _filter = _sink.filter_
+
+                if isinstance(_filter, Deduplicator):
+                    self._dedups_map[name] = _filter
+
+                if _metrics is not None:
+                    self._metrics_map[name] = _metrics
+                else:
+                    self._metrics_map.pop(name, None)
 
         except Exception:
             logger.critical("Failed to add custom log handler to logger!")
@@ -207,6 +571,161 @@ class LoggerLoader:
 
         return _handler_id
 
+    def _stop_dedup(self, name: str) -> None:
+        """Stop deduplicator of handler and flush its pending summary, before the handler is removed.
+
+        Args:
+            name (str, required): Handler name.
+        """
+
+        _dedup = self._dedups_map.pop(name, None)
+        if _dedup is not None:
+            _dedup.stop()
+
+        return
+
+    def get_handler_sink(self, name: str) -> Any:
+        """Get sink object of added handler, e.g. to read `stats` of ring buffer sink.
+
+        Args:
+            name (str, required): Handler name.
+
+        Raises:
+            ValueError: If handler name is not found in handlers map.
+
+        Returns:
+            Any: Sink object (or file path) of the handler.
+        """
+
+        if name not in self._sinks_map:
+            raise ValueError(f"Not found handler name '{name}' in handlers map!")
+
+        return self._sinks_map[name]
+
+    def dump_memory(self, name: str | None = None) -> int:
+        """Dump recorded messages of memory (flight recorder) handlers on demand.
+
+        Args:
+            name (str | None, optional): Memory handler name. Default is None, which dumps all memory handlers.
+
+        Raises:
+            ValueError: If handler name is not found in handlers map or it is not a memory handler.
+
+        Returns:
+            int: Number of dumped messages.
+        """
+
+        if name:
+            _sink = self.get_handler_sink(name)
+            if not isinstance(_sink, MemorySink):
+                raise ValueError(f"Handler '{name}' is not a memory handler!")
+
+            return _sink.dump()
+
+        _count = 0
+        for _sink in list(self._sinks_map.values()):
+            if isinstance(_sink, MemorySink):
+                _count += _sink.dump()
+
+        return _count
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get runtime metrics of handlers (when 'metrics.enabled' config is True).
+
+        Returns:
+            dict[str, dict[str, Any]]: Map of handler names to their counters: accepted and filtered records,
+                                        written records and bytes, rotations, queue depth, dropped records and
+                                        write latency histogram (seconds).
+        """
+
+        return {_name: _metrics.stats for _name, _metrics in self._metrics_map.items()}
+
+    def export_metrics(self) -> str:
+        """Get runtime metrics of handlers in Prometheus text format.
+
+        Returns:
+            str: Metrics in Prometheus text format.
+        """
+
+        return format_prometheus(stats=self.stats(), app_name=self.config.app_name)
+
+    def _start_metrics_exporter(self) -> None:
+        """Start (or restart when changed) periodic metrics exporter based on 'metrics' config."""
+
+        _metrics_config = self.config.metrics
+        _exporter_config = _metrics_config.model_dump()
+        if (self._metrics_exporter is not None) and (
+            self._metrics_exporter_config == _exporter_config
+        ):
+            return
+
+        if self._metrics_exporter is not None:
+            self._metrics_exporter.stop()
+            self._metrics_exporter = None
+
+        self._metrics_exporter_config = _exporter_config
+        if (not _metrics_config.enabled) or (
+            (not _metrics_config.export_path) and (_metrics_config.http_port is None)
+        ):
+            return
+
+        self._metrics_exporter = MetricsExporter(
+            collect=self.export_metrics,
+            path=_metrics_config.export_path,
+            interval=_metrics_config.export_interval,
+            host=_metrics_config.http_host,
+            port=_metrics_config.http_port,
+        )
+        self._metrics_exporter.start()
+        return
+
+    @validate_call
+    def start_profiling(self, sample_rate: int = 100, reset: bool = True) -> None:
+        """Start sampled profiling of wall time spent in handlers (filter, format and sink write), at runtime.
+
+        Handlers are not rebuilt, their profiling wrappers are enabled. While profiling is stopped, wrappers only
+        check the enabled flag.
+
+        Args:
+            sample_rate (int , optional): Profile one of every N records. Default is 100.
+            reset       (bool, optional): Whether to clear previously collected profile. Default is True.
+        """
+
+        with self._reload_lock:
+            self._profiler.sample_rate = sample_rate
+            if reset:
+                self._profiler.reset()
+
+            self._profiler.enabled = True
+
+        return
+
+    def stop_profiling(self) -> None:
+        """Stop profiling by disabling profiling wrappers of handlers, collected profile is kept."""
+
+        with self._reload_lock:
+            self._profiler.enabled = False
+
+        return
+
+    @validate_call
+    def profile_report(
+        self,
+        top: int = 10,
+        format_: ReportFormatEnum | str = ReportFormatEnum.TABLE,
+    ) -> str:
+        """Get top call-sites (module, function, line) and handlers by profiled time as table or JSON text.
+
+        Args:
+            top     (int                   , optional): Number of top call-sites and handlers. Default is 10.
+            format_ (ReportFormatEnum | str, optional): Report format. Default is 'TABLE'.
+
+        Returns:
+            str: Profile report text.
+        """
+
+        return self._profiler.report(top=top, format_=format_)
+
     # ATTRIBUTES
     # handlers_map
     @property
@@ -0,0 +1,529 @@
+import os
+import json
+import struct
+import datetime
+import functools
+import traceback
+from typing import IO, TYPE_CHECKING, Any
+from collections.abc import Callable, Iterator
+
+from loguru._file_sink import FileSink
+
+if TYPE_CHECKING:
+    from loguru import Message, Record
+
+from .compressors import open_log_file
+
+BINARY_FORMAT_NAME = "beans_logging"
+BINARY_FORMAT_VERSION = 1
+# Field dictionary of records, written into the header of each file:
+BINARY_FIELDS = (
+    "timestamp",
+    "utcoffset",
+    "level",
+    "level_no",
+    "file",
+    "line",
+    "name",
+    "message",
+    "extra",
+    "error",
+    "elapsed",
+    "process",
+    "thread",
+)
+
+# Record key to store encoded frame, set by `binary_format()` before the record is enqueued:
+BINARY_RECORD_KEY = "binary_frame"
+
+_FRAME_HEADER = struct.Struct(">I")
+_DOUBLE = struct.Struct(">d")
+
+
+def _pack(obj: Any, buf: bytearray) -> None:
+    _type = type(obj)
+    if _type is str:
+        _data = obj.encode("utf-8", "surrogatepass")
+        _size = len(_data)
+        if _size < 32:
+            buf.append(0xA0 | _size)
+        elif _size < 0x100:
+            buf += b"\xd9" + _size.to_bytes(1, "big")
+        elif _size < 0x10000:
+            buf += b"\xda" + _size.to_bytes(2, "big")
+        else:
+            buf += b"\xdb" + _size.to_bytes(4, "big")
+        buf += _data
+    elif obj is None:
+        buf.append(0xC0)
+    elif _type is bool:
+        buf.append(0xC3 if obj else 0xC2)
+    elif _type is int:
+        if 0 <= obj < 0x80:
+            buf.append(obj)
+        elif -32 <= obj < 0:
+            buf.append(obj & 0xFF)
+        elif 0 <= obj < 0x100:
+            buf += b"\xcc" + obj.to_bytes(1, "big")
+        elif 0 <= obj < 0x1_0000:
+            buf += b"\xcd" + obj.to_bytes(2, "big")
+        elif 0 <= obj < 0x1_0000_0000:
+            buf += b"\xce" + obj.to_bytes(4, "big")
+        elif 0 <= obj < 0x1_0000_0000_0000_0000:
+            buf += b"\xcf" + obj.to_bytes(8, "big")
+        elif -0x80 <= obj < 0:
+            buf += b"\xd0" + obj.to_bytes(1, "big", signed=True)
+        elif -0x8000 <= obj < 0:
+            buf += b"\xd1" + obj.to_bytes(2, "big", signed=True)
+        elif -0x8000_0000 <= obj < 0:
+            buf += b"\xd2" + obj.to_bytes(4, "big", signed=True)
+        elif -0x8000_0000_0000_0000 <= obj < 0:
+            buf += b"\xd3" + obj.to_bytes(8, "big", signed=True)
+        else:
+            _pack(str(obj), buf)
+    elif _type is float:
+        buf += b"\xcb" + _DOUBLE.pack(obj)
+    elif (_type is list) or (_type is tuple):
+        _size = len(obj)
+        if _size < 16:
+            buf.append(0x90 | _size)
+        elif _size < 0x10000:
+            buf += b"\xdc" + _size.to_bytes(2, "big")
+        else:
+            buf += b"\xdd" + _size.to_bytes(4, "big")
+        for _item in obj:
+            _pack(_item, buf)
+    elif _type is dict:
+        _size = len(obj)
+        if _size < 16:
+            buf.append(0x80 | _size)
+        elif _size < 0x10000:
+            buf += b"\xde" + _size.to_bytes(2, "big")
+        else:
+            buf += b"\xdf" + _size.to_bytes(4, "big")
+        for _key, _value in obj.items():
+            _pack(_key, buf)
+            _pack(_value, buf)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        _data = bytes(obj)
+        _size = len(_data)
+        if _size < 0x100:
+            buf += b"\xc4" + _size.to_bytes(1, "big")
+        elif _size < 0x10000:
+            buf += b"\xc5" + _size.to_bytes(2, "big")
+        else:
+            buf += b"\xc6" + _size.to_bytes(4, "big")
+        buf += _data
+    # Subclasses (e.g. enums) are packed by their base values, same as json:
+    elif isinstance(obj, str):
+        _pack(str.__str__(obj), buf)
+    elif isinstance(obj, int):
+        _pack(int(obj), buf)
+    elif isinstance(obj, float):
+        _pack(float(obj), buf)
+    elif isinstance(obj, (list, tuple)):
+        _pack(list(obj), buf)
+    elif isinstance(obj, dict):
+        _pack(dict(obj), buf)
+    else:
+        _pack(str(obj), buf)
+
+
+def packb(obj: Any) -> bytes:
+    """Serialize object into msgpack bytes, unsupported types are serialized as strings.
+
+    Args:
+        obj (Any, required): Object to serialize.
+
+    Returns:
+        bytes: Msgpack bytes.
+    """
+
+    _buf = bytearray()
+    _pack(obj, _buf)
+    return bytes(_buf)
+
+
+def _unpack(data: bytes, pos: int) -> tuple[Any, int]:
+    _byte = data[pos]
+    pos += 1
+    if _byte < 0x80:
+        return _byte, pos
+    elif _byte >= 0xE0:
+        return _byte - 0x100, pos
+    elif 0xA0 <= _byte <= 0xBF:
+        _size = _byte & 0x1F
+        return data[pos : pos + _size].decode("utf-8", "surrogatepass"), pos + _size
+    elif 0x90 <= _byte <= 0x9F:
+        return _unpack_array(data, pos, _byte & 0x0F)
+    elif 0x80 <= _byte <= 0x8F:
+        return _unpack_map(data, pos, _byte & 0x0F)
+    elif _byte == 0xC0:
+        return None, pos
+    elif _byte == 0xC2:
+        return False, pos
+    elif _byte == 0xC3:
+        return True, pos
+    elif _byte == 0xCB:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+    elif _byte == 0xCA:
+        return struct.unpack_from(">f", data, pos)[0], pos + 4
+    elif 0xCC <= _byte <= 0xD3:
+        _width = 1 << ((_byte - 0xCC) & 0x03)
+        _value = int.from_bytes(data[pos : pos + _width], "big", signed=(_byte >= 0xD0))
+        return _value, pos + _width
+    elif _byte in (0xD9, 0xDA, 0xDB, 0xC4, 0xC5, 0xC6):
+        _width = 1 << ((_byte - 0xD9) if _byte >= 0xD9 else (_byte - 0xC4))
+        _size = int.from_bytes(data[pos : pos + _width], "big")
+        pos += _width
+        _data = data[pos : pos + _size]
+        if _byte >= 0xD9:
+            return _data.decode("utf-8", "surrogatepass"), pos + _size
+        return bytes(_data), pos + _size
+    elif _byte in (0xDC, 0xDD, 0xDE, 0xDF):
+        _width = 2 if _byte in (0xDC, 0xDE) else 4
+        _size = int.from_bytes(data[pos : pos + _width], "big")
+        if _byte <= 0xDD:
+            return _unpack_array(data, pos + _width, _size)
+        return _unpack_map(data, pos + _width, _size)
+
+    raise ValueError(f"Msgpack type byte 0x{_byte:02x} is not supported!")
+
+
+def _unpack_array(data: bytes, pos: int, size: int) -> tuple[list[Any], int]:
+    _items = []
+    for _ in range(size):
+        _item, pos = _unpack(data, pos)
+        _items.append(_item)
+
+    return _items, pos
+
+
+def _unpack_map(data: bytes, pos: int, size: int) -> tuple[dict[Any, Any], int]:
+    _map = {}
+    for _ in range(size):
+        _key, pos = _unpack(data, pos)
+        _value, pos = _unpack(data, pos)
+        _map[_key] = _value
+
+    return _map, pos
+
+
+def unpackb(data: bytes) -> Any:
+    """Deserialize msgpack bytes into object.
+
+    Args:
+        data (bytes, required): Msgpack bytes.
+
+    Raises:
+        ValueError: If data has unsupported msgpack types (e.g. extension types).
+
+    Returns:
+        Any: Deserialized object.
+    """
+
+    return _unpack(data, 0)[0]
+
+
+def _get_packb() -> Callable[[Any], bytes]:
+    try:
+        import msgpack
+
+        # Stateless 'packb()', a shared 'Packer' is not thread-safe (formatter runs in logging threads):
+        return functools.partial(msgpack.packb, default=str, use_bin_type=True)
+    except ImportError:
+        return packb
+
+
+class BinaryEncoder:
+    """Binary encoder class which encodes log records into length-prefixed msgpack frames.
+
+    Records are encoded as msgpack arrays ordered by `BINARY_FIELDS`, so keys are written only once into the
+    header frame of each file. Uses 'msgpack' package when it is installed, otherwise a minimal pure-python
+    encoder.
+
+    Attributes:
+        app_name (str | None): Application name to write into header.
+
+    Methods:
+        encode_header(): Encode header frame with the field dictionary.
+        encode()       : Encode log record into frame.
+    """
+
+    def __init__(self, app_name: str | None = None) -> None:
+        """BinaryEncoder constructor method.
+
+        Args:
+            app_name (str | None, optional): Application name to write into header. Default is None.
+        """
+
+        self.app_name = app_name
+        self._packb = _get_packb()
+
+    def encode_header(self) -> bytes:
+        """Encode header frame with the field dictionary.
+
+        Returns:
+            bytes: Header frame.
+        """
+
+        _payload = packb(
+            {
+                "format": BINARY_FORMAT_NAME,
+                "version": BINARY_FORMAT_VERSION,
+                "app_name": self.app_name,
+                "fields": list(BINARY_FIELDS),
+            }
+        )
+        return _FRAME_HEADER.pack(len(_payload)) + _payload
+
+    def encode(self, record: "Record") -> bytes:
+        """Encode log record into frame.
+
+        Args:
+            record (Record, required): Log record as dictionary.
+
+        Returns:
+            bytes: Length-prefixed msgpack frame.
+        """
+
+        _error = None
+        if record["exception"]:
+            _error_type, _error_value, _error_traceback = record["exception"]
+            _error = [
+                _error_type.__name__ if _error_type else "None",
+                str(_error_value),
+                "".join(traceback.format_tb(_error_traceback)),
+            ]
+
+        _time = record["time"]
+        _elapsed = record["elapsed"]
+        _process, _thread = record["process"], record["thread"]
+        _payload = self._packb(
+            [
+                _time.timestamp(),
+                int(_time.utcoffset().total_seconds()),  # type: ignore
+                record["level"].name,
+                record["level"].no,
+                record["file"].name,
+                record["line"],
+                record["name"],
+                record["message"],
+                record["extra"] or None,
+                _error,
+                (_elapsed.days * 86_400 + _elapsed.seconds) * 1_000_000
+                + _elapsed.microseconds,
+                [_process.name, _process.id],
+                [_thread.name, _thread.id],
+            ]
+        )
+        return _FRAME_HEADER.pack(len(_payload)) + _payload
+
+
+class _BinaryMessage(bytes):
+    record: "Record"
+
+
+class BinaryFileSink(FileSink):
+    """Loguru file sink class which writes log records as binary frames instead of formatted messages.
+
+    Each new (or rotated) file starts with a header frame holding the field dictionary, so the files can be
+    read by `iter_binary_records()` or converted to json lines by `python -m beans_logging convert`.
+
+    Attributes:
+        encoder (BinaryEncoder): Binary encoder of log records.
+
+    Methods:
+        write(): Encode log record and write it into file.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike, app_name: str | None = None, **kwargs: Any
+    ) -> None:
+        """BinaryFileSink constructor method.
+
+        Args:
+            path     (str | PathLike, required): Log file path.
+            app_name (str | None    , optional): Application name to write into header. Default is None.
+            **kwargs (Any           , optional): Loguru file sink arguments.
+        """
+
+        self.encoder = BinaryEncoder(app_name=app_name)
+        self._header = self.encoder.encode_header()
+
+        _mode = kwargs.get("mode") or "a"
+        kwargs["mode"] = _mode if "b" in _mode else f"{_mode}b"
+        kwargs["encoding"] = None
+        # Unbuffered, so each frame is written by one system call, same as line buffered text files:
+        kwargs["buffering"] = kwargs.get("buffering") or 0
+        super().__init__(str(path), **kwargs)
+
+    def _create_file(self, path: str) -> None:
+        super()._create_file(path)
+        if self._file.tell() == 0:
+            self._file.write(self._header)
+
+    def write(self, message: "Message") -> None:
+        _record = message.record
+        _frame = _BinaryMessage(
+            _record.get(BINARY_RECORD_KEY) or self.encoder.encode(_record)  # type: ignore
+        )
+        # Record is used by rotation function:
+        _frame.record = _record
+        super().write(_frame)
+
+
+_binary_encoder = BinaryEncoder()
+
+
+def binary_format(record: "Record") -> str:
+    """Formatter for binary file handlers, encodes the record into frame and returns empty format.
+
+    Frame is attached to the record itself (`BINARY_RECORD_KEY`) and written by the sink. So the exception
+    traceback is encoded before the record is enqueued (tracebacks are not pickled), and handlers sharing the
+    formatter encode each record only once.
+
+    Args:
+        record (Record, required): Log record as dictionary.
+
+    Returns:
+        str: Empty format.
+    """
+
+    if BINARY_RECORD_KEY not in record:
+        record[BINARY_RECORD_KEY] = _binary_encoder.encode(record)  # type: ignore
+
+    return ""
+
+
+def iter_binary_records(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Iterate log records of binary log file, streaming frame by frame.
+
+    Incomplete frame at the end (e.g. the file is still being written) stops the iteration.
+
+    Args:
+        file (IO[bytes], required): Binary log file object opened for reading.
+
+    Raises:
+        ValueError: If a frame is not a valid msgpack header or record.
+
+    Yields:
+        dict[str, Any]: Log record as dictionary by the field dictionary of header, with 'app_name'.
+    """
+
+    _fields: tuple[str, ...] = BINARY_FIELDS
+    _app_name = None
+    _read = file.read
+    while True:
+        _frame_header = _read(_FRAME_HEADER.size)
+        if len(_frame_header) < _FRAME_HEADER.size:
+            return
+
+        (_size,) = _FRAME_HEADER.unpack(_frame_header)
+        _payload = _read(_size)
+        if len(_payload) < _size:
+            return
+
+        _value = unpackb(_payload)
+        if isinstance(_value, dict):
+            if _value.get("format") != BINARY_FORMAT_NAME:
+                raise ValueError(
+                    "Binary log header is invalid, format name is unknown!"
+                )
+
+            _fields = tuple(_value["fields"])
+            _app_name = _value.get("app_name")
+            continue
+
+        if not isinstance(_value, list):
+            raise ValueError(
+                f"Binary log record type {type(_value).__name__} is invalid, must be an array!"
+            )
+
+        _record = dict(zip(_fields, _value))
+        _record["app_name"] = _app_name
+        yield _record
+
+
+def read_binary_records(path: str) -> Iterator[dict[str, Any]]:
+    """Read log records of binary log file path, rotated files are decompressed by their extension.
+
+    Args:
+        path (str, required): Binary log file path.
+
+    Yields:
+        dict[str, Any]: Log record as dictionary.
+    """
+
+    with open_log_file(path) as _file:
+        yield from iter_binary_records(_file)
+
+
+def to_json_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Convert binary log record into the same structure as `json_format`.
+
+    Args:
+        record (dict[str, Any], required): Log record read from binary log file.
+
+    Returns:
+        dict[str, Any]: Log record as json serializable dictionary.
+    """
+
+    _timezone = datetime.timezone(datetime.timedelta(seconds=record["utcoffset"]))
+    _error = record["error"]
+    if _error is not None:
+        _error = {"type": _error[0], "value": _error[1], "traceback": _error[2]}
+
+    _json_record = {
+        "timestamp": datetime.datetime.fromtimestamp(
+            record["timestamp"], _timezone
+        ).strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "level": record["level"],
+        "level_no": record["level_no"],
+        "file": record["file"],
+        "line": record["line"],
+        "name": record["name"],
+        "process": {"name": record["process"][0], "id": record["process"][1]},
+        "thread_name": {"name": record["thread"][0], "id": record["thread"][1]},
+        "message": record["message"],
+        "extra": record["extra"],
+        "error": _error,
+        "elapsed": str(datetime.timedelta(microseconds=record["elapsed"])),
+    }
+    return _json_record
+
+
+def convert_to_json(path: str, output: IO[str]) -> int:
+    """Convert binary log file into json lines.
+
+    Args:
+        path   (str    , required): Binary log file path.
+        output (IO[str], required): Text file object to write json lines.
+
+    Returns:
+        int: Number of converted records.
+    """
+
+    _count = 0
+    for _record in read_binary_records(path):
+        output.write(json.dumps(to_json_record(_record), default=str) + "\n")
+        _count += 1
+
+    return _count
+
+
+__all__ = [
+    "BINARY_FORMAT_NAME",
+    "BINARY_FORMAT_VERSION",
+    "BINARY_FIELDS",
+    "BINARY_RECORD_KEY",
+    "packb",
+    "unpackb",
+    "BinaryEncoder",
+    "BinaryFileSink",
+    "binary_format",
+    "iter_binary_records",
+    "read_binary_records",
+    "to_json_record",
+    "convert_to_json",
+]
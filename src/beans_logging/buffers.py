@@ -0,0 +1,312 @@
+import os
+import sys
+import atexit
+import weakref
+import threading
+import traceback
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from loguru import Message
+
+from .constants import OverflowPolicyEnum
+
+
+class RingBuffer:
+    """Bounded, preallocated in-process ring buffer with overflow policies.
+
+    Attributes:
+        capacity      (int               ): Max number of items in buffer.
+        policy        (OverflowPolicyEnum): Overflow policy when buffer is full.
+        drop_level_no (int               ): Level number to drop below when policy is 'DROP_BELOW_LEVEL'.
+        enqueued      (int               ): Number of enqueued items.
+        dropped       (int               ): Number of dropped items.
+        high_water    (int               ): Max number of items were in buffer at once.
+
+    Methods:
+        put()    : Put message into buffer based on overflow policy.
+        get_all(): Wait and get all items from buffer.
+        close()  : Close buffer and wake up waiting threads.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 8_192,
+        policy: OverflowPolicyEnum | str = OverflowPolicyEnum.BLOCK,
+        drop_level_no: int = 30,
+    ) -> None:
+        """RingBuffer constructor method.
+
+        Args:
+            capacity      (int                     , optional): Max number of items in buffer. Default is 8192.
+            policy        (OverflowPolicyEnum | str, optional): Overflow policy when buffer is full.
+                                                                    Default is 'BLOCK'.
+            drop_level_no (int                     , optional): Level number to drop below when policy is
+                                                                    'DROP_BELOW_LEVEL'. Default is 30 (WARNING).
+        """
+
+        if capacity < 1:
+            raise ValueError(
+                f"'capacity' argument value {capacity} is invalid, must be greater than 0!"
+            )
+
+        self.capacity = capacity
+        self.policy = OverflowPolicyEnum(policy)
+        self.drop_level_no = drop_level_no
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.high_water = 0
+
+        self._items: list[Any] = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _append(self, item: Any) -> None:
+        self._items[(self._head + self._size) % self.capacity] = item
+        self._size += 1
+        self.enqueued += 1
+        if self.high_water < self._size:
+            self.high_water = self._size
+
+        if self._size == 1:
+            self._not_empty.notify()
+
+    def put(self, message: "Message") -> bool:
+        """Put message into buffer based on overflow policy.
+
+        Args:
+            message (Message, required): Log message.
+
+        Returns:
+            bool: True if message is enqueued, False if dropped.
+        """
+
+        with self._lock:
+            if self._size < self.capacity:
+                self._append(message)
+                return True
+
+            if self.policy == OverflowPolicyEnum.DROP_NEWEST:
+                self.dropped += 1
+                return False
+
+            if self.policy == OverflowPolicyEnum.DROP_OLDEST:
+                self._items[self._head] = None
+                self._head = (self._head + 1) % self.capacity
+                self._size -= 1
+                self.dropped += 1
+                self._append(message)
+                return True
+
+            if (self.policy == OverflowPolicyEnum.DROP_BELOW_LEVEL) and (
+                message.record["level"].no < self.drop_level_no
+            ):
+                self.dropped += 1
+                return False
+
+            while (self.capacity <= self._size) and (not self._closed):
+                self._not_full.wait()
+
+            if self._closed:
+                self.dropped += 1
+                return False
+
+            self._append(message)
+            return True
+
+    def get_all(self, timeout: float | None = None) -> list[Any]:
+        """Wait and get all items from buffer.
+
+        Args:
+            timeout (float | None, optional): Max seconds to wait for items. Default is None (forever).
+
+        Returns:
+            list[Any]: All items in buffer, empty list if buffer is closed or timed out.
+        """
+
+        with self._lock:
+            if (self._size == 0) and (not self._closed):
+                self._not_empty.wait(timeout)
+
+            _items: list[Any] = []
+            while self._size:
+                _items.append(self._items[self._head])
+                self._items[self._head] = None
+                self._head = (self._head + 1) % self.capacity
+                self._size -= 1
+
+            if _items:
+                self._not_full.notify_all()
+
+            return _items
+
+    def close(self) -> None:
+        """Close buffer and wake up waiting threads."""
+
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        return
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+class RingBufferSink:
+    """Sink class which puts a ring buffer and one writer thread in front of any sink.
+
+    Logging threads only append messages into the buffer, the writer thread writes them into the wrapped sink.
+
+    Attributes:
+        _instances (WeakSet): Live sinks, re-initialized in the child process after fork.
+
+        sink   (Any       ): Wrapped sink object with 'write()' method or callable.
+        buffer (RingBuffer): Ring buffer between logging threads and the writer thread.
+
+    Methods:
+        write(): Put message into ring buffer.
+        stop() : Stop writer thread after writing remaining messages and stop wrapped sink.
+        stats  : Counters of ring buffer (property).
+    """
+
+    _instances: "weakref.WeakSet[RingBufferSink]" = weakref.WeakSet()
+
+    def __init__(
+        self,
+        sink: Any,
+        capacity: int = 8_192,
+        policy: OverflowPolicyEnum | str = OverflowPolicyEnum.BLOCK,
+        drop_level_no: int = 30,
+    ) -> None:
+        """RingBufferSink constructor method.
+
+        Args:
+            sink          (Any                     , required): Sink object with 'write()' method or callable.
+            capacity      (int                     , optional): Max number of messages in buffer. Default is 8192.
+            policy        (OverflowPolicyEnum | str, optional): Overflow policy when buffer is full.
+                                                                    Default is 'BLOCK'.
+            drop_level_no (int                     , optional): Level number to drop below when policy is
+                                                                    'DROP_BELOW_LEVEL'. Default is 30 (WARNING).
+
+        Raises:
+            TypeError: If 'sink' argument doesn't have 'write()' method and is not callable.
+        """
+
+        if hasattr(sink, "write") and callable(sink.write):
+            self._write = sink.write
+        elif callable(sink):
+            self._write = sink
+        else:
+            raise TypeError(
+                f"'sink' argument type {type(sink).__name__} is invalid, must have 'write()' method or be callable!"
+            )
+
+        self.sink = sink
+        self.encoding = getattr(sink, "encoding", None)
+        self._flush = getattr(sink, "flush", None)
+        self.buffer = RingBuffer(
+            capacity=capacity, policy=policy, drop_level_no=drop_level_no
+        )
+
+        self._start_writer()
+        atexit.register(self.stop)
+        RingBufferSink._instances.add(self)
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        for _self in list(cls._instances):
+            if not _self.buffer.closed:
+                # Threads don't survive fork, re-create locks and writer thread in the child process:
+                _self.buffer = RingBuffer(
+                    capacity=_self.buffer.capacity,
+                    policy=_self.buffer.policy,
+                    drop_level_no=_self.buffer.drop_level_no,
+                )
+                _self._start_writer()
+
+    def _start_writer(self) -> None:
+        self._thread = threading.Thread(
+            target=self._write_loop, name="beans-logging-ring-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _write_loop(self) -> None:
+        _buffer = self.buffer
+        while True:
+            _messages = _buffer.get_all()
+            if (not _messages) and _buffer.closed:
+                break
+
+            for _message in _messages:
+                try:
+                    self._write(_message)
+                except Exception:
+                    sys.stderr.write(
+                        "--- Logging error in beans-logging ring buffer sink ---\n"
+                    )
+                    traceback.print_exc(file=sys.stderr)
+
+            if self._flush is not None:
+                try:
+                    self._flush()
+                except Exception:
+                    pass
+
+    def write(self, message: "Message") -> None:
+        """Put message into ring buffer.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        self.buffer.put(message)
+        return
+
+    def stop(self) -> None:
+        """Stop writer thread after writing remaining messages and stop wrapped sink."""
+
+        if self.buffer.closed:
+            return
+
+        self.buffer.close()
+        if self._thread.is_alive() and (self._thread is not threading.current_thread()):
+            self._thread.join()
+
+        _stop = getattr(self.sink, "stop", None)
+        if callable(_stop):
+            _stop()
+
+        atexit.unregister(self.stop)
+        return
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "capacity": self.buffer.capacity,
+            "depth": len(self.buffer),
+            "enqueued": self.buffer.enqueued,
+            "dropped": self.buffer.dropped,
+            "high_water": self.buffer.high_water,
+        }
+
+
+if hasattr(os, "register_at_fork"):
+    # Fork callbacks can't be unregistered, so one callback re-creates writers of all live sinks:
+    os.register_at_fork(after_in_child=RingBufferSink._after_fork)
+
+
+__all__ = [
+    "RingBuffer",
+    "RingBufferSink",
+]
@@ -0,0 +1,198 @@
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+from typing import Any
+
+import potato_util as utils
+
+from .__version__ import __version__
+from .config import LoggerConfigPM
+
+
+def get_default_cache_dir() -> str | None:
+    """Get config cache directory from 'BEANS_LOGGING_CACHE_DIR' environment variable, caching is opt-in.
+
+    Returns:
+        str | None: Absolute cache directory path ('~' is expanded, user cache directory if environment variable
+                        is 'true'), None if caching is disabled by unset, empty or 'false' environment variable.
+    """
+
+    _cache_dir = os.getenv("BEANS_LOGGING_CACHE_DIR")
+    if (_cache_dir is None) or (
+        _cache_dir.strip().lower() in ("", "0", "false", "no", "off")
+    ):
+        return None
+
+    if _cache_dir.strip().lower() not in ("1", "true", "yes", "on"):
+        # '~' is not expanded in quoted or dotenv values, relative paths would depend on current directory:
+        return os.path.abspath(os.path.expanduser(_cache_dir))
+
+    _base_dir = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(_base_dir, "beans_logging")
+
+
+class ConfigCache:
+    """ConfigCache class for storing resolved and validated config snapshots of config files.
+
+    Snapshot file name is based on the config file path and the base config (which file config is merged into),
+    and the snapshot stores the config file's mtime, size and sha256 hash. Snapshot is used only when all of them
+    match, otherwise (or if snapshot is broken) caller should fall back to parsing and validating the config file.
+
+    Snapshots are pickled, so cache directory is created with owner-only permissions and ignored if it is owned by
+    another user.
+
+    Attributes:
+        _VERSION (str): Snapshot format version, includes library versions which affect pickled models.
+
+        cache_dir (str): Cache directory path.
+
+    Methods:
+        get_key(): Get key of config file for the base config.
+        load()   : Load validated config snapshot for the key.
+        save()   : Save validated config snapshot for the key.
+    """
+
+    _VERSION = f"1:{__version__}:{sys.version_info[:2]}"
+
+    def __init__(self, cache_dir: str) -> None:
+        """ConfigCache constructor method.
+
+        Args:
+            cache_dir (str, required): Cache directory path.
+        """
+
+        self.cache_dir = cache_dir
+
+    def _get_version(self) -> str:
+        import pydantic
+
+        return f"{self._VERSION}:{pydantic.VERSION}"
+
+    def get_key(
+        self, config_path: str, base_config: LoggerConfigPM
+    ) -> dict[str, Any] | None:
+        """Get key of config file for the base config.
+
+        Args:
+            config_path (str           , required): Config file path.
+            base_config (LoggerConfigPM, required): Base config which file config is merged into.
+
+        Returns:
+            dict[str, Any] | None: Key as dictionary, None if config file can't be read or base config can't be
+                                    fingerprinted (e.g. contains objects which can't be pickled).
+        """
+
+        try:
+            _config_path = os.path.abspath(config_path)
+            with open(_config_path, "rb") as _file:
+                _stat = os.fstat(_file.fileno())
+                _content = _file.read()
+
+            _base_hash = hashlib.sha256(
+                pickle.dumps(base_config.model_dump())
+            ).hexdigest()
+        except Exception:
+            return None
+
+        # Debug mode changes level validation, so it is part of the key:
+        _name = (
+            f"{self._get_version()}:{_config_path}:{_base_hash}:{utils.is_debug_mode()}"
+        )
+        return {
+            "name": hashlib.sha256(_name.encode()).hexdigest(),
+            "mtime_ns": _stat.st_mtime_ns,
+            "size": _stat.st_size,
+            "sha256": hashlib.sha256(_content).hexdigest(),
+        }
+
+    def _get_snapshot_path(self, key: dict[str, Any]) -> str:
+        return os.path.join(self.cache_dir, f"config-{key['name']}.pickle")
+
+    def _is_safe_dir(self) -> bool:
+        if not os.path.isdir(self.cache_dir):
+            return False
+
+        if hasattr(os, "getuid") and (os.stat(self.cache_dir).st_uid != os.getuid()):
+            return False
+
+        return True
+
+    def load(self, key: dict[str, Any]) -> LoggerConfigPM | None:
+        """Load validated config snapshot for the key.
+
+        Args:
+            key (dict[str, Any], required): Key of config file from `get_key()`.
+
+        Returns:
+            LoggerConfigPM | None: Validated config, None if there is no matching or valid snapshot.
+        """
+
+        _snapshot_path = self._get_snapshot_path(key)
+        try:
+            if (not os.path.isfile(_snapshot_path)) or (not self._is_safe_dir()):
+                return None
+
+            with open(_snapshot_path, "rb") as _file:
+                _snapshot = pickle.load(_file)
+
+            if _snapshot["key"] != key:
+                return None
+
+            _config = _snapshot["config"]
+            if not isinstance(_config, LoggerConfigPM):
+                raise TypeError(
+                    f"Snapshot config type {type(_config).__name__} is invalid, must be <LoggerConfigPM>!"
+                )
+
+            return _config
+        except Exception:
+            # Broken or incompatible snapshot, remove it and fall back to full validation:
+            try:
+                os.remove(_snapshot_path)
+            except OSError:
+                pass
+
+            return None
+
+    def save(self, key: dict[str, Any], config: LoggerConfigPM) -> bool:
+        """Save validated config snapshot for the key, atomically.
+
+        Args:
+            key    (dict[str, Any], required): Key of config file from `get_key()`.
+            config (LoggerConfigPM, required): Validated config.
+
+        Returns:
+            bool: True if snapshot is saved, False otherwise (e.g. config can't be pickled).
+        """
+
+        _tmp_path: str | None = None
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            if not self._is_safe_dir():
+                return False
+
+            _snapshot = pickle.dumps({"key": key, "config": config})
+            _fd, _tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(_fd, "wb") as _file:
+                _file.write(_snapshot)
+
+            os.replace(_tmp_path, self._get_snapshot_path(key))
+            return True
+        except Exception:
+            if _tmp_path:
+                try:
+                    os.remove(_tmp_path)
+                except OSError:
+                    pass
+
+            return False
+
+
+__all__ = [
+    "get_default_cache_dir",
+    "ConfigCache",
+]
@@ -0,0 +1,363 @@
+import os
+import bz2
+import gzip
+import lzma
+import atexit
+import shutil
+import weakref
+import functools
+import threading
+from typing import IO, Any
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from .constants import COMPRESSION_LEVEL_RANGES, CompressionEnum
+
+_COMPRESSED_EXTS: dict[CompressionEnum, str] = {
+    CompressionEnum.GZIP: ".gz",
+    CompressionEnum.BZ2: ".bz2",
+    CompressionEnum.XZ: ".xz",
+    CompressionEnum.ZSTD: ".zst",
+}
+
+
+def _get_zstd_opener() -> Callable[[str, int | None], IO[bytes]]:
+    try:
+        import zstandard
+
+        def _open_zstandard(path: str, level: int | None) -> IO[bytes]:
+            _compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+            return _compressor.stream_writer(open(path, "wb"), closefd=True)  # type: ignore
+
+        return _open_zstandard
+    except ImportError:
+        pass
+
+    try:
+        from compression import zstd  # type: ignore  # Python >= 3.14
+
+        def _open_zstd(path: str, level: int | None) -> IO[bytes]:
+            return zstd.open(path, "wb", level=level)
+
+        return _open_zstd
+    except ImportError as err:
+        raise ImportError(
+            "'zstandard' package is not installed, install it with 'pip install zstandard'!"
+        ) from err
+
+
+def get_opener(
+    format_: CompressionEnum | str,
+) -> Callable[[str, int | None], IO[bytes]]:
+    """Get function to open compressed file for writing.
+
+    Args:
+        format_ (CompressionEnum | str, required): Compression format.
+
+    Raises:
+        ImportError: If 'ZSTD' format is used and 'zstandard' package is not installed (Python < 3.14).
+
+    Returns:
+        Callable[[str, int | None], IO[bytes]]: Function to open compressed file with path and level.
+    """
+
+    format_ = CompressionEnum(format_)
+    if format_ == CompressionEnum.GZIP:
+        return lambda path, level: gzip.open(
+            path, "wb", compresslevel=9 if level is None else level
+        )  # type: ignore
+    elif format_ == CompressionEnum.BZ2:
+        return lambda path, level: bz2.open(
+            path, "wb", compresslevel=9 if level is None else level
+        )  # type: ignore
+    elif format_ == CompressionEnum.XZ:
+        return lambda path, level: lzma.open(path, "wb", preset=level)  # type: ignore
+
+    return _get_zstd_opener()
+
+
+def open_log_file(path: str) -> IO[bytes]:
+    """Open log file for reading in binary mode, rotated files are decompressed by their extension.
+
+    Args:
+        path (str, required): Log file path.
+
+    Raises:
+        ImportError: If '.zst' file is opened and 'zstandard' package is not installed (Python < 3.14).
+
+    Returns:
+        IO[bytes]: Readable binary file object.
+    """
+
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")  # type: ignore
+    elif path.endswith(".bz2"):
+        return bz2.open(path, "rb")  # type: ignore
+    elif path.endswith(".xz"):
+        return lzma.open(path, "rb")  # type: ignore
+    elif path.endswith(".zst"):
+        try:
+            import zstandard
+
+            return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)  # type: ignore
+        except ImportError:
+            pass
+
+        try:
+            from compression import zstd  # type: ignore  # Python >= 3.14
+
+            return zstd.open(path, "rb")
+        except ImportError as err:
+            raise ImportError(
+                "'zstandard' package is not installed, install it with 'pip install zstandard'!"
+            ) from err
+
+    return open(path, "rb")
+
+
+def _remove_by_count(logs: list[str], retention: int) -> None:
+    """Keep only newest log files by count, same as loguru's integer retention."""
+
+    _logs = [_log for _log in logs if os.path.isfile(_log)]
+    for _log in sorted(_logs, key=lambda _log: (-os.stat(_log).st_mtime, _log))[
+        retention:
+    ]:
+        try:
+            os.remove(_log)
+        except FileNotFoundError:
+            pass
+
+    return
+
+
+class Compressor:
+    """Compressor class for compressing rotated log files on background threads.
+
+    Compression callable is passed to loguru as 'compression', so rotation only submits a job and returns.
+    Retention callable waits for pending compression jobs (on background thread) before removing old files.
+    Pending jobs are drained on `shutdown()`, which is registered at interpreter exit.
+
+    Attributes:
+        _PART_SUFFIX (str    ): Suffix for files which are still being compressed.
+        _instances   (WeakSet): Live compressors, re-initialized in the child process after fork.
+
+        format_ (CompressionEnum): Compression format.
+        level   (int | None     ): Compression level, None means default level of the format.
+        workers (int            ): Number of background worker threads.
+        ext     (str            ): File extension of compressed files.
+
+    Methods:
+        compress()      : Submit compression job for rotated log file.
+        make_retention(): Make retention function which waits for pending compression jobs.
+        wait()          : Wait for pending compression jobs.
+        shutdown()      : Drain pending jobs and stop worker threads.
+    """
+
+    _instances: "weakref.WeakSet[Compressor]" = weakref.WeakSet()
+
+    _PART_SUFFIX = ".part"
+
+    def __init__(
+        self,
+        format_: CompressionEnum | str = CompressionEnum.GZIP,
+        level: int | None = None,
+        workers: int = 1,
+    ) -> None:
+        """Compressor constructor method.
+
+        Args:
+            format_ (CompressionEnum | str, optional): Compression format. Default is 'GZIP'.
+            level   (int | None           , optional): Compression level. Default is None.
+            workers (int                  , optional): Number of background worker threads. Default is 1.
+
+        Raises:
+            ValueError: If 'workers' argument value is less than 1 or 'level' argument value is out of the range of
+                            compression format.
+        """
+
+        if workers < 1:
+            raise ValueError(
+                f"'workers' argument value {workers} is invalid, must be greater than 0!"
+            )
+
+        format_ = CompressionEnum(format_)
+        if level is not None:
+            _min_level, _max_level = COMPRESSION_LEVEL_RANGES[format_]
+            if not (_min_level <= level <= _max_level):
+                raise ValueError(
+                    f"'level' argument value {level} is invalid for '{format_.value}' compression, "
+                    f"must be between {_min_level} and {_max_level}!"
+                )
+
+        self.format_ = format_
+        self.level = level
+        self.workers = workers
+        self.ext = _COMPRESSED_EXTS[self.format_]
+
+        self._opener = get_opener(self.format_)
+        self._init_executor()
+
+        atexit.register(self.shutdown)
+        Compressor._instances.add(self)
+
+    def _init_executor(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="beans-logging-compressor"
+        )
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        for _self in list(cls._instances):
+            # Threads don't survive fork, re-create executor in the child process:
+            _self._init_executor()
+
+    def _compress_file(self, path: str) -> None:
+        _compressed_path = f"{path}{self.ext}"
+        _part_path = f"{_compressed_path}{self._PART_SUFFIX}"
+        _stat = os.stat(path)
+
+        with (
+            open(path, "rb") as _file_in,
+            self._opener(_part_path, self.level) as _file_out,
+        ):
+            shutil.copyfileobj(_file_in, _file_out, 1024 * 1024)
+
+        os.utime(_part_path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns))
+        os.replace(_part_path, _compressed_path)
+        os.remove(path)
+        return
+
+    def _submit(self, func: Callable[..., Any], *args: Any) -> None:
+        try:
+            _future = self._executor.submit(func, *args)
+        except RuntimeError:
+            # Executor is already shut down (interpreter exit), run in current thread:
+            func(*args)
+            return
+
+        with self._lock:
+            self._pending.add(_future)
+
+        _future.add_done_callback(self._on_done)
+        return
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+        _error = future.exception()
+        if _error is not None:
+            import sys
+            import traceback
+
+            sys.stderr.write("--- Logging error in beans-logging compressor ---\n")
+            traceback.print_exception(type(_error), _error, _error.__traceback__)
+
+        return
+
+    def compress(self, path: str) -> None:
+        """Submit compression job for rotated log file, used as loguru 'compression' function.
+
+        Args:
+            path (str, required): Rotated (closed) log file path.
+        """
+
+        self._submit(self._compress_file, path)
+        return
+
+    def _retain(self, logs: list[str], retention: int, pending: list[Future]) -> None:
+        wait(pending)
+
+        _logs: list[str] = []
+        for _log in logs:
+            if _log.endswith(self._PART_SUFFIX):
+                continue
+
+            if (not os.path.isfile(_log)) and os.path.isfile(f"{_log}{self.ext}"):
+                _log = f"{_log}{self.ext}"
+
+            _logs.append(_log)
+
+        _remove_by_count(logs=_logs, retention=retention)
+        return
+
+    def make_retention(self, retention: int) -> Callable[[list[str]], None]:
+        """Make retention function which waits for pending compression jobs, used as loguru 'retention' function.
+
+        Args:
+            retention (int, required): Number of newest log files to keep.
+
+        Returns:
+            Callable[[list[str]], None]: Retention function for loguru.
+        """
+
+        def _retention(logs: list[str]) -> None:
+            with self._lock:
+                _pending = list(self._pending)
+
+            self._submit(self._retain, logs, retention, _pending)
+            return
+
+        return _retention
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for pending compression jobs.
+
+        Args:
+            timeout (float | None, optional): Max seconds to wait. Default is None (forever).
+        """
+
+        while True:
+            with self._lock:
+                _pending = list(self._pending)
+
+            if not _pending:
+                break
+
+            _done, _not_done = wait(_pending, timeout=timeout)
+            if _not_done:
+                break
+
+        return
+
+    def shutdown(self) -> None:
+        """Drain pending jobs and stop worker threads."""
+
+        self._executor.shutdown(wait=True)
+        atexit.unregister(self.shutdown)
+        return
+
+
+if hasattr(os, "register_at_fork"):
+    # One callback for all live compressors, registering per instance would leak on every reload:
+    os.register_at_fork(after_in_child=Compressor._after_fork)
+
+
+@functools.lru_cache(maxsize=16)
+def get_compressor(
+    format_: CompressionEnum | str = CompressionEnum.GZIP,
+    level: int | None = None,
+    workers: int = 1,
+) -> Compressor:
+    """Get shared compressor, so handlers with same settings share worker threads.
+
+    Args:
+        format_ (CompressionEnum | str, optional): Compression format. Default is 'GZIP'.
+        level   (int | None           , optional): Compression level. Default is None.
+        workers (int                  , optional): Number of background worker threads. Default is 1.
+
+    Returns:
+        Compressor: Shared compressor instance.
+    """
+
+    return Compressor(format_=format_, level=level, workers=workers)
+
+
+__all__ = [
+    "get_opener",
+    "open_log_file",
+    "Compressor",
+    "get_compressor",
+]
@@ -1,20 +1,81 @@
 import os
+import sys
 import datetime
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
 import potato_util as utils
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
 from .constants import (
     LogLevelEnum,
     LogHandlerTypeEnum,
+    JsonBackendEnum,
+    CompressionEnum,
+    COMPRESSION_LEVEL_RANGES,
     DEFAULT_STD_HANDLER_NAME,
     DEFAULT_FILE_HANDLER_NAME,
     DEFAULT_ERR_FILE_HANDLER_NAME,
     DEFAULT_JSON_HANDLER_NAME,
     DEFAULT_ERR_JSON_HANDLER_NAME,
 )
-from .schemas import ExtraBaseModel, LogHandlerPM, FormatType
+from .schemas import ExtraBaseModel, LogHandlerPM, SamplingPM, FormatType
+from .contexts import DEFAULT_CONTEXT_FIELDS
+
+
+def _get_default_handler_dicts() -> dict[str, dict[str, Any]]:
+    """Get default log handlers as raw dictionaries (same as `model_dump(exclude_unset=True)` of models),
+    so they can be merged with user handlers and validated only once.
+
+    Returns:
+        dict[str, dict[str, Any]]: Default handlers as dictionary of dictionaries.
+    """
+
+    _handler_dicts: dict[str, dict[str, Any]] = {
+        DEFAULT_STD_HANDLER_NAME: {
+            "type_": LogHandlerTypeEnum.STD,
+            "format": (
+                "[<c>{time:YYYY-MM-DD HH:mm:ss.SSS Z}</c> | <level>{extra[level_short]:<5}</level> |"
+                " <w>{name}:{line}</w>]: <level>{message}</level>"
+            ),
+            "colorize": True,
+        },
+        DEFAULT_FILE_HANDLER_NAME: {
+            "enabled": False,
+            "type_": LogHandlerTypeEnum.FILE,
+            "sink": "{app_name}.all.log",
+        },
+        DEFAULT_ERR_FILE_HANDLER_NAME: {
+            "enabled": False,
+            "type_": LogHandlerTypeEnum.FILE,
+            "sink": "{app_name}.err.log",
+            "error": True,
+        },
+        DEFAULT_JSON_HANDLER_NAME: {
+            "enabled": False,
+            "type_": LogHandlerTypeEnum.FILE,
+            "sink": "json/{app_name}.all.json.log",
+            "serialize": True,
+        },
+        DEFAULT_ERR_JSON_HANDLER_NAME: {
+            "enabled": False,
+            "type_": LogHandlerTypeEnum.FILE,
+            "sink": "json/{app_name}.err.json.log",
+            "serialize": True,
+            "error": True,
+        },
+    }
+
+    return _handler_dicts
 
 
 def get_default_handlers() -> dict[str, LogHandlerPM]:
@@ -25,38 +86,8 @@ def get_default_handlers() -> dict[str, LogHandlerPM]:
     """
 
     _log_handlers: dict[str, LogHandlerPM] = {
-        DEFAULT_STD_HANDLER_NAME: LogHandlerPM(
-            type_=LogHandlerTypeEnum.STD,
-            format_=(
-                "[<c>{time:YYYY-MM-DD HH:mm:ss.SSS Z}</c> | <level>{extra[level_short]:<5}</level> |"
-                " <w>{name}:{line}</w>]: <level>{message}</level>"
-            ),
-            colorize=True,
-        ),
-        DEFAULT_FILE_HANDLER_NAME: LogHandlerPM(
-            enabled=False,
-            type_=LogHandlerTypeEnum.FILE,
-            sink="{app_name}.all.log",
-        ),
-        DEFAULT_ERR_FILE_HANDLER_NAME: LogHandlerPM(
-            enabled=False,
-            type_=LogHandlerTypeEnum.FILE,
-            sink="{app_name}.err.log",
-            error=True,
-        ),
-        DEFAULT_JSON_HANDLER_NAME: LogHandlerPM(
-            enabled=False,
-            type_=LogHandlerTypeEnum.FILE,
-            sink="json/{app_name}.all.json.log",
-            serialize=True,
-        ),
-        DEFAULT_ERR_JSON_HANDLER_NAME: LogHandlerPM(
-            enabled=False,
-            type_=LogHandlerTypeEnum.FILE,
-            sink="json/{app_name}.err.json.log",
-            serialize=True,
-            error=True,
-        ),
+        _key: LogHandlerPM(**_handler_dict)
+        for _key, _handler_dict in _get_default_handler_dicts().items()
     }
 
     return _log_handlers
@@ -72,7 +103,15 @@ class FileConfigPM(ExtraBaseModel):
         default=10_000_000, ge=1_000, lt=1_000_000_000  # 10MB = 10 * 1000 * 1000
     )
     rotate_time: datetime.time = Field(default_factory=lambda: datetime.time(0, 0, 0))
+    rotate_interval: datetime.timedelta | None = Field(
+        default=None, gt=datetime.timedelta(0)
+    )
+    rotate_shared: bool = Field(default=False)
+    index_every: int | None = Field(default=1_000, ge=1)
     retention: int = Field(default=90, ge=1)
+    compression: CompressionEnum | None = Field(default=None)
+    compression_level: int | None = Field(default=None, ge=0, le=22)
+    compression_workers: int = Field(default=1, ge=1, le=32)
     encoding: str = Field(default="utf8", min_length=2, max_length=31)
 
     @field_validator("rotate_time", mode="before")
@@ -91,6 +130,32 @@ class FileConfigPM(ExtraBaseModel):
 
         return val
 
+    @model_validator(mode="after")
+    def _check_compression_level(self) -> Self:
+
+        if (self.compression is not None) and (self.compression_level is not None):
+            # Checked here, otherwise invalid level only fails in the worker thread on the first rotation:
+            _min_level, _max_level = COMPRESSION_LEVEL_RANGES[self.compression]
+            if not (_min_level <= self.compression_level <= _max_level):
+                raise ValueError(
+                    f"'compression_level' attribute value {self.compression_level} is invalid for "
+                    f"'{self.compression.value}' compression, must be between {_min_level} and {_max_level}!"
+                )
+
+        return self
+
+    @model_validator(mode="after")
+    def _check_rotate_shared(self) -> Self:
+
+        if self.rotate_shared and (fcntl is None):
+            # Shared rotation is coordinated by 'flock()' on the lock file, not available on Windows:
+            raise ValueError(
+                "'rotate_shared' attribute value True is invalid, requires 'fcntl' module which is not available "
+                "on this platform!"
+            )
+
+        return self
+
 
 class LevelConfigPM(ExtraBaseModel):
     base: str | int | LogLevelEnum = Field(default=LogLevelEnum.INFO)
@@ -113,6 +178,30 @@ class InterceptConfigPM(ExtraBaseModel):
     mute_modules: list[str] = Field(default=[])
 
 
+class ContextConfigPM(ExtraBaseModel):
+    enabled: bool = Field(default=True)
+    fields: dict[str, str] = Field(default_factory=lambda: dict(DEFAULT_CONTEXT_FIELDS))
+    id_field: str | None = Field(default="request_id")
+
+    @model_validator(mode="after")
+    def _check_id_field(self) -> Self:
+
+        if (self.id_field is not None) and (self.id_field not in self.fields):
+            raise ValueError(
+                f"'id_field' attribute value '{self.id_field}' is invalid, must be one of {list(self.fields)}!"
+            )
+
+        return self
+
+
+class MetricsConfigPM(ExtraBaseModel):
+    enabled: bool = Field(default=False)
+    export_path: str | None = Field(default=None, min_length=1)
+    export_interval: float = Field(default=15.0, gt=0)
+    http_host: str = Field(default="127.0.0.1", min_length=1)
+    http_port: int | None = Field(default=None, ge=0, le=65_535)
+
+
 class ExtraConfigPM(ExtraBaseModel):
     pass
 
@@ -127,7 +216,11 @@ class LoggerConfigPM(ExtraBaseModel):
     )
     file: FileConfigPM = Field(default_factory=FileConfigPM)
     custom_serialize: bool = Field(default=False)
+    json_backend: JsonBackendEnum = Field(default=JsonBackendEnum.STDLIB)
     intercept: InterceptConfigPM = Field(default_factory=InterceptConfigPM)
+    context: ContextConfigPM = Field(default_factory=ContextConfigPM)
+    metrics: MetricsConfigPM = Field(default_factory=MetricsConfigPM)
+    sampling: SamplingPM | None = Field(default=None)
     global_extra: dict[str, str] = Field(
         default={
             "request_id": "",
@@ -135,17 +228,16 @@ class LoggerConfigPM(ExtraBaseModel):
             "user_id": "",
         }
     )
-    handlers: dict[str, LogHandlerPM] = Field(default_factory=get_default_handlers)
+    # Empty default is filled with default handlers by `_check_handlers()` (validate_default), built only once:
+    handlers: dict[str, LogHandlerPM] = Field(default_factory=dict)
     extra: ExtraConfigPM | None = Field(default_factory=ExtraConfigPM)
 
     @field_validator("handlers", mode="before")
     @classmethod
     def _check_handlers(cls, val: Any) -> dict[str, LogHandlerPM]:
 
-        _default_handlers = get_default_handlers()
-
         if not val:
-            val = _default_handlers
+            val = get_default_handlers()
             return val
 
         if not isinstance(val, dict):
@@ -165,13 +257,8 @@ class LoggerConfigPM(ExtraBaseModel):
                     by_alias=True, exclude_unset=True, exclude_none=True
                 )
 
-        _default_dict = {
-            _key: _handler.model_dump(
-                by_alias=True, exclude_unset=True, exclude_none=True
-            )
-            for _key, _handler in _default_handlers.items()
-        }
-
+        # Merge with raw default dictionaries, so each handler is validated only once:
+        _default_dict = _get_default_handler_dicts()
         if _default_dict != val:
             val = utils.deep_merge(_default_dict, val)
 
@@ -184,6 +271,8 @@ class LoggerConfigPM(ExtraBaseModel):
 __all__ = [
     "LoggerConfigPM",
     "InterceptConfigPM",
+    "ContextConfigPM",
+    "MetricsConfigPM",
     "FileConfigPM",
     "LevelConfigPM",
     "get_default_handlers",
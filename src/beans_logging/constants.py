@@ -25,8 +25,70 @@ class LogLevelEnum(str, Enum):
     EXCEPTION = "EXCEPTION"
 
 
+class JsonBackendEnum(str, Enum):
+    STDLIB = "STDLIB"
+    ORJSON = "ORJSON"
+    MSGSPEC = "MSGSPEC"
+
+
+class OverflowPolicyEnum(str, Enum):
+    BLOCK = "BLOCK"
+    DROP_OLDEST = "DROP_OLDEST"
+    DROP_NEWEST = "DROP_NEWEST"
+    DROP_BELOW_LEVEL = "DROP_BELOW_LEVEL"
+
+
+class CompressionEnum(str, Enum):
+    GZIP = "GZIP"
+    BZ2 = "BZ2"
+    XZ = "XZ"
+    ZSTD = "ZSTD"
+
+
+class SocketProtocolEnum(str, Enum):
+    TCP = "TCP"
+    UDP = "UDP"
+    UNIX = "UNIX"
+
+
+class FramingEnum(str, Enum):
+    NEWLINE = "NEWLINE"
+    LENGTH_PREFIXED = "LENGTH_PREFIXED"
+
+
+class SyslogFormatEnum(str, Enum):
+    RFC5424 = "RFC5424"
+    RFC3164 = "RFC3164"
+
+
+class ReportFormatEnum(str, Enum):
+    TABLE = "TABLE"
+    JSON = "JSON"
+
+
+# Valid (min, max) compression levels of each compression format:
+COMPRESSION_LEVEL_RANGES: dict[CompressionEnum, tuple[int, int]] = {
+    CompressionEnum.GZIP: (0, 9),
+    CompressionEnum.BZ2: (1, 9),
+    CompressionEnum.XZ: (0, 9),
+    CompressionEnum.ZSTD: (0, 22),
+}
+
+# Loguru file sink options, only valid with file path sinks:
+FILE_SINK_ATTRS = (
+    "rotation",
+    "retention",
+    "compression",
+    "delay",
+    "watch",
+    "mode",
+    "buffering",
+    "encoding",
+)
+
 DEFAULT_LOGURU_HANDLER_NAME = "loguru_std_handler"
 DEFAULT_NO_HANDLER_NAME_PREFIX = "log_handler_"
+DEFAULT_ALL_HANDLERS_NAME = "all_handlers"
 
 DEFAULT_STD_HANDLER_NAME = "std_handler"
 DEFAULT_FILE_HANDLER_NAME = "file_handler"
@@ -47,8 +109,18 @@ DEFAULT_HANDLER_NAMES = [
 __all__ = [
     "LogHandlerTypeEnum",
     "LogLevelEnum",
+    "JsonBackendEnum",
+    "OverflowPolicyEnum",
+    "CompressionEnum",
+    "SocketProtocolEnum",
+    "FramingEnum",
+    "SyslogFormatEnum",
+    "ReportFormatEnum",
+    "COMPRESSION_LEVEL_RANGES",
+    "FILE_SINK_ATTRS",
     "DEFAULT_LOGURU_HANDLER_NAME",
     "DEFAULT_NO_HANDLER_NAME_PREFIX",
+    "DEFAULT_ALL_HANDLERS_NAME",
     "DEFAULT_STD_HANDLER_NAME",
     "DEFAULT_FILE_HANDLER_NAME",
     "DEFAULT_ERR_FILE_HANDLER_NAME",
@@ -0,0 +1,224 @@
+import uuid
+import contextlib
+import contextvars
+from typing import TYPE_CHECKING
+from collections.abc import Iterator
+
+if TYPE_CHECKING:
+    from loguru import Record
+
+DEFAULT_CONTEXT_FIELDS: dict[str, str] = {
+    "request_id": "X-Request-ID",
+    "trace_id": "X-Trace-ID",
+    "user_id": "X-User-ID",
+}
+
+# One context variable for all fields, so each record costs only one lookup and each request only one set:
+_context_var: contextvars.ContextVar[dict[str, str] | None] = contextvars.ContextVar(
+    "beans_logging_context", default=None
+)
+
+
+class ContextFields:
+    """Context fields class which maps request header names into context fields.
+
+    Attributes:
+        fields   (dict[str, str]): Map of context field names to request header names.
+        id_field (str | None    ): Field to generate unique id (uuid4 hex) for, when its header is missing.
+
+    Methods:
+        from_asgi_headers(): Get context values from ASGI scope headers.
+        from_wsgi_environ(): Get context values from WSGI environ.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str] | None = None,
+        id_field: str | None = "request_id",
+    ) -> None:
+        """ContextFields constructor method.
+
+        Args:
+            fields   (dict[str, str] | None, optional): Map of context field names to request header names.
+                                                            Default is None, which means `DEFAULT_CONTEXT_FIELDS`.
+            id_field (str | None           , optional): Field to generate unique id for, when its header is
+                                                            missing. Default is 'request_id'.
+
+        Raises:
+            ValueError: If 'id_field' argument value is not one of the fields.
+        """
+
+        if fields is None:
+            fields = DEFAULT_CONTEXT_FIELDS
+
+        if (id_field is not None) and (id_field not in fields):
+            raise ValueError(
+                f"'id_field' argument value '{id_field}' is invalid, must be one of {list(fields)}!"
+            )
+
+        self.fields = dict(fields)
+        self.id_field = id_field
+
+        # Precomputed header keys, so each request only does dictionary lookups:
+        self._asgi_map = {
+            _header.lower().encode("latin-1"): _field
+            for _field, _header in self.fields.items()
+        }
+        self._wsgi_keys = [
+            (_field, "HTTP_" + _header.upper().replace("-", "_"))
+            for _field, _header in self.fields.items()
+        ]
+
+    def _fill_id(self, values: dict[str, str]) -> dict[str, str]:
+        if (self.id_field is not None) and (not values.get(self.id_field)):
+            values[self.id_field] = uuid.uuid4().hex
+
+        return values
+
+    def from_asgi_headers(self, headers: list[tuple[bytes, bytes]]) -> dict[str, str]:
+        """Get context values from ASGI scope headers.
+
+        Args:
+            headers (list[tuple[bytes, bytes]], required): ASGI scope headers (lower-cased names).
+
+        Returns:
+            dict[str, str]: Context values.
+        """
+
+        _values: dict[str, str] = {}
+        _asgi_map = self._asgi_map
+        for _name, _value in headers:
+            _field = _asgi_map.get(_name)
+            if _field is not None:
+                _values[_field] = _value.decode("latin-1")
+
+        return self._fill_id(_values)
+
+    def from_wsgi_environ(self, environ: dict[str, str]) -> dict[str, str]:
+        """Get context values from WSGI environ.
+
+        Args:
+            environ (dict[str, str], required): WSGI environ.
+
+        Returns:
+            dict[str, str]: Context values.
+        """
+
+        _values: dict[str, str] = {}
+        for _field, _key in self._wsgi_keys:
+            _value = environ.get(_key)
+            if _value:
+                _values[_field] = _value
+
+        return self._fill_id(_values)
+
+
+_default_fields = ContextFields()
+
+
+def get_context_fields() -> ContextFields:
+    """Get default context fields, configured by `LoggerLoader` from config.
+
+    Returns:
+        ContextFields: Default context fields.
+    """
+
+    return _default_fields
+
+
+def set_context_fields(fields: ContextFields) -> None:
+    """Set default context fields, used by middlewares without their own fields.
+
+    Args:
+        fields (ContextFields, required): Context fields.
+    """
+
+    global _default_fields
+    _default_fields = fields
+    return
+
+
+def get_context() -> dict[str, str]:
+    """Get context values of current context.
+
+    Returns:
+        dict[str, str]: Context values (copy).
+    """
+
+    return dict(_context_var.get() or {})
+
+
+def set_context(**values: str) -> contextvars.Token:
+    """Set context values of current context (e.g. request), replacing previous values.
+
+    Args:
+        **values (str, required): Context values.
+
+    Returns:
+        contextvars.Token: Token to reset context values with `reset_context()`.
+    """
+
+    return _context_var.set(values)
+
+
+def reset_context(token: contextvars.Token) -> None:
+    """Reset context values to previous values.
+
+    Args:
+        token (contextvars.Token, required): Token returned by `set_context()`.
+    """
+
+    _context_var.reset(token)
+    return
+
+
+@contextlib.contextmanager
+def context_scope(**values: str) -> Iterator[None]:
+    """Context manager to set context values, merged with current values, in the block.
+
+    Args:
+        **values (str, required): Context values.
+    """
+
+    _current = _context_var.get()
+    _token = _context_var.set({**_current, **values} if _current else values)
+    try:
+        yield
+    finally:
+        _context_var.reset(_token)
+
+
+def patch_context(record: "Record") -> "Record":
+    """Filter (or loguru patcher) for merging context values into record extra.
+
+    Values bound with `logger.bind()` or `logger.contextualize()` are kept, only missing or empty (global extra
+    default) values are filled.
+
+    Args:
+        record (Record, required): Log record as dictionary.
+
+    Returns:
+        Record: Log record as dictionary with context values.
+    """
+
+    _values = _context_var.get()
+    if _values:
+        _extra = record["extra"]
+        for _key, _value in _values.items():
+            if not _extra.get(_key):
+                _extra[_key] = _value
+
+    return record
+
+
+__all__ = [
+    "DEFAULT_CONTEXT_FIELDS",
+    "ContextFields",
+    "get_context_fields",
+    "set_context_fields",
+    "get_context",
+    "set_context",
+    "reset_context",
+    "context_scope",
+    "patch_context",
+]
@@ -0,0 +1,371 @@
+import os
+import atexit
+import weakref
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+
+if TYPE_CHECKING:
+    from loguru import Message, Record
+
+from .sinks import SinkWrapper
+from .formats import RECORD_KEYS, format_record
+
+
+class _SummaryMessage(str):
+    """Formatted summary message, with its record same as loguru message."""
+
+    record: dict[str, Any]
+
+
+class DeduplicatorSink(SinkWrapper):
+    """Sink class which writes summary records of deduplicator into the wrapped sink of the same handler.
+
+    Summaries of repeat runs which end by a new record are kept pending and written just before the next message,
+    so they keep the order when handler is enqueued. Summaries flushed after window expiry or on stop are written
+    immediately. Writes are serialized with a lock, because summaries are also written by the flusher thread, so
+    coroutine sinks (written by event loop tasks) are not supported.
+
+    Attributes:
+        sink      (Any                  ): Wrapped sink object with 'write()' method or callable.
+        format_   (str | Callable | None): Handler format to format summary records.
+        serialize (bool                 ): Whether summary records are serialized into json lines, same as
+                                            loguru 'serialize' handlers.
+
+    Methods:
+        write()        : Write pending summaries and message into wrapped sink.
+        add_summary()  : Add summary record to write before the next message.
+        write_pending(): Write pending summaries into wrapped sink.
+        stop()         : Write pending summaries and stop wrapped sink.
+    """
+
+    def __init__(
+        self,
+        sink: Any,
+        format_: str | Callable[["Record"], str] | None = None,
+        serialize: bool = False,
+    ) -> None:
+        """DeduplicatorSink constructor method.
+
+        Args:
+            sink      (Any                  , required): Sink object with 'write()' method or callable.
+            format_   (str | Callable | None, optional): Handler format to format summary records. Default is None.
+            serialize (bool                 , optional): Whether to serialize summary records into json lines.
+                                                            Default is False.
+
+        Raises:
+            TypeError: If 'sink' argument can't be wrapped, or is a coroutine function.
+        """
+
+        super().__init__(sink=sink)
+        if self.async_:
+            raise TypeError(
+                f"'sink' argument type {type(sink).__name__} is invalid, coroutine function sinks can't be "
+                "deduplicated!"
+            )
+
+        self.format_ = format_
+        self.serialize = serialize
+
+        self._lock = threading.Lock()
+        self._pending: list[dict[str, Any]] = []
+
+    def _write_pending(self) -> None:
+        """Write pending summaries, must be called with lock."""
+
+        _pending, self._pending = self._pending, []
+        for _record in _pending:
+            _message = _SummaryMessage(
+                format_record(_record, self.format_, serialize=self.serialize)
+            )
+            _message.record = _record
+            self._write(_message)
+
+    def write(self, message: "Message") -> None:
+        """Write pending summaries and message into wrapped sink.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        with self._lock:
+            if self._pending:
+                self._write_pending()
+
+            self._write(message)
+
+    def add_summary(self, record: dict[str, Any]) -> None:
+        """Add summary record to write before the next message.
+
+        Args:
+            record (dict[str, Any], required): Summary record.
+        """
+
+        with self._lock:
+            self._pending.append(record)
+
+    def write_pending(self) -> None:
+        """Write pending summaries into wrapped sink."""
+
+        with self._lock:
+            if self._pending:
+                self._write_pending()
+
+    def stop(self) -> None:
+        """Write pending summaries and stop wrapped sink, called by loguru when handler is removed."""
+
+        self.write_pending()
+        super().stop()
+
+
+class Deduplicator:
+    """Deduplicator class for collapsing consecutive identical log records of a handler into one summary record.
+
+    Records are identical when their level, name (module), line and message are same. Only the last record is
+    tracked, so memory is bounded and the check is a tuple comparison. The first record of a repeat run is kept,
+    following duplicates are suppressed until the window expires, then one summary record (with repeat count and
+    first/last timestamps) is written only into the same handler, through its sink wrapped by `wrap_sink()` (no
+    summaries are written without it). Pending summary is also flushed by a background thread after window expiry,
+    and on `stop()` (handler removal or exit).
+
+    Attributes:
+        _instances (WeakSet): Live deduplicators, re-initialized in the child process after fork.
+
+        window     (float                           ): Seconds to collapse identical records into one summary.
+        filter_    (Callable[[Record], bool] | None): Handler filter to check before deduplication.
+        name       (str | None                      ): Deduplicator name (handler name).
+        sink       (DeduplicatorSink | None         ): Handler sink to write summary records into.
+        repeated   (int                             ): Total number of suppressed repeated records.
+        summaries  (int                             ): Total number of written summary records.
+
+    Methods:
+        __call__() : Check if log record should be kept.
+        wrap_sink(): Wrap handler sink to write summary records into.
+        flush()    : Write pending summary record.
+        stop()     : Stop flusher thread and flush pending summary.
+        stats      : Counters of deduplicator (property).
+    """
+
+    _instances: "weakref.WeakSet[Deduplicator]" = weakref.WeakSet()
+
+    def __init__(
+        self,
+        window: float = 10.0,
+        filter_: Callable[["Record"], bool] | None = None,
+        name: str | None = None,
+    ) -> None:
+        """Deduplicator constructor method.
+
+        Args:
+            window  (float                           , optional): Seconds to collapse identical records into one
+                                                                    summary. Default is 10.0.
+            filter_ (Callable[[Record], bool] | None, optional): Handler filter to check before deduplication.
+                                                                    Default is None.
+            name    (str | None                      , optional): Deduplicator name. Default is None.
+
+        Raises:
+            ValueError: If 'window' argument value is not positive.
+        """
+
+        if window <= 0:
+            raise ValueError(
+                f"'window' argument value {window} is invalid, must be greater than 0!"
+            )
+
+        self.window = window
+        self.filter_ = filter_
+        self.name = name
+        self.sink: DeduplicatorSink | None = None
+        self.repeated = 0
+        self.summaries = 0
+
+        self._lock = threading.Lock()
+        self._key: tuple[int, str | None, int, str] | None = None
+        self._start_ts = 0.0
+        self._count = 0
+        self._last: "Record | None" = None
+        self._first_time: Any = None
+        self._init_flusher()
+
+        atexit.register(self.stop)
+        Deduplicator._instances.add(self)
+
+    def _init_flusher(self) -> None:
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        for _self in list(cls._instances):
+            # Locks and threads don't survive fork, flusher thread is started again lazily in the child process:
+            _self._lock = threading.Lock()
+            _self._init_flusher()
+
+    def _start_flusher(self) -> None:
+        with self._thread_lock:
+            if (self._thread is not None) or self._stop_event.is_set():
+                return
+
+            self._thread = threading.Thread(
+                target=self._flush_loop, name="beans-logging-dedup", daemon=True
+            )
+            self._thread.start()
+
+    def _flush_loop(self) -> None:
+        _interval = min(self.window, 1.0)
+        while not self._stop_event.wait(_interval):
+            if self._count and (self.window <= (monotonic() - self._start_ts)):
+                self.flush()
+
+    def _pop_summary(self) -> tuple["Record", int, Any] | None:
+        """Pop pending summary and reset repeat run, must be called with lock."""
+
+        _count = self._count
+        if not _count:
+            self._key = None
+            return None
+
+        _summary = (self._last, _count, self._first_time)
+        self._key = None
+        self._count = 0
+        self._last = None
+        return _summary  # type: ignore
+
+    def _make_summary(self, summary: tuple["Record", int, Any]) -> dict[str, Any]:
+        _record, _count, _first_time = summary
+        _last_time = _record["time"]
+        _suffix = f" (handler: {self.name})" if self.name else ""
+
+        # Summary looks like it is logged from the same call-site as repeated records:
+        _summary = {_key: _record[_key] for _key in RECORD_KEYS}
+        _summary.update(
+            message=(
+                f"Last message repeated {_count} times between "
+                f"{_first_time.isoformat(timespec='milliseconds')} and "
+                f"{_last_time.isoformat(timespec='milliseconds')}{_suffix}"
+            ),
+            extra={
+                **_record["extra"],
+                "repeat_count": _count,
+                "repeat_first": _first_time.isoformat(),
+                "repeat_last": _last_time.isoformat(),
+            },
+            exception=None,
+        )
+        return _summary
+
+    def __call__(self, record: "Record") -> bool:
+        """Check if log record should be kept, used as handler filter.
+
+        Args:
+            record (Record, required): Log record as dictionary.
+
+        Returns:
+            bool: True if record should be kept, False if filtered out or suppressed as repeated.
+        """
+
+        if (self.filter_ is not None) and (not self.filter_(record)):
+            return False
+
+        _key = (
+            record["level"].no,
+            record["name"],
+            record["line"],
+            record["message"],
+        )
+        _now = monotonic()
+        _summary = None
+        with self._lock:
+            if _key == self._key:
+                if (_now - self._start_ts) < self.window:
+                    if not self._count:
+                        self._first_time = record["time"]
+
+                    self._count += 1
+                    self._last = record
+                    self.repeated += 1
+                    if self._thread is None:
+                        self._start_flusher()
+
+                    return False
+
+            _summary = self._pop_summary()
+            self._key = _key
+            self._start_ts = _now
+
+        if (_summary is not None) and (self.sink is not None):
+            # Written just before this record, by the handler sink:
+            self.sink.add_summary(self._make_summary(_summary))
+            self.summaries += 1
+
+        return True
+
+    def wrap_sink(
+        self,
+        sink: Any,
+        format_: str | Callable[["Record"], str] | None = None,
+        serialize: bool = False,
+    ) -> DeduplicatorSink:
+        """Wrap handler sink to write summary records into, summaries are formatted same as the handler.
+
+        Args:
+            sink      (Any                  , required): Sink object with 'write()' method or callable.
+            format_   (str | Callable | None, optional): Handler format to format summary records. Default is None.
+            serialize (bool                 , optional): Whether to serialize summary records into json lines, for
+                                                            loguru 'serialize' handlers. Default is False.
+
+        Returns:
+            DeduplicatorSink: Sink which writes summaries and messages into the wrapped sink.
+        """
+
+        self.sink = DeduplicatorSink(sink=sink, format_=format_, serialize=serialize)
+        return self.sink
+
+    def flush(self) -> None:
+        """Write pending summary record, if there are suppressed repeated records."""
+
+        with self._lock:
+            _summary = self._pop_summary()
+
+        if (_summary is not None) and (self.sink is not None):
+            self.sink.add_summary(self._make_summary(_summary))
+            self.sink.write_pending()
+            self.summaries += 1
+
+        return
+
+    def stop(self) -> None:
+        """Stop flusher thread and flush pending summary, must be called before handler is removed."""
+
+        self._stop_event.set()
+        _thread = self._thread
+        if (
+            (_thread is not None)
+            and _thread.is_alive()
+            and (_thread is not threading.current_thread())
+        ):
+            _thread.join()
+
+        self.flush()
+        atexit.unregister(self.stop)
+        return
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "repeated": self.repeated,
+            "summaries": self.summaries,
+        }
+
+
+if hasattr(os, "register_at_fork"):
+    # Registered once per module, live deduplicators are tracked in a weak set:
+    os.register_at_fork(after_in_child=Deduplicator._after_fork)
+
+
+__all__ = [
+    "DeduplicatorSink",
+    "Deduplicator",
+]
@@ -1,9 +1,13 @@
 from typing import TYPE_CHECKING
+from collections.abc import Callable
 
 if TYPE_CHECKING:
     from loguru import Record
 
+from .contexts import patch_context
 from .constants import (
+    LogLevelEnum,
+    DEFAULT_ALL_HANDLERS_NAME,
     DEFAULT_STD_HANDLER_NAME,
     DEFAULT_FILE_HANDLER_NAME,
     DEFAULT_ERR_FILE_HANDLER_NAME,
@@ -12,146 +16,195 @@ from .constants import (
 )
 
 
-def add_level_short(record: "Record") -> "Record":
-    """Filter for adding short level name to log record.
+def _make_level_short(level_name: str) -> str:
+    if level_name == "SUCCESS":
+        return "OK"
+    elif level_name == "WARNING":
+        return "WARN"
+    elif level_name == "CRITICAL":
+        return "CRIT"
+    elif 5 < len(level_name):
+        return level_name[:5]
+
+    return level_name
+
+
+# Precomputed once, custom levels are added lazily by `get_level_short()`:
+_LEVEL_SHORT_MAP: dict[str, str] = {
+    _level.value: _make_level_short(_level.value) for _level in LogLevelEnum
+}
+
+
+def get_level_short(level_name: str) -> str:
+    """Get short level name (max 5 characters) from the precomputed table.
 
     Args:
-        record (Record, required): Log record as dictionary.
+        level_name (str, required): Loguru level name.
 
     Returns:
-        Record: Log record as dictionary with short level name.
+        str: Short level name.
     """
 
-    if "level_short" not in record["extra"]:
-        if record["level"].name == "SUCCESS":
-            record["extra"]["level_short"] = "OK"
-        elif record["level"].name == "WARNING":
-            record["extra"]["level_short"] = "WARN"
-        elif record["level"].name == "CRITICAL":
-            record["extra"]["level_short"] = "CRIT"
-        elif 5 < len(record["level"].name):
-            record["extra"]["level_short"] = record["level"].name[:5]
-        else:
-            record["extra"]["level_short"] = record["level"].name
-
-    return record
+    try:
+        return _LEVEL_SHORT_MAP[level_name]
+    except KeyError:
+        _level_short = _make_level_short(level_name)
+        _LEVEL_SHORT_MAP[level_name] = _level_short
+        return _level_short
 
 
-def all_handlers_filter(record: "Record") -> bool:
-    """Filter message for all handlers that use this filter.
+def add_level_short(record: "Record") -> "Record":
+    """Filter for adding short level name to log record.
 
     Args:
-        record (Record): Log record as dictionary.
+        record (Record, required): Log record as dictionary.
 
     Returns:
-        bool: False if record is disabled by extra 'disable_all_handlers' key, True otherwise.
+        Record: Log record as dictionary with short level name.
     """
 
-    record = add_level_short(record)
-
-    if record["extra"].get("disable_all_handlers", False):
-        return False
+    if "level_short" not in record["extra"]:
+        record["extra"]["level_short"] = get_level_short(record["level"].name)
 
-    return True
+    return record
 
 
-def std_filter(record: "Record") -> bool:
-    """Filter message for std handlers that use this filter.
+def patch_record(record: "Record") -> "Record":
+    """Filter for adding short level name and context values to log record.
 
     Args:
-        record (Record): Log record as dictionary.
+        record (Record, required): Log record as dictionary.
 
     Returns:
-        bool: False if record is disabled by extra 'disable_{DEFAULT_STD_HANDLER_NAME}' key, True otherwise.
+        Record: Log record as dictionary with short level name and context values.
     """
 
-    if not all_handlers_filter(record):
-        return False
-
-    if record["extra"].get(f"disable_{DEFAULT_STD_HANDLER_NAME}", False):
-        return False
+    return patch_context(add_level_short(record))
 
-    return True
 
+def build_filter(
+    *handler_names: str,
+    sampler: Callable[["Record"], bool] | None = None,
+    context: bool = False,
+) -> Callable[["Record"], bool]:
+    """Build compiled filter function for handlers.
+    Disable keys are precomputed once, so each record only costs O(1) checks.
 
-def file_filter(record: "Record") -> bool:
-    """Filter message for file handlers that use this filter.
+    Records are enriched with short level name (and context values) in the filter stage, instead of a global
+    loguru patcher, so patcher of the application is not replaced.
 
     Args:
-        record (Record): Log record as dictionary.
+        *handler_names (str                            , optional): Handler names to check 'disable_{handler_name}'
+                                                                        extra keys.
+        sampler        (Callable[[Record], bool] | None, optional): Sampler to check after disable keys
+                                                                        (e.g. `Sampler`). Default is None.
+        context        (bool                           , optional): Whether to merge request context values into
+                                                                        record extra. Default is False.
 
     Returns:
-        bool: False if record is disabled by extra 'disable_{DEFAULT_FILE_HANDLER_NAME}' key, True otherwise.
+        Callable[[Record], bool]: Filter function which returns False if record is disabled by extra
+                                    'disable_all_handlers' or 'disable_{handler_name}' keys or suppressed by
+                                    sampler, True otherwise.
     """
 
-    if not all_handlers_filter(record):
-        return False
+    _disable_keys = tuple(
+        dict.fromkeys(
+            f"disable_{_name}" for _name in (DEFAULT_ALL_HANDLERS_NAME, *handler_names)
+        )
+    )
 
-    if record["extra"].get(f"disable_{DEFAULT_FILE_HANDLER_NAME}", False):
-        return False
+    # Specialized closures for common key counts, so checks are inlined instead of a loop:
+    if len(_disable_keys) == 1:
+        (_key_0,) = _disable_keys
 
-    return True
+        def _filter(record: "Record") -> bool:
+            _extra = record["extra"]
+            if "level_short" not in _extra:
+                # Record extra is shared between handlers, so it is enriched only by the first handler:
+                _extra["level_short"] = get_level_short(record["level"].name)
 
+            if context:
+                patch_context(record)
 
-def err_file_filter(record: "Record") -> bool:
-    """Filter message for error file handlers that use this filter.
+            if (_key_0 in _extra) and _extra[_key_0]:
+                return False
 
-    Args:
-        record (Record): Log record as dictionary.
+            return True
 
-    Returns:
-        bool: False if record is disabled by extra 'disable_{DEFAULT_ERR_FILE_HANDLER_NAME}' key, True otherwise.
-    """
+    elif len(_disable_keys) == 2:
+        _key_0, _key_1 = _disable_keys
 
-    if not all_handlers_filter(record):
-        return False
+        def _filter(record: "Record") -> bool:
+            _extra = record["extra"]
+            if "level_short" not in _extra:
+                _extra["level_short"] = get_level_short(record["level"].name)
 
-    if record["extra"].get(f"disable_{DEFAULT_ERR_FILE_HANDLER_NAME}", False):
-        return False
+            if context:
+                patch_context(record)
 
-    return True
+            if ((_key_0 in _extra) and _extra[_key_0]) or (
+                (_key_1 in _extra) and _extra[_key_1]
+            ):
+                return False
 
+            return True
 
-def json_filter(record: "Record") -> bool:
-    """Filter message for json file handlers that use this filter.
+    else:
 
-    Args:
-        record (Record): Log record as dictionary.
+        def _filter(record: "Record") -> bool:
+            _extra = record["extra"]
+            if "level_short" not in _extra:
+                _extra["level_short"] = get_level_short(record["level"].name)
 
-    Returns:
-        bool: False if record is disabled by extra 'disable_{DEFAULT_JSON_HANDLER_NAME}' key, True otherwise.
-    """
+            if context:
+                patch_context(record)
+
+            for _key in _disable_keys:
+                if (_key in _extra) and _extra[_key]:
+                    return False
 
-    if not all_handlers_filter(record):
-        return False
+            return True
 
-    if record["extra"].get(f"disable_{DEFAULT_JSON_HANDLER_NAME}", False):
-        return False
+    if sampler is not None:
+        return apply_sampler(filter_=_filter, sampler=sampler)
 
-    return True
+    return _filter
 
 
-def err_json_filter(record: "Record") -> bool:
-    """Filter message for json error file handlers that use this filter.
+def apply_sampler(
+    filter_: Callable[["Record"], bool], sampler: Callable[["Record"], bool]
+) -> Callable[["Record"], bool]:
+    """Chain sampler after filter function, so disabled records don't consume sampling budget.
 
     Args:
-        record (Record): Log record as dictionary.
+        filter_ (Callable[[Record], bool], required): Filter function.
+        sampler (Callable[[Record], bool], required): Sampler to check after filter (e.g. `Sampler`).
 
     Returns:
-        bool: False if record is disabled by extra 'disable_{DEFAULT_ERR_JSON_HANDLER_NAME}' key, True otherwise.
+        Callable[[Record], bool]: Filter function which returns True only if both filter and sampler keep the record.
     """
 
-    if not all_handlers_filter(record):
-        return False
+    def _sampled_filter(record: "Record") -> bool:
+        return filter_(record) and sampler(record)
+
+    return _sampled_filter
 
-    if record["extra"].get(f"disable_{DEFAULT_ERR_JSON_HANDLER_NAME}", False):
-        return False
 
-    return True
+# Pre-built filters for default handlers:
+all_handlers_filter = build_filter()
+std_filter = build_filter(DEFAULT_STD_HANDLER_NAME)
+file_filter = build_filter(DEFAULT_FILE_HANDLER_NAME)
+err_file_filter = build_filter(DEFAULT_ERR_FILE_HANDLER_NAME)
+json_filter = build_filter(DEFAULT_JSON_HANDLER_NAME)
+err_json_filter = build_filter(DEFAULT_ERR_JSON_HANDLER_NAME)
 
 
 __all__ = [
+    "get_level_short",
     "add_level_short",
+    "patch_record",
+    "build_filter",
+    "apply_sampler",
     "all_handlers_filter",
     "std_filter",
     "file_filter",
@@ -1,10 +1,246 @@
+import re
 import json
+import datetime
+import functools
 import traceback
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
 
 if TYPE_CHECKING:
     from loguru import Record
 
+from loguru._handler import Handler as _LoguruHandler
+from loguru._datetime import datetime as _LoguruDatetime
+
+from .constants import JsonBackendEnum
+
+
+def get_json_dumps(backend: JsonBackendEnum | str) -> Callable[[Any], str]:
+    """Get json dumps function for the serializer backend.
+
+    Args:
+        backend (JsonBackendEnum | str, required): Json serializer backend.
+
+    Raises:
+        ImportError: If backend package is not installed.
+
+    Returns:
+        Callable[[Any], str]: Function to serialize object into json string.
+    """
+
+    backend = JsonBackendEnum(backend)
+    if backend == JsonBackendEnum.ORJSON:
+        try:
+            import orjson
+        except ImportError as err:
+            raise ImportError(
+                "'orjson' package is not installed, install it with 'pip install orjson'!"
+            ) from err
+
+        _option = orjson.OPT_NON_STR_KEYS
+
+        def _orjson_dumps(obj: Any) -> str:
+            return orjson.dumps(obj, default=str, option=_option).decode("utf-8")
+
+        return _orjson_dumps
+
+    elif backend == JsonBackendEnum.MSGSPEC:
+        try:
+            import msgspec
+        except ImportError as err:
+            raise ImportError(
+                "'msgspec' package is not installed, install it with 'pip install msgspec'!"
+            ) from err
+
+        _encoder = msgspec.json.Encoder(enc_hook=str)
+
+        def _msgspec_dumps(obj: Any) -> str:
+            return _encoder.encode(obj).decode("utf-8")
+
+        return _msgspec_dumps
+
+    return functools.partial(json.dumps, default=str)
+
+
+# Placeholders of process and thread parts, for backends which can't embed pre-encoded json:
+_JSON_PLACEHOLDERS = ("\x00process", "\x00thread")
+# Max cached (process, thread) parts, cleared after (e.g. short-lived threads):
+_MAX_JSON_CONSTANTS = 1_024
+
+
+def _get_json_raw(backend: JsonBackendEnum) -> Callable[[str], Any] | None:
+    """Get function to wrap pre-encoded json text, so the backend embeds it as it is.
+
+    Args:
+        backend (JsonBackendEnum, required): Json serializer backend.
+
+    Returns:
+        Callable[[str], Any] | None: Pre-encoded json wrapper, None if backend doesn't support it.
+    """
+
+    if backend == JsonBackendEnum.ORJSON:
+        import orjson
+
+        # 'orjson.Fragment' is available since orjson 3.9.16:
+        return getattr(orjson, "Fragment", None)
+
+    elif backend == JsonBackendEnum.MSGSPEC:
+        import msgspec
+
+        return msgspec.Raw
+
+    return None
+
+
+class JsonFormatter:
+    """Json formatter class for loguru logger with pluggable serializer backend.
+
+    Output has the same schema and key order as `json_format()`. Serialized record is attached to the record
+    itself (not `extra`) under a formatter specific key, so other handlers never see it and handlers sharing the
+    same formatter serialize each record only once. Constant process and thread parts are encoded once per
+    (process, thread) and spliced in, as raw json for orjson and msgspec, or by replacing a placeholder for stdlib.
+
+    Attributes:
+        backend    (JsonBackendEnum): Json serializer backend.
+        record_key (str            ): Record key to store serialized record.
+
+    Methods:
+        serialize(): Serialize log record into json string.
+        __call__() : Format log record for loguru logger.
+    """
+
+    def __init__(self, backend: JsonBackendEnum | str = JsonBackendEnum.STDLIB) -> None:
+        """JsonFormatter constructor method.
+
+        Args:
+            backend (JsonBackendEnum | str, optional): Json serializer backend. Default is 'STDLIB'.
+        """
+
+        self.backend = JsonBackendEnum(backend)
+        self.record_key = f"serialized_{id(self)}"
+
+        self._dumps = get_json_dumps(self.backend)
+        self._format = "{" + self.record_key + "}\n"
+        self._raw = _get_json_raw(self.backend)
+        self._placeholder: str | None = None
+        if self._raw is None:
+            self._placeholder = self._dumps(
+                {"process": _JSON_PLACEHOLDERS[0], "thread_name": _JSON_PLACEHOLDERS[1]}
+            )[1:-1]
+
+        self._constants: dict[tuple[int, str, int, str], tuple[Any, Any, str]] = {}
+
+    def _get_constants(self, record: "Record") -> tuple[Any, Any, str]:
+        """Get pre-encoded process and thread parts of log record.
+
+        Returns:
+            tuple[Any, Any, str]: Process and thread values to serialize, and encoded parts to replace placeholder.
+        """
+
+        _process, _thread = record["process"], record["thread"]
+        _key = (_process.id, _process.name, _thread.id, _thread.name)
+        _constants = self._constants.get(_key)
+        if _constants is not None:
+            return _constants
+
+        _process_dict = {"name": _process.name, "id": _process.id}
+        _thread_dict = {"name": _thread.name, "id": _thread.id}
+        if self._raw is not None:
+            _constants = (
+                self._raw(self._dumps(_process_dict)),
+                self._raw(self._dumps(_thread_dict)),
+                "",
+            )
+        else:
+            _constants = (
+                *_JSON_PLACEHOLDERS,
+                self._dumps({"process": _process_dict, "thread_name": _thread_dict})[
+                    1:-1
+                ],
+            )
+
+        if len(self._constants) >= _MAX_JSON_CONSTANTS:
+            self._constants.clear()
+
+        self._constants[_key] = _constants
+        return _constants
+
+    def serialize(self, record: "Record") -> str:
+        """Serialize log record into json string.
+
+        Args:
+            record (Record, required): Log record as dictionary.
+
+        Returns:
+            str: Serialized log record as json string.
+        """
+
+        _error = None
+        if record["exception"]:
+            _error = {}
+            _error_type, _error_value, _error_traceback = record["exception"]
+            if _error_type:
+                _error["type"] = _error_type.__name__
+            else:
+                _error["type"] = "None"
+
+            _error["value"] = str(_error_value)
+            _error["traceback"] = "".join(traceback.format_tb(_error_traceback))
+
+        _process, _thread, _encoded = self._get_constants(record)
+        _serialized = self._dumps(
+            {
+                "timestamp": record["time"].strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "level": record["level"].name,
+                "level_no": record["level"].no,
+                "file": record["file"].name,
+                "line": record["line"],
+                "name": record["name"],
+                "process": _process,
+                "thread_name": _thread,
+                "message": record["message"],
+                "extra": record["extra"] or None,
+                "error": _error,
+                "elapsed": str(record["elapsed"]),
+            }
+        )
+        if self._placeholder is not None:
+            # Placeholder is the first match, only time, level, file and module names are serialized before it:
+            return _serialized.replace(self._placeholder, _encoded, 1)
+
+        return _serialized
+
+    def __call__(self, record: "Record") -> str:
+        """Format log record for loguru logger.
+
+        Args:
+            record (Record, required): Log record as dictionary.
+
+        Returns:
+            str: Format for serialized log record.
+        """
+
+        if self.record_key not in record:
+            record[self.record_key] = self.serialize(record)  # type: ignore
+
+        return self._format
+
+
+@functools.lru_cache(maxsize=32)
+def get_json_formatter(
+    backend: JsonBackendEnum | str = JsonBackendEnum.STDLIB,
+) -> JsonFormatter:
+    """Get shared json formatter, so handlers with same settings serialize each record only once.
+
+    Args:
+        backend (JsonBackendEnum | str, optional): Json serializer backend. Default is 'STDLIB'.
+
+    Returns:
+        JsonFormatter: Shared json formatter instance.
+    """
+
+    return JsonFormatter(backend=backend)
+
 
 def json_format(record: "Record") -> str:
     """Custom json formatter for loguru logger.
@@ -16,44 +252,257 @@ def json_format(record: "Record") -> str:
         str: Format for serialized log record.
     """
 
-    _error = None
-    if record["exception"]:
-        _error = {}
-        _error_type, _error_value, _error_traceback = record["exception"]
-        if _error_type:
-            _error["type"] = _error_type.__name__
-        else:
-            _error["type"] = "None"
+    return get_json_formatter()(record)
+
+
+_TIME_FIELD_PATTERN = re.compile(r"\{time:([^{}]*)\}")
+_LEVEL_SHORT_FIELD = "{extra[level_short]:<5}"
+# Tokens which change within a second, or depend on more than offset of timezone:
+_UNCACHEABLE_TIME_TOKENS = ("SSSS", "X", "x", "zz", "[", "!", "%")
+_MILLISECONDS = tuple(f"{_ms:03d}" for _ms in range(1_000))
+
+
+class _TimeRenderer:
+    """Loguru time format renderer which renders second-resolution parts once per second.
+
+    Time format must contain 'SSS' (milliseconds) token once, parts before and after it are rendered by loguru and
+    cached for the current second and timezone offset, only milliseconds are patched in for each record.
+    """
+
+    def __init__(self, spec: str) -> None:
+        self.spec = spec
+        self.record_key = f"time_{id(self)}"
+
+        self._prefix_spec, self._suffix_spec = spec.split("SSS")
+        self._cache: tuple[Any, str, str] = (None, "", "")
+
+    def _render(self, dt: datetime.datetime, spec: str) -> str:
+        if not spec:
+            # Empty spec is ISO format in loguru:
+            return ""
+
+        return _LoguruDatetime.__format__(dt, spec)  # type: ignore
+
+    def __call__(self, dt: datetime.datetime) -> str:
+        _key = (dt.second, dt.minute, dt.hour, dt.day, dt.month, dt.year, dt.tzinfo)
+        _cache = self._cache
+        if _cache[0] != _key:
+            _cache = (
+                _key,
+                self._render(dt, self._prefix_spec),
+                self._render(dt, self._suffix_spec),
+            )
+            self._cache = _cache
+
+        return _cache[1] + _MILLISECONDS[dt.microsecond // 1000] + _cache[2]
+
+
+def _is_time_cacheable(spec: str) -> bool:
+    if spec.count("SSS") != 1:
+        return False
+
+    for _token in _UNCACHEABLE_TIME_TOKENS:
+        if _token in spec:
+            return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=32)
+def _get_time_renderer(spec: str) -> _TimeRenderer:
+    return _TimeRenderer(spec=spec)
+
+
+class TextFormatter:
+    """Text formatter class for loguru logger which caches rendered timestamp and level parts of text format.
+
+    `{time:...}` fields with milliseconds are rendered once per second (date, time and timezone), only milliseconds
+    are patched in for each record. Rendered time is attached to the record itself, so handlers with the same
+    time format render it only once per record. `{extra[level_short]:<5}` field is baked into one format per
+    level, so loguru colors and compiles each level's format only once. Output is same as the static format.
+
+    Attributes:
+        _MAX_CACHE_SIZE (int): Max number of cached level formats.
+
+        format_ (str ): Original loguru format.
+        cached  (bool): True if any part of format is cached, otherwise static format is faster.
+
+    Methods:
+        __call__(): Format log record for loguru logger.
+    """
+
+    _MAX_CACHE_SIZE = 64
+
+    def __init__(self, format_: str) -> None:
+        """TextFormatter constructor method.
+
+        Args:
+            format_ (str, required): Loguru format (e.g. '[{time:YYYY-MM-DD HH:mm:ss.SSS Z}]: {message}').
+        """
+
+        self.format_ = format_
+
+        self._renderers: list[_TimeRenderer] = []
+
+        def _replace_time(match: re.Match) -> str:
+            _spec = match.group(1)
+            if not _is_time_cacheable(_spec):
+                return match.group(0)
+
+            _renderer = _get_time_renderer(_spec)
+            if _renderer not in self._renderers:
+                self._renderers.append(_renderer)
+
+            return "{" + _renderer.record_key + "}"
+
+        # Dynamic formats are used as they are, so exception is added same as loguru does for static formats:
+        self._format = _TIME_FIELD_PATTERN.sub(_replace_time, format_) + "\n{exception}"
+        self._level_formats: dict[str, str] | None = None
+        if _LEVEL_SHORT_FIELD in self._format:
+            self._level_formats = {}
+
+        self.cached = bool(self._renderers) or (self._level_formats is not None)
+
+    def _get_level_format(self, level_short: str) -> str:
+        _level_formats: dict[str, str] = self._level_formats  # type: ignore
+        if any((_char in level_short) for _char in "{}<>\\"):
+            # Not safe as literal in format (braces or color tags):
+            return self._format
+
+        if self._MAX_CACHE_SIZE <= len(_level_formats):
+            _level_formats.clear()
+
+        _level_format = self._format.replace(_LEVEL_SHORT_FIELD, f"{level_short:<5}")
+        _level_formats[level_short] = _level_format
+        return _level_format
+
+    def __call__(self, record: "Record") -> str:
+        """Format log record for loguru logger.
+
+        Args:
+            record (Record, required): Log record as dictionary.
+
+        Returns:
+            str: Format for log record, with rendered time field.
+        """
+
+        for _renderer in self._renderers:
+            if _renderer.record_key not in record:
+                record[_renderer.record_key] = _renderer(record["time"])  # type: ignore
+
+        if self._level_formats is None:
+            return self._format
+
+        _level_short = record["extra"].get("level_short")
+        if _level_short is None:
+            return self._format
+
+        try:
+            return self._level_formats[_level_short]
+        except KeyError:
+            return self._get_level_format(_level_short)
+
+
+@functools.lru_cache(maxsize=32)
+def get_text_formatter(format_: str) -> TextFormatter:
+    """Get shared text formatter, so handlers with same format share cached parts.
+
+    Args:
+        format_ (str, required): Loguru format.
+
+    Returns:
+        TextFormatter: Shared text formatter instance.
+    """
+
+    return TextFormatter(format_=format_)
+
+
+# Loguru record keys, without keys attached by formatters:
+RECORD_KEYS = (
+    "time",
+    "level",
+    "name",
+    "module",
+    "function",
+    "line",
+    "file",
+    "process",
+    "thread",
+    "elapsed",
+    "message",
+    "extra",
+    "exception",
+)
+
+_MARKUP_PATTERN = re.compile(r"(\\*)(</?(?:[fb]g\s)?[^<>\s]*>)")
+
+
+def strip_markup(format_: str) -> str:
+    """Remove loguru color tags from format, escaped tags are kept as literal text.
+
+    Args:
+        format_ (str, required): Loguru format.
+
+    Returns:
+        str: Format without color tags.
+    """
+
+    def _replace(match: re.Match) -> str:
+        _slashes, _tag = match.groups()
+        if len(_slashes) % 2:
+            return _slashes[:-1] + _tag
+
+        return _slashes
+
+    return _MARKUP_PATTERN.sub(_replace, format_)
+
+
+def format_record(
+    record: dict[str, Any],
+    format_: str | Callable[["Record"], str] | None = None,
+    serialize: bool = False,
+) -> str:
+    """Format record dictionary outside of loguru handler (e.g. recorded or summary records), without colors.
+
+    Args:
+        record    (dict[str, Any]        , required): Record dictionary with loguru record keys.
+        format_   (str | Callable | None, optional): Loguru format or dynamic format function.
+                                                      Default is None ('{time} | {level} | {message}').
+        serialize (bool                  , optional): Whether to serialize formatted message with record into json
+                                                      line, same as loguru 'serialize' handlers. Default is False.
+
+    Returns:
+        str: Formatted message.
+    """
 
-        _error["value"] = str(_error_value)
-        _error["traceback"] = "".join(traceback.format_tb(_error_traceback))
+    _record = record
+    if record.get("exception") is None:
+        _record = {**record, "exception": ""}
 
-    _extra = None
-    if record["extra"] and (0 < len(record["extra"])):
-        _extra = record["extra"]
+    if format_ is None:
+        format_ = "{time} | {level} | {message}"
 
-    if _extra and ("serialized" in _extra):
-        del _extra["serialized"]
+    if callable(format_):
+        _format = format_(_record)  # type: ignore
+    else:
+        # Same as loguru static formats:
+        _format = format_ + "\n{exception}"
 
-    _json_record = {
-        "timestamp": record["time"].strftime("%Y-%m-%dT%H:%M:%S%z"),
-        "level": record["level"].name,
-        "level_no": record["level"].no,
-        "file": record["file"].name,
-        "line": record["line"],
-        "name": record["name"],
-        "process": {"name": record["process"].name, "id": record["process"].id},
-        "thread_name": {"name": record["thread"].name, "id": record["thread"].id},
-        "message": record["message"],
-        "extra": _extra,
-        "error": _error,
-        "elapsed": str(record["elapsed"]),
-    }
+    _message = strip_markup(_format).format_map(_record)
+    if serialize:
+        return _LoguruHandler._serialize_record(_message, record)
 
-    record["extra"]["serialized"] = json.dumps(_json_record)
-    return "{extra[serialized]}\n"
+    return _message
 
 
 __all__ = [
+    "RECORD_KEYS",
+    "strip_markup",
+    "format_record",
+    "TextFormatter",
+    "get_text_formatter",
+    "get_json_dumps",
+    "JsonFormatter",
+    "get_json_formatter",
     "json_format",
 ]
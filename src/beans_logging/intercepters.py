@@ -1,29 +1,50 @@
-import inspect
+import sys
 import logging
 from logging import LogRecord, Handler
+from typing import TYPE_CHECKING
 
 from loguru import logger
 from pydantic import validate_call
 
+if TYPE_CHECKING:
+    from loguru import Logger
+
 from .config import LoggerConfigPM
 
+_LOGGING_FILE = logging.__file__
+
 
 class InterceptHandler(Handler):
     """A handler class that intercepts logs from standard logging and redirects them to loguru logger.
 
+    Levels are mapped through a cache, and records below the current minimum level of all loguru handlers
+    (however they are added) are dropped before the message is formatted. Standard logging levels are not changed.
+
     Inherits:
         Handler: Handler class from standard logging.
 
+    Attributes:
+        _MAX_CACHE_SIZE (int): Max number of cached level names and depth loggers.
+
     Overrides:
         emit(): Handle intercepted log record.
     """
 
-    def emit(self, record: LogRecord) -> None:
-        """Handle intercepted log record.
+    _MAX_CACHE_SIZE = 256
 
-        Args:
-            record (LogRecord, required): Log needs to be handled.
-        """
+    def __init__(self, level: int | str = 0) -> None:
+        super().__init__(level=level)
+
+        # Loguru core is shared by all loguru loggers and keeps `min_level` updated on add/remove handlers:
+        self._core = getattr(logger, "_core", None)
+        self._levels_map: dict[str, str | int] = {}
+        self._depth_loggers: dict[int, "Logger"] = {}
+
+    def _get_level(self, record: LogRecord) -> str | int:
+        try:
+            return self._levels_map[record.levelname]
+        except KeyError:
+            pass
 
         # Get corresponding Loguru level if it exists.
         try:
@@ -31,16 +52,41 @@ class InterceptHandler(Handler):
         except ValueError:
             _level = record.levelno
 
-        # Find caller from where originated the logged message.
-        _frame, _depth = inspect.currentframe(), 0
-        while _frame and (_depth == 0 or _frame.f_code.co_filename == logging.__file__):
-            _frame = _frame.f_back
-            _depth += 1
+        if len(self._levels_map) < self._MAX_CACHE_SIZE:
+            self._levels_map[record.levelname] = _level
+
+        return _level
+
+    def emit(self, record: LogRecord) -> None:
+        """Handle intercepted log record.
+
+        Args:
+            record (LogRecord, required): Log needs to be handled.
+        """
 
-        logger.opt(depth=_depth, exception=record.exc_info).log(
-            _level, record.getMessage()
-        )
+        # Skip message formatting if no loguru handler would accept this level:
+        if (self._core is not None) and (record.levelno < self._core.min_level):
+            return
+
+        _level = self._get_level(record)
+
+        # Find caller from where originated the logged message, skipping this method's frame.
+        _frame, _depth = sys._getframe(1), 1
+        while _frame and (_frame.f_code.co_filename == _LOGGING_FILE):
+            _frame = _frame.f_back  # type: ignore
+            _depth += 1
 
+        if record.exc_info:
+            _logger = logger.opt(depth=_depth, exception=record.exc_info)
+        else:
+            try:
+                _logger = self._depth_loggers[_depth]
+            except KeyError:
+                _logger = logger.opt(depth=_depth)
+                if len(self._depth_loggers) < self._MAX_CACHE_SIZE:
+                    self._depth_loggers[_depth] = _logger
+
+        _logger.log(_level, record.getMessage())
         return
 
 
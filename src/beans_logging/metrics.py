@@ -0,0 +1,516 @@
+import os
+import atexit
+import threading
+from time import perf_counter
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+if TYPE_CHECKING:
+    from loguru import Record, Message
+
+from .binary import BinaryFileSink, BINARY_RECORD_KEY
+from .sinks import SinkWrapper
+
+# Write latency histogram bucket upper bounds (seconds), last bucket is '+Inf':
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.000_01,
+    0.000_025,
+    0.000_05,
+    0.000_1,
+    0.000_25,
+    0.000_5,
+    0.001,
+    0.002_5,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+# Indexes of per-thread filter counters cell:
+_ACCEPTED = 0
+_FILTERED = 1
+
+
+class MetricsFilter:
+    """Filter class which counts accepted and filtered records of a handler filter.
+
+    Filters are called by logging threads outside of handler lock, so counters are kept per thread (no lock or
+    lost updates) and summed on read.
+
+    Attributes:
+        filter_ (Callable[[Record], bool] | None): Wrapped handler filter.
+        metrics (HandlerMetrics                  ): Handler metrics to count into.
+
+    Methods:
+        __call__(): Check if log record should be kept and count the decision.
+    """
+
+    def __init__(
+        self, filter_: Callable[["Record"], bool] | None, metrics: "HandlerMetrics"
+    ) -> None:
+        self.filter_ = filter_
+        self.metrics = metrics
+
+    def __call__(self, record: "Record") -> bool:
+        _cell = self.metrics._get_cell()
+        if (self.filter_ is None) or self.filter_(record):
+            _cell[_ACCEPTED] += 1
+            return True
+
+        _cell[_FILTERED] += 1
+        return False
+
+
+class MetricsSink(SinkWrapper):
+    """Sink class which measures written records, bytes and write latency of the wrapped sink.
+
+    Sinks are called under loguru handler lock (or by one writer thread), so counters are plain integers.
+
+    Attributes:
+        sink    (Any           ): Wrapped sink object with 'write()' method, coroutine function or callable.
+        metrics (HandlerMetrics): Handler metrics to count into.
+
+    Methods:
+        write()      : Write message into wrapped sink and measure it.
+        write_async(): Write message into wrapped coroutine sink and measure it.
+    """
+
+    def __init__(self, sink: Any, metrics: "HandlerMetrics") -> None:
+        """MetricsSink constructor method.
+
+        Args:
+            sink    (Any           , required): Sink object with 'write()' method, coroutine function or callable.
+            metrics (HandlerMetrics, required): Handler metrics to count into.
+
+        Raises:
+            TypeError: If 'sink' argument can't be wrapped.
+        """
+
+        super().__init__(sink=sink)
+        self.metrics = metrics
+        # Encoding to count bytes of non-ASCII messages:
+        self._encoding = self.encoding or "utf8"
+        self._binary = isinstance(sink, BinaryFileSink)
+
+    def _get_size(self, message: "Message") -> int:
+        if self._binary:
+            _frame = message.record.get(BINARY_RECORD_KEY)  # type: ignore
+            return len(_frame) if _frame else 0
+
+        if message.isascii():
+            return len(message)
+
+        return len(message.encode(self._encoding, errors="replace"))
+
+    def _count(self, message: "Message", elapsed: float) -> None:
+        _metrics = self.metrics
+        _metrics.written += 1
+        if self._binary or (not message.isascii()):
+            _metrics.bytes_written += self._get_size(message)
+        else:
+            _metrics.bytes_written += len(message)
+
+        _metrics.latency_sum += elapsed
+        _metrics.latency_counts[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        return
+
+    def write(self, message: "Message") -> None:
+        """Write message into wrapped sink and measure written bytes and latency.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        _start = perf_counter()
+        self._write(message)
+        self._count(message, perf_counter() - _start)
+        return
+
+    async def write_async(self, message: "Message") -> None:
+        """Write message into wrapped coroutine sink and measure written bytes and latency.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        _start = perf_counter()
+        await self._write(message)
+        self._count(message, perf_counter() - _start)
+        return
+
+
+class HandlerMetrics:
+    """Handler metrics class which collects runtime counters of a handler.
+
+    Sinks of `logging.Handler` are written by loguru itself (not wrapped), only their accepted and filtered records
+    are counted.
+
+    Attributes:
+        name           (str        ): Handler name.
+        written        (int        ): Number of records written into sink.
+        bytes_written  (int        ): Number of bytes written into sink.
+        rotations      (int        ): Number of file rotations.
+        latency_sum    (float      ): Total write latency (seconds).
+        latency_counts (list[int]  ): Write latency counts per `LATENCY_BUCKETS` bucket (and '+Inf').
+        sink           (Any | None ): Outermost sink to read queue depth and drops from its 'stats'.
+
+    Methods:
+        wrap_filter()  : Wrap handler filter to count accepted and filtered records.
+        wrap_sink()    : Wrap sink to measure written records, bytes and latency.
+        wrap_rotation(): Wrap rotation function to count rotations.
+        stats          : Counters of handler (property).
+    """
+
+    def __init__(self, name: str) -> None:
+        """HandlerMetrics constructor method.
+
+        Args:
+            name (str, required): Handler name.
+        """
+
+        self.name = name
+        self.written = 0
+        self.bytes_written = 0
+        self.rotations = 0
+        self.latency_sum = 0.0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sink: Any = None
+
+        self._local = threading.local()
+        self._cells: list[list[int]] = []
+        self._cells_lock = threading.Lock()
+
+    def _get_cell(self) -> list[int]:
+        try:
+            return self._local.cell
+        except AttributeError:
+            pass
+
+        _cell = [0, 0]
+        with self._cells_lock:
+            self._cells.append(_cell)
+
+        self._local.cell = _cell
+        return _cell
+
+    def wrap_filter(self, filter_: Callable[["Record"], bool] | None) -> MetricsFilter:
+        """Wrap handler filter to count accepted and filtered records.
+
+        Args:
+            filter_ (Callable[[Record], bool] | None, required): Handler filter.
+
+        Returns:
+            MetricsFilter: Counting filter.
+        """
+
+        return MetricsFilter(filter_=filter_, metrics=self)
+
+    def wrap_sink(self, sink: Any) -> MetricsSink:
+        """Wrap sink to measure written records, bytes and latency.
+
+        Args:
+            sink (Any, required): Sink object with 'write()' method, coroutine function or callable.
+
+        Returns:
+            MetricsSink: Measuring sink, add its `as_sink()` into loguru.
+        """
+
+        self.sink = sink
+        return MetricsSink(sink=sink, metrics=self)
+
+    def wrap_rotation(self, rotation: Callable[..., bool]) -> Callable[..., bool]:
+        """Wrap rotation function to count rotations.
+
+        Args:
+            rotation (Callable[..., bool], required): Loguru rotation function.
+
+        Returns:
+            Callable[..., bool]: Counting rotation function.
+        """
+
+        def _rotation(message: "Message", file: Any) -> bool:
+            _should_rotate = rotation(message, file)
+            if _should_rotate:
+                self.rotations += 1
+
+            return _should_rotate
+
+        return _rotation
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._cells_lock:
+            _cells = list(self._cells)
+
+        _accepted = sum(_cell[_ACCEPTED] for _cell in _cells)
+        _filtered = sum(_cell[_FILTERED] for _cell in _cells)
+
+        _sink_stats: dict[str, Any] = {}
+        if self.sink is not None:
+            _sink_stats = getattr(self.sink, "stats", None) or {}
+
+        _queue_depth = _sink_stats.get("depth", _sink_stats.get("pending"))
+        if _queue_depth is None:
+            # Records in loguru queue (enqueue) or being written:
+            _queue_depth = max(0, _accepted - self.written)
+
+        _buckets: dict[str, int] = {}
+        _cumulative = 0
+        for _le, _count in zip(
+            (*(repr(_bucket) for _bucket in LATENCY_BUCKETS), "+Inf"),
+            self.latency_counts,
+        ):
+            _cumulative += _count
+            _buckets[_le] = _cumulative
+
+        return {
+            "accepted": _accepted,
+            "filtered": _filtered,
+            "written": self.written,
+            "bytes_written": self.bytes_written,
+            "rotations": self.rotations,
+            "queue_depth": _queue_depth,
+            "dropped": _sink_stats.get("dropped", 0),
+            "write_latency": {
+                "buckets": _buckets,
+                "sum": self.latency_sum,
+                "count": _cumulative,
+            },
+        }
+
+
+_COUNTERS: tuple[tuple[str, str, str], ...] = (
+    ("accepted", "records_accepted_total", "Records accepted by handler filter."),
+    ("filtered", "records_filtered_total", "Records rejected by handler filter."),
+    ("written", "records_written_total", "Records written into handler sink."),
+    ("bytes_written", "bytes_written_total", "Bytes written into handler sink."),
+    ("rotations", "rotations_total", "File rotations of handler."),
+    ("dropped", "records_dropped_total", "Records dropped by handler queue or buffer."),
+)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(
+    stats: dict[str, dict[str, Any]],
+    app_name: str | None = None,
+    prefix: str = "beans_logging",
+) -> str:
+    """Format handler stats in Prometheus text exposition format.
+
+    Args:
+        stats    (dict[str, dict[str, Any]], required): Handler name to `HandlerMetrics.stats` map.
+        app_name (str | None               , optional): Application name to add as 'app' label. Default is None.
+        prefix   (str                      , optional): Metric name prefix. Default is 'beans_logging'.
+
+    Returns:
+        str: Metrics in Prometheus text format.
+    """
+
+    _app_label = f'app="{_escape_label(app_name)}",' if app_name else ""
+    _labels = {
+        _name: f'{_app_label}handler="{_escape_label(_name)}"' for _name in stats
+    }
+
+    _lines: list[str] = []
+    for _key, _metric, _help in _COUNTERS:
+        _lines.append(f"# HELP {prefix}_{_metric} {_help}")
+        _lines.append(f"# TYPE {prefix}_{_metric} counter")
+        for _name, _stats in stats.items():
+            _lines.append(f"{prefix}_{_metric}{{{_labels[_name]}}} {_stats[_key]}")
+
+    _lines.append(f"# HELP {prefix}_queue_depth Records waiting to be written.")
+    _lines.append(f"# TYPE {prefix}_queue_depth gauge")
+    for _name, _stats in stats.items():
+        _lines.append(
+            f"{prefix}_queue_depth{{{_labels[_name]}}} {_stats['queue_depth']}"
+        )
+
+    _metric = f"{prefix}_write_latency_seconds"
+    _lines.append(f"# HELP {_metric} Write latency of handler sink.")
+    _lines.append(f"# TYPE {_metric} histogram")
+    for _name, _stats in stats.items():
+        _latency = _stats["write_latency"]
+        for _le, _count in _latency["buckets"].items():
+            _lines.append(f'{_metric}_bucket{{{_labels[_name]},le="{_le}"}} {_count}')
+
+        _lines.append(f"{_metric}_sum{{{_labels[_name]}}} {_latency['sum']!r}")
+        _lines.append(f"{_metric}_count{{{_labels[_name]}}} {_latency['count']}")
+
+    return "\n".join(_lines) + "\n"
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    server: "_MetricsHTTPServer"
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+
+        _body = self.server.collect().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(_body)))
+        self.end_headers()
+        self.wfile.write(_body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Requests are not logged, so scraping doesn't produce log records:
+        return
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    collect: Callable[[], str]
+
+
+class MetricsExporter:
+    """Metrics exporter class which periodically writes metrics into a file and/or serves them over local HTTP.
+
+    Attributes:
+        collect  (Callable[[], str]): Function to collect metrics in Prometheus text format.
+        path     (str | None       ): File path to write metrics into (atomically), None to disable.
+        interval (float            ): Seconds between file writes.
+        host     (str              ): HTTP server host.
+        port     (int | None       ): HTTP server port (0 for random port), None to disable.
+
+    Methods:
+        start()       : Start file writer thread and HTTP server.
+        write()       : Write metrics into file.
+        stop()        : Stop file writer thread and HTTP server, and write metrics last time.
+        server_address: HTTP server address (property).
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], str],
+        path: str | None = None,
+        interval: float = 15.0,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+    ) -> None:
+        """MetricsExporter constructor method.
+
+        Args:
+            collect  (Callable[[], str], required): Function to collect metrics in Prometheus text format.
+            path     (str | None       , optional): File path to write metrics into. Default is None.
+            interval (float            , optional): Seconds between file writes. Default is 15.0.
+            host     (str              , optional): HTTP server host. Default is '127.0.0.1'.
+            port     (int | None       , optional): HTTP server port. Default is None.
+
+        Raises:
+            ValueError: If 'interval' argument value is not positive.
+        """
+
+        if interval <= 0:
+            raise ValueError(
+                f"'interval' argument value {interval} is invalid, must be greater than 0!"
+            )
+
+        self.collect = collect
+        self.path = path
+        self.interval = interval
+        self.host = host
+        self.port = port
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._server: _MetricsHTTPServer | None = None
+        self._server_thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start file writer thread and HTTP server."""
+
+        if self.path:
+            _dir = os.path.dirname(self.path)
+            if _dir:
+                os.makedirs(_dir, exist_ok=True)
+
+            self._thread = threading.Thread(
+                target=self._write_loop, name="beans-logging-metrics", daemon=True
+            )
+            self._thread.start()
+
+        if self.port is not None:
+            self._server = _MetricsHTTPServer(
+                (self.host, self.port), _MetricsRequestHandler
+            )
+            self._server.collect = self.collect
+            self._server_thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="beans-logging-metrics-http",
+                daemon=True,
+            )
+            self._server_thread.start()
+
+        atexit.register(self.stop)
+        return
+
+    def _write_loop(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                pass
+
+    def write(self) -> None:
+        """Write metrics into file atomically, so readers never see partial file."""
+
+        if not self.path:
+            return
+
+        _tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(_tmp_path, "w", encoding="utf-8") as _file:
+            _file.write(self.collect())
+
+        os.replace(_tmp_path, self.path)
+        return
+
+    def stop(self) -> None:
+        """Stop file writer thread and HTTP server, and write metrics last time."""
+
+        self._stop_event.set()
+        if self._server is not None:
+            _server, self._server = self._server, None
+            _server.shutdown()
+            _server.server_close()
+
+        _thread, self._thread = self._thread, None
+        if _thread is not None:
+            if _thread.is_alive() and (_thread is not threading.current_thread()):
+                _thread.join()
+
+            try:
+                self.write()
+            except OSError:
+                pass
+
+        atexit.unregister(self.stop)
+        return
+
+    @property
+    def server_address(self) -> tuple[str, int] | None:
+        if self._server is None:
+            return None
+
+        return self._server.server_address[:2]  # type: ignore
+
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "MetricsFilter",
+    "MetricsSink",
+    "HandlerMetrics",
+    "format_prometheus",
+    "MetricsExporter",
+]
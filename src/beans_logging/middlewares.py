@@ -0,0 +1,139 @@
+from typing import Any
+from collections.abc import Callable, Iterable, Iterator, Awaitable, MutableMapping
+
+from .contexts import ContextFields, get_context_fields, set_context, reset_context
+
+_ASGIScope = MutableMapping[str, Any]
+_ASGIApp = Callable[
+    [_ASGIScope, Callable[[], Awaitable[Any]], Callable[[Any], Awaitable[None]]],
+    Awaitable[None],
+]
+_WSGIApp = Callable[[dict[str, Any], Callable[..., Any]], Iterable[bytes]]
+
+_ASGI_CONTEXT_TYPES = frozenset(("http", "websocket"))
+
+
+class ContextASGIMiddleware:
+    """ASGI middleware class which sets request context values from request headers for each request.
+
+    Attributes:
+        app    (ASGIApp             ): Wrapped ASGI application.
+        fields (ContextFields | None): Context fields, None to use default context fields from logger config.
+
+    Methods:
+        __call__(): Set context values, call wrapped application and reset context values.
+    """
+
+    def __init__(self, app: _ASGIApp, fields: ContextFields | None = None) -> None:
+        """ContextASGIMiddleware constructor method.
+
+        Args:
+            app    (ASGIApp             , required): ASGI application to wrap.
+            fields (ContextFields | None, optional): Context fields. Default is None, which means default context
+                                                        fields from logger config.
+        """
+
+        self.app = app
+        self.fields = fields
+
+    async def __call__(
+        self,
+        scope: _ASGIScope,
+        receive: Callable[[], Awaitable[Any]],
+        send: Callable[[Any], Awaitable[None]],
+    ) -> None:
+
+        if scope["type"] not in _ASGI_CONTEXT_TYPES:
+            await self.app(scope, receive, send)
+            return
+
+        _fields = self.fields or get_context_fields()
+        _token = set_context(**_fields.from_asgi_headers(scope.get("headers") or []))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_context(_token)
+
+
+class _ContextWSGIResponse:
+    """Response iterable wrapper which keeps context values while streaming and resets them on close."""
+
+    def __init__(self, iterable: Iterable[bytes], values: dict[str, str]) -> None:
+        self._iterable = iterable
+        self._values = values
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Servers may iterate the response after the application call returns, so context values are set again.
+        # Set and reset around each step, a token held across yields may be reset in another context:
+        _token = set_context(**self._values)
+        try:
+            _iterator = iter(self._iterable)
+        finally:
+            reset_context(_token)
+
+        while True:
+            _token = set_context(**self._values)
+            try:
+                _chunk = next(_iterator)
+            except StopIteration:
+                return
+            finally:
+                reset_context(_token)
+
+            yield _chunk
+
+    def close(self) -> None:
+        _close = getattr(self._iterable, "close", None)
+        if _close is not None:
+            _token = set_context(**self._values)
+            try:
+                _close()
+            finally:
+                reset_context(_token)
+
+
+class ContextWSGIMiddleware:
+    """WSGI middleware class which sets request context values from request headers for each request.
+
+    Attributes:
+        app    (WSGIApp             ): Wrapped WSGI application.
+        fields (ContextFields | None): Context fields, None to use default context fields from logger config.
+
+    Methods:
+        __call__(): Set context values, call wrapped application and reset context values.
+    """
+
+    def __init__(self, app: _WSGIApp, fields: ContextFields | None = None) -> None:
+        """ContextWSGIMiddleware constructor method.
+
+        Args:
+            app    (WSGIApp             , required): WSGI application to wrap.
+            fields (ContextFields | None, optional): Context fields. Default is None, which means default context
+                                                        fields from logger config.
+        """
+
+        self.app = app
+        self.fields = fields
+
+    def __call__(
+        self, environ: dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+
+        _fields = self.fields or get_context_fields()
+        _values = _fields.from_wsgi_environ(environ)
+        _token = set_context(**_values)
+        try:
+            _iterable = self.app(environ, start_response)
+        finally:
+            reset_context(_token)
+
+        if isinstance(_iterable, (list, tuple)):
+            return _iterable
+
+        return _ContextWSGIResponse(_iterable, _values)
+
+
+__all__ = [
+    "ContextASGIMiddleware",
+    "ContextWSGIMiddleware",
+]
@@ -0,0 +1,479 @@
+import json
+import threading
+from time import perf_counter
+from random import random
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+
+if TYPE_CHECKING:
+    from loguru import Record, Message
+
+from .constants import ReportFormatEnum
+from .sinks import SinkWrapper
+
+# Indexes of profile entry times:
+_FILTER = 0
+_FORMAT = 1
+_WRITE = 2
+
+_PHASES = ("filter", "format", "write")
+
+
+class ProfilerFilter:
+    """Filter class which decides sampling of log records and measures the wrapped handler filter.
+
+    Sampling decision is made once per record (by the first profiled handler) and cached in the record, so all
+    handlers profile the same records. Not sampled records only pay a record key lookup, and records while
+    profiler is disabled only pay the enabled flag check.
+
+    Attributes:
+        filter_    (Callable[[Record], bool] | None): Wrapped handler filter.
+        profiler   (Profiler                        ): Profiler to add measured times into.
+        handler    (str                             ): Handler name.
+        sync       (bool                            ): Whether sink is written by the logging thread, then the time
+                                                        between filter and sink write is measured as format time.
+        record_key (str                             ): Record key to store filter end time of sync handlers.
+
+    Methods:
+        __call__(): Check if log record should be kept and measure the filter of sampled records.
+    """
+
+    def __init__(
+        self,
+        filter_: Callable[["Record"], bool] | None,
+        profiler: "Profiler",
+        handler: str,
+        sync: bool = True,
+    ) -> None:
+        self.filter_ = filter_
+        self.profiler = profiler
+        self.handler = handler
+        self.sync = sync
+        self.record_key = f"profile_{id(self)}"
+
+    def __call__(self, record: "Record") -> bool:
+        _profiler = self.profiler
+        if not _profiler.enabled:
+            return (self.filter_ is None) or self.filter_(record)
+
+        _sampled = record.get(_profiler.record_key)
+        if _sampled is None:
+            _sampled = _profiler._sample(record)
+
+        if not _sampled:
+            return (self.filter_ is None) or self.filter_(record)
+
+        _start = perf_counter()
+        _keep = (self.filter_ is None) or self.filter_(record)
+        _end = perf_counter()
+        _profiler._add(record, self.handler, _FILTER, _end - _start)
+        if _keep and self.sync:
+            record[self.record_key] = _end  # type: ignore
+
+        return _keep
+
+
+class ProfilerFormat:
+    """Format class which measures the wrapped dynamic format function of sampled records.
+
+    Only used for enqueued (or ring buffered) handlers, sync handlers measure format time by the sink.
+
+    Attributes:
+        format_  (Callable[[Record], str]): Wrapped format function.
+        profiler (Profiler               ): Profiler to add measured times into.
+        handler  (str                    ): Handler name.
+
+    Methods:
+        __call__(): Get format template of log record and measure it for sampled records.
+    """
+
+    def __init__(
+        self, format_: Callable[["Record"], str], profiler: "Profiler", handler: str
+    ) -> None:
+        self.format_ = format_
+        self.profiler = profiler
+        self.handler = handler
+
+    def __call__(self, record: "Record") -> str:
+        if not record.get(self.profiler.record_key):
+            return self.format_(record)
+
+        _start = perf_counter()
+        _format = self.format_(record)
+        self.profiler._add(record, self.handler, _FORMAT, perf_counter() - _start)
+        return _format
+
+
+class ProfilerSink(SinkWrapper):
+    """Sink class which measures sink write (and format time of sync handlers) of sampled records.
+
+    Attributes:
+        sink       (Any       ): Wrapped sink object with 'write()' method, coroutine function or callable.
+        profiler   (Profiler  ): Profiler to add measured times into.
+        handler    (str       ): Handler name.
+        filter_key (str | None): Record key of filter end time (sync handlers), None to not measure format time.
+
+    Methods:
+        write()      : Write message into wrapped sink and measure it for sampled records.
+        write_async(): Write message into wrapped coroutine sink and measure it for sampled records.
+    """
+
+    def __init__(
+        self,
+        sink: Any,
+        profiler: "Profiler",
+        handler: str,
+        filter_key: str | None = None,
+    ) -> None:
+        """ProfilerSink constructor method.
+
+        Args:
+            sink       (Any       , required): Sink object with 'write()' method, coroutine function or callable.
+            profiler   (Profiler  , required): Profiler to add measured times into.
+            handler    (str       , required): Handler name.
+            filter_key (str | None, optional): Record key of filter end time. Default is None.
+
+        Raises:
+            TypeError: If 'sink' argument can't be wrapped.
+        """
+
+        super().__init__(sink=sink)
+        self.profiler = profiler
+        self.handler = handler
+        self.filter_key = filter_key
+
+    def write(self, message: "Message") -> None:
+        """Write message into wrapped sink and measure write time of sampled records.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        _record = message.record
+        if not _record.get(self.profiler.record_key):
+            self._write(message)
+            return
+
+        _start = perf_counter()
+        self._write(message)
+        _elapsed = perf_counter() - _start
+
+        _profiler = self.profiler
+        if self.filter_key is not None:
+            _filter_end = _record.get(self.filter_key)
+            if _filter_end is not None:
+                # Loguru formatting (template, colors, exception) and handler lock wait:
+                _profiler._add(_record, self.handler, _FORMAT, _start - _filter_end)
+
+        _profiler._add(_record, self.handler, _WRITE, _elapsed)
+        return
+
+    async def write_async(self, message: "Message") -> None:
+        """Write message into wrapped coroutine sink and measure write time of sampled records.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        _record = message.record
+        if not _record.get(self.profiler.record_key):
+            await self._write(message)
+            return
+
+        _start = perf_counter()
+        await self._write(message)
+        self.profiler._add(_record, self.handler, _WRITE, perf_counter() - _start)
+        return
+
+
+class Profiler:
+    """Profiler class which aggregates sampled wall time spent in handlers per call-site and per handler.
+
+    One of every N log records is randomly sampled, and filter, format and sink write times of each handler are
+    added into entries of (module, function, line, handler). Times of sync handlers are spent by the logging call
+    itself, enqueued (and ring buffered) handlers only spend filter and format time in the logging call, their
+    write time is spent by writer thread. Wrappers are installed once, records are sampled only while profiler is
+    enabled, so profiling can be started and stopped without rebuilding handlers. Sinks of `logging.Handler` are
+    not wrapped, only their filter (and dynamic format) time is profiled.
+
+    Attributes:
+        sample_rate (int ): Profile one of every N records.
+        max_entries (int ): Maximum number of (call-site, handler) entries, new entries are dropped after.
+        enabled     (bool): Whether records are sampled and profiled.
+        record_key  (str ): Record key to cache sampling decision.
+
+    Methods:
+        wrap_filter(): Wrap handler filter to decide sampling and measure filter time.
+        wrap_format(): Wrap dynamic format function to measure format time.
+        wrap_sink()  : Wrap sink to measure write time.
+        reset()      : Clear collected profile entries.
+        collect()    : Get top call-sites and handlers by total time.
+        report()     : Get profile report as table or JSON text.
+        stats        : Counters of profiler (property).
+    """
+
+    def __init__(
+        self, sample_rate: int = 100, max_entries: int = 10_000, enabled: bool = True
+    ) -> None:
+        """Profiler constructor method.
+
+        Args:
+            sample_rate (int , optional): Profile one of every N records. Default is 100.
+            max_entries (int , optional): Maximum number of (call-site, handler) entries. Default is 10_000.
+            enabled     (bool, optional): Whether records are sampled and profiled. Default is True.
+
+        Raises:
+            ValueError: If 'max_entries' argument value is not positive.
+        """
+
+        if max_entries < 1:
+            raise ValueError(
+                f"'max_entries' argument value {max_entries} is invalid, must be greater than 0!"
+            )
+
+        self.sample_rate = sample_rate
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.record_key = f"profiled_{id(self)}"
+
+        self._lock = threading.Lock()
+        self._sites: dict[tuple[str | None, str, int], int] = {}
+        self._entries: dict[tuple[str | None, str, int, str], list[float]] = {}
+        self._dropped = 0
+
+    def _sample(self, record: "Record") -> bool:
+        """Decide sampling of log record and cache it in the record, count the call-site of sampled record."""
+
+        # Random (not every Nth) sampling, so periodic logging patterns are not aliased:
+        _sampled = random() < self._probability
+        record[self.record_key] = _sampled  # type: ignore
+        if _sampled:
+            _site = (record["name"], record["function"], record["line"])
+            with self._lock:
+                self._sites[_site] = self._sites.get(_site, 0) + 1
+
+        return _sampled
+
+    def _add(self, record: "Record", handler: str, phase: int, elapsed: float) -> None:
+        """Add measured time of a sampled record into its (call-site, handler) entry."""
+
+        _key = (record["name"], record["function"], record["line"], handler)
+        with self._lock:
+            _entry = self._entries.get(_key)
+            if _entry is None:
+                if len(self._entries) >= self.max_entries:
+                    self._dropped += 1
+                    return
+
+                _entry = self._entries[_key] = [0, 0.0, 0.0, 0.0]
+
+            if phase == _FILTER:
+                _entry[0] += 1
+
+            _entry[phase + 1] += elapsed
+
+        return
+
+    def wrap_filter(
+        self,
+        filter_: Callable[["Record"], bool] | None,
+        handler: str,
+        sync: bool = True,
+    ) -> ProfilerFilter:
+        """Wrap handler filter to decide sampling and measure filter time.
+
+        Args:
+            filter_ (Callable[[Record], bool] | None, required): Handler filter.
+            handler (str                             , required): Handler name.
+            sync    (bool                            , optional): Whether sink is written by the logging thread.
+                                                                    Default is True.
+
+        Returns:
+            ProfilerFilter: Profiling filter.
+        """
+
+        return ProfilerFilter(
+            filter_=filter_, profiler=self, handler=handler, sync=sync
+        )
+
+    def wrap_format(
+        self, format_: Callable[["Record"], str], handler: str
+    ) -> ProfilerFormat:
+        """Wrap dynamic format function to measure format time.
+
+        Args:
+            format_ (Callable[[Record], str], required): Dynamic format function.
+            handler (str                    , required): Handler name.
+
+        Returns:
+            ProfilerFormat: Profiling format function.
+        """
+
+        return ProfilerFormat(format_=format_, profiler=self, handler=handler)
+
+    def wrap_sink(
+        self, sink: Any, handler: str, filter_key: str | None = None
+    ) -> ProfilerSink:
+        """Wrap sink to measure write time (and format time of sync handlers).
+
+        Args:
+            sink       (Any       , required): Sink object with 'write()' method, coroutine function or callable.
+            handler    (str       , required): Handler name.
+            filter_key (str | None, optional): Record key of filter end time. Default is None.
+
+        Returns:
+            ProfilerSink: Profiling sink, add its `as_sink()` into loguru.
+        """
+
+        return ProfilerSink(
+            sink=sink, profiler=self, handler=handler, filter_key=filter_key
+        )
+
+    def reset(self) -> None:
+        """Clear collected profile entries."""
+
+        with self._lock:
+            self._sites.clear()
+            self._entries.clear()
+            self._dropped = 0
+
+        return
+
+    def _make_row(self, label: str, samples: int, times: list[float]) -> dict[str, Any]:
+        _total = sum(times)
+        return {
+            "name": label,
+            "samples": samples,
+            **{f"{_phase}_seconds": _time for _phase, _time in zip(_PHASES, times)},
+            "total_seconds": _total,
+            "mean_seconds": (_total / samples) if samples else 0.0,
+            # Estimated time of all (not only sampled) records:
+            "estimated_seconds": _total * self._sample_rate,
+        }
+
+    def collect(self, top: int = 10) -> dict[str, Any]:
+        """Get top call-sites and handlers by total profiled time.
+
+        Args:
+            top (int, optional): Number of top call-sites and handlers. Default is 10.
+
+        Returns:
+            dict[str, Any]: Sample rate, number of sampled records, and 'call_sites' and 'handlers' rows with
+                                samples, filter, format, write, total, mean and estimated (all records) times.
+        """
+
+        with self._lock:
+            _site_counts = dict(self._sites)
+            _entries = [(_key, list(_entry)) for _key, _entry in self._entries.items()]
+
+        _sites: dict[tuple[str | None, str, int], list[float]] = {}
+        _handlers: dict[str, list[float]] = {}
+        _handler_samples: dict[str, int] = {}
+        for (_name, _function, _line, _handler), _entry in _entries:
+            _site_times = _sites.setdefault((_name, _function, _line), [0.0, 0.0, 0.0])
+            _handler_times = _handlers.setdefault(_handler, [0.0, 0.0, 0.0])
+            _handler_samples[_handler] = _handler_samples.get(_handler, 0) + int(
+                _entry[0]
+            )
+            for _i in range(len(_PHASES)):
+                _site_times[_i] += _entry[_i + 1]
+                _handler_times[_i] += _entry[_i + 1]
+
+        _site_rows = [
+            self._make_row(
+                label=f"{_name}:{_function}:{_line}",
+                samples=_site_counts.get((_name, _function, _line), 0),
+                times=_times,
+            )
+            for (_name, _function, _line), _times in _sites.items()
+        ]
+        _handler_rows = [
+            self._make_row(
+                label=_handler, samples=_handler_samples[_handler], times=_times
+            )
+            for _handler, _times in _handlers.items()
+        ]
+        _site_rows.sort(key=lambda _row: _row["total_seconds"], reverse=True)
+        _handler_rows.sort(key=lambda _row: _row["total_seconds"], reverse=True)
+
+        return {
+            "sample_rate": self._sample_rate,
+            "samples": sum(_site_counts.values()),
+            "call_sites": _site_rows[:top],
+            "handlers": _handler_rows[:top],
+        }
+
+    def report(
+        self,
+        top: int = 10,
+        format_: ReportFormatEnum | str = ReportFormatEnum.TABLE,
+    ) -> str:
+        """Get profile report of top call-sites and handlers as table or JSON text.
+
+        Args:
+            top     (int                   , optional): Number of top call-sites and handlers. Default is 10.
+            format_ (ReportFormatEnum | str, optional): Report format. Default is 'TABLE'.
+
+        Returns:
+            str: Profile report text.
+        """
+
+        format_ = ReportFormatEnum(format_)
+        _collected = self.collect(top=top)
+        if format_ == ReportFormatEnum.JSON:
+            return json.dumps(_collected, indent=2)
+
+        _lines = [
+            f"Profiled records: {_collected['samples']} (sample rate: 1/{_collected['sample_rate']})"
+        ]
+        for _title, _key in (
+            ("Top call-sites", "call_sites"),
+            ("Top handlers", "handlers"),
+        ):
+            _rows = _collected[_key]
+            _width = max([len(_title), *(len(_row["name"]) for _row in _rows)])
+            _lines.append("")
+            _lines.append(
+                f"{_title:<{_width}} {'samples':>8} {'filter_ms':>10} {'format_ms':>10} {'write_ms':>10} "
+                f"{'mean_us':>10} {'total_ms':>10} {'est_ms':>10}"
+            )
+            for _row in _rows:
+                _lines.append(
+                    f"{_row['name']:<{_width}} {_row['samples']:>8} "
+                    f"{_row['filter_seconds'] * 1e3:>10.3f} {_row['format_seconds'] * 1e3:>10.3f} "
+                    f"{_row['write_seconds'] * 1e3:>10.3f} {_row['mean_seconds'] * 1e6:>10.1f} "
+                    f"{_row['total_seconds'] * 1e3:>10.3f} {_row['estimated_seconds'] * 1e3:>10.3f}"
+                )
+
+        return "\n".join(_lines)
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, sample_rate: int) -> None:
+        if sample_rate < 1:
+            raise ValueError(
+                f"'sample_rate' argument value {sample_rate} is invalid, must be greater than 0!"
+            )
+
+        self._sample_rate = sample_rate
+        self._probability = 1.0 / sample_rate
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "samples": sum(self._sites.values()),
+                "entries": len(self._entries),
+                "dropped": self._dropped,
+            }
+
+
+__all__ = [
+    "ProfilerFilter",
+    "ProfilerFormat",
+    "ProfilerSink",
+    "Profiler",
+]
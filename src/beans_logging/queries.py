@@ -0,0 +1,491 @@
+import os
+import re
+import glob
+import json
+import mmap
+import bisect
+import datetime
+import functools
+from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+
+from .compressors import open_log_file
+
+INDEX_VERSION = 1
+
+_COMPRESSED_EXTS = (".gz", ".bz2", ".xz", ".zst")
+# Custom json format starts with timestamp string, loguru serialized json ends with time object:
+_CUSTOM_TIMESTAMP_PATTERN = re.compile(rb'^\{"timestamp": ?"([^"]+)"')
+_SERIALIZED_TIMESTAMP_PATTERN = re.compile(
+    rb'"timestamp": ?(-?[\d.]+(?:[eE][-+]?\d+)?)\}'
+)
+_SERIALIZED_TIME_KEY = b'"time": {'
+
+
+def get_index_path(path: str) -> str:
+    """Get sidecar index file path of log file, compressed files share the index of the original file.
+
+    Index file is hidden, so it never matches the retention glob patterns of rotated files.
+
+    Args:
+        path (str, required): Log file path.
+
+    Returns:
+        str: Sidecar index file path.
+    """
+
+    _dir, _file_name = os.path.split(os.path.abspath(path))
+    for _ext in _COMPRESSED_EXTS:
+        if _file_name.endswith(_ext):
+            _file_name = _file_name[: -len(_ext)]
+            break
+
+    return os.path.join(_dir, f".{_file_name}.idx")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(value: bytes) -> float:
+    return datetime.datetime.strptime(value.decode(), "%Y-%m-%dT%H:%M:%S%z").timestamp()
+
+
+def get_line_timestamp(line: bytes) -> float | None:
+    """Get timestamp of json log line without parsing the whole line.
+
+    Supports both custom json format (`json_format`) and loguru serialized json format.
+
+    Args:
+        line (bytes, required): Json log line.
+
+    Returns:
+        float | None: Epoch timestamp, or None if line has no timestamp.
+    """
+
+    _match = _CUSTOM_TIMESTAMP_PATTERN.match(line)
+    if _match:
+        try:
+            return _parse_timestamp(_match.group(1))
+        except ValueError:
+            return None
+
+    _pos = line.rfind(_SERIALIZED_TIME_KEY)
+    if _pos < 0:
+        return None
+
+    _match = _SERIALIZED_TIMESTAMP_PATTERN.search(line, _pos)
+    if _match:
+        return float(_match.group(1))
+
+    return None
+
+
+def _iter_lines(data: Any, start: int, end: int) -> Iterator[tuple[int, bytes]]:
+    _find = data.find
+    _pos = start
+    while _pos < end:
+        _line_end = _find(b"\n", _pos, end)
+        if _line_end < 0:
+            _line_end = end
+
+        yield _pos, data[_pos:_line_end]
+        _pos = _line_end + 1
+
+
+def _remove_orphan_indexes(dir_path: str) -> None:
+    for _index_path in glob.glob(os.path.join(glob.escape(dir_path), ".*.idx")):
+        _path = os.path.join(dir_path, os.path.basename(_index_path)[1:-4])
+        if not any(
+            os.path.exists(f"{_path}{_ext}") for _ext in ("",) + _COMPRESSED_EXTS
+        ):
+            try:
+                os.remove(_index_path)
+            except OSError:
+                pass
+
+    return
+
+
+def write_index(path: str, every: int = 1_000) -> str | None:
+    """Write sparse timestamp index (timestamp -> byte offset for every N records) of json log file.
+
+    Also removes indexes of log files which were already removed by retention.
+
+    Args:
+        path  (str, required): Json log file path (not compressed).
+        every (int, optional): Number of records between index entries. Default is 1000.
+
+    Raises:
+        ValueError: If 'every' argument value is less than 1.
+
+    Returns:
+        str | None: Sidecar index file path, or None if log file is empty.
+    """
+
+    if every < 1:
+        raise ValueError(
+            f"'every' argument value {every} is invalid, must be greater than 0!"
+        )
+
+    _entries: list[list[float | int]] = []
+    _first = _last = None
+    with open(path, "rb") as _file:
+        _size = os.fstat(_file.fileno()).st_size
+        if _size == 0:
+            return None
+
+        with mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ) as _mmap:
+            _count = 0
+            _last_line = b""
+            for _offset, _line in _iter_lines(_mmap, 0, _size):
+                if _count % every == 0:
+                    _timestamp = get_line_timestamp(_line)
+                    if _timestamp is not None:
+                        _entries.append([_timestamp, _offset])
+                        if _first is None:
+                            _first = _timestamp
+
+                _count += 1
+                _last_line = _line
+
+            _last = get_line_timestamp(_last_line)
+
+    _index_path = get_index_path(path)
+    _tmp_path = f"{_index_path}.tmp"
+    with open(_tmp_path, "w", encoding="utf8") as _index_file:
+        json.dump(
+            {
+                "version": INDEX_VERSION,
+                "every": every,
+                "size": _size,
+                "records": _count,
+                "first": _first,
+                "last": _last,
+                "entries": _entries,
+            },
+            _index_file,
+            separators=(",", ":"),
+        )
+
+    os.replace(_tmp_path, _index_path)
+    _remove_orphan_indexes(os.path.dirname(_index_path))
+    return _index_path
+
+
+def read_index(path: str) -> dict[str, Any] | None:
+    """Read sidecar index of log file.
+
+    Args:
+        path (str, required): Log file path.
+
+    Returns:
+        dict[str, Any] | None: Index as dictionary, or None if index doesn't exist or is invalid.
+    """
+
+    try:
+        with open(get_index_path(path), encoding="utf8") as _index_file:
+            _index = json.load(_index_file)
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(_index, dict)) or (_index.get("version") != INDEX_VERSION):
+        return None
+
+    return _index
+
+
+def make_rotation_indexer(
+    every: int = 1_000, compression: Callable[[str], None] | None = None
+) -> Callable[[str], None]:
+    """Make loguru 'compression' function which indexes rotated json log file before compressing it.
+
+    Args:
+        every       (int                        , optional): Number of records between index entries.
+                                                                Default is 1000.
+        compression (Callable[[str], None] | None, optional): Compression function to call after indexing.
+                                                                Default is None.
+
+    Returns:
+        Callable[[str], None]: Compression function for loguru.
+    """
+
+    def _index_rotated(path: str) -> None:
+        try:
+            write_index(path, every=every)
+        except OSError:
+            # Index is only an optimization, queries fall back to scanning:
+            pass
+
+        if compression is not None:
+            compression(path)
+
+        return
+
+    return _index_rotated
+
+
+def _get_fields(record: dict[str, Any]) -> tuple[int | None, str | None, Any]:
+    # Loguru serialized json has fields under 'record':
+    _record = record.get("record")
+    if isinstance(_record, dict) and ("text" in record):
+        return _record["level"]["no"], _record["name"], _record["extra"]
+
+    return record.get("level_no"), record.get("name"), record.get("extra")
+
+
+def _is_binary(path: str) -> bool:
+    with open_log_file(path) as _file:
+        _head = _file.read(1)
+
+    # Json lines start with '{', binary files start with length prefix of header frame:
+    return bool(_head) and (_head != b"{")
+
+
+class LogQuery:
+    """Log query class which searches json (or binary) log files by time range, level, logger name and extra.
+
+    Uncompressed json files are scanned through mmap, only lines in the time range are parsed. Rotated files with
+    sidecar index (written on rotation) are skipped when they are out of the time range, or binary-searched to
+    the start offset. Compressed files are read as streams.
+
+    Attributes:
+        since    (float | None     ): Min epoch timestamp (inclusive).
+        until    (float | None     ): Max epoch timestamp (inclusive).
+        level_no (int | None       ): Min level number.
+        name     (str | None       ): Logger name (module) or its parent package name.
+        extra    (dict[str, str]   ): Extra fields to match by string value.
+
+    Methods:
+        match()     : Check if parsed json log record matches level, name and extra filters.
+        search()    : Search log file and yield matched json lines.
+        search_all(): Search log files (sorted by modification time) and yield matched json lines.
+    """
+
+    def __init__(
+        self,
+        since: datetime.datetime | float | None = None,
+        until: datetime.datetime | float | None = None,
+        level_no: int | None = None,
+        name: str | None = None,
+        extra: dict[str, str] | None = None,
+    ) -> None:
+        """LogQuery constructor method.
+
+        Args:
+            since    (datetime | float | None, optional): Min datetime or epoch timestamp (inclusive). Naive
+                                                            datetime is local time. Default is None.
+            until    (datetime | float | None, optional): Max datetime or epoch timestamp (inclusive). Default
+                                                            is None.
+            level_no (int | None             , optional): Min level number. Default is None.
+            name     (str | None             , optional): Logger name (module) or its parent package name.
+                                                            Default is None.
+            extra    (dict[str, str] | None  , optional): Extra fields to match by string value. Default is None.
+        """
+
+        if isinstance(since, datetime.datetime):
+            since = since.timestamp()
+
+        if isinstance(until, datetime.datetime):
+            until = until.timestamp()
+
+        self.since = since
+        self.until = until
+        self.level_no = level_no
+        self.name = name
+        self.extra = extra or {}
+
+        self._parse = (level_no is not None) or bool(name) or bool(self.extra)
+        # Cheap pre-filter before parsing, only for values which are not escaped in json:
+        self._needles = [
+            _value.encode()
+            for _value in self.extra.values()
+            if _value.isascii()
+            and _value.isprintable()
+            and ('"' not in _value)
+            and ("\\" not in _value)
+        ]
+
+    def _in_range(self, timestamp: float | None) -> bool:
+        if timestamp is None:
+            return (self.since is None) and (self.until is None)
+
+        if (self.since is not None) and (timestamp < self.since):
+            return False
+
+        if (self.until is not None) and (self.until < timestamp):
+            return False
+
+        return True
+
+    def match(self, record: dict[str, Any]) -> bool:
+        """Check if parsed json log record matches level, name and extra filters.
+
+        Args:
+            record (dict[str, Any], required): Json log record.
+
+        Returns:
+            bool: True if record matches, False otherwise.
+        """
+
+        _level_no, _name, _extra = _get_fields(record)
+        if (self.level_no is not None) and (
+            (_level_no is None) or (_level_no < self.level_no)
+        ):
+            return False
+
+        if self.name and (
+            (not _name)
+            or ((_name != self.name) and (not _name.startswith(f"{self.name}.")))
+        ):
+            return False
+
+        if self.extra:
+            if not isinstance(_extra, dict):
+                return False
+
+            for _key, _value in self.extra.items():
+                if (_key not in _extra) or (str(_extra[_key]) != _value):
+                    return False
+
+        return True
+
+    def _match_line(self, line: bytes) -> bool:
+        if not self._in_range(get_line_timestamp(line)):
+            return False
+
+        if not self._parse:
+            return True
+
+        for _needle in self._needles:
+            if _needle not in line:
+                return False
+
+        try:
+            _record = json.loads(line)
+        except ValueError:
+            return False
+
+        return isinstance(_record, dict) and self.match(_record)
+
+    def _get_offsets(
+        self, index: dict[str, Any] | None, size: int
+    ) -> tuple[int, int] | None:
+        if (index is None) or (index.get("size") != size) or (not index["entries"]):
+            return 0, size
+
+        if (
+            (self.since is not None)
+            and (index["last"] is not None)
+            and (index["last"] < self.since)
+        ):
+            return None
+
+        if (
+            (self.until is not None)
+            and (index["first"] is not None)
+            and (self.until < index["first"])
+        ):
+            return None
+
+        _entries = index["entries"]
+        _timestamps = [_entry[0] for _entry in _entries]
+        _start, _end = 0, size
+        if self.since is not None:
+            # One more entry before, for records which are a bit out of order (e.g. multiple processes):
+            _i = bisect.bisect_left(_timestamps, self.since) - 2
+            if 0 <= _i:
+                _start = _entries[_i][1]
+
+        if self.until is not None:
+            _i = bisect.bisect_right(_timestamps, self.until) + 1
+            if _i < len(_entries):
+                _end = _entries[_i][1]
+
+        return _start, _end
+
+    def _search_binary(self, path: str) -> Iterator[bytes]:
+        from .binary import read_binary_records, to_json_record
+
+        for _record in read_binary_records(path):
+            if not self._in_range(_record["timestamp"]):
+                continue
+
+            _json_record = to_json_record(_record)
+            if self._parse and (not self.match(_json_record)):
+                continue
+
+            yield json.dumps(_json_record, default=str).encode()
+
+    def search(self, path: str) -> Iterator[bytes]:
+        """Search log file and yield matched json lines.
+
+        Args:
+            path (str, required): Json or binary log file path, compressed files are read as streams.
+
+        Yields:
+            bytes: Matched json line (without newline).
+        """
+
+        if _is_binary(path):
+            yield from self._search_binary(path)
+            return
+
+        _index = read_index(path)
+        if path.endswith(_COMPRESSED_EXTS):
+            if (_index is not None) and (
+                self._get_offsets(_index, _index.get("size", -1)) is None
+            ):
+                return
+
+            with open_log_file(path) as _file:
+                for _line in _file:
+                    _line = _line.rstrip(b"\r\n")
+                    if _line and self._match_line(_line):
+                        yield _line
+            return
+
+        with open(path, "rb") as _file:
+            _size = os.fstat(_file.fileno()).st_size
+            if _size == 0:
+                return
+
+            _offsets = self._get_offsets(_index, _size)
+            if _offsets is None:
+                return
+
+            with mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ) as _mmap:
+                for _, _line in _iter_lines(_mmap, *_offsets):
+                    if _line and self._match_line(_line):
+                        yield _line
+
+    def search_all(self, paths: Iterable[str]) -> Iterator[bytes]:
+        """Search log files (sorted by modification time, oldest first) and yield matched json lines.
+
+        Args:
+            paths (Iterable[str], required): Log file paths or glob patterns.
+
+        Yields:
+            bytes: Matched json line (without newline).
+        """
+
+        _paths: set[str] = set()
+        for _path in paths:
+            if glob.has_magic(_path):
+                _paths.update(glob.glob(_path))
+            else:
+                _paths.add(_path)
+
+        for _path in sorted(_paths, key=lambda _path: (os.path.getmtime(_path), _path)):
+            if os.path.basename(_path).startswith(".") or _path.endswith(".part"):
+                continue
+
+            yield from self.search(_path)
+
+
+__all__ = [
+    "INDEX_VERSION",
+    "get_index_path",
+    "get_line_timestamp",
+    "write_index",
+    "read_index",
+    "make_rotation_indexer",
+    "LogQuery",
+]
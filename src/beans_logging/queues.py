@@ -0,0 +1,481 @@
+import os
+import sys
+import errno
+import socket
+import hashlib
+import tempfile
+import struct
+import datetime
+import selectors
+import threading
+import traceback
+from typing import Any
+from collections.abc import Callable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+from .transports import BatchSink
+
+# Frame header: payload size (bytes) and record timestamp (seconds since epoch):
+_FRAME_HEADER = struct.Struct(">Id")
+# Unix socket path length limit is 104-108 bytes depending on platform:
+_MAX_SOCKET_PATH_LENGTH = 100
+
+
+def get_default_queue_path(logs_dir: str, app_name: str) -> str:
+    """Get default queue writer socket path in logs directory, or in temp directory if the path is too long.
+
+    Args:
+        logs_dir (str, required): Logs directory path.
+        app_name (str, required): Application name.
+
+    Returns:
+        str: Unix socket path, same for all processes with the same logs directory and app name.
+    """
+
+    _path = os.path.join(os.path.abspath(logs_dir), f".{app_name}.queue.sock")
+    if len(os.fsencode(_path)) <= _MAX_SOCKET_PATH_LENGTH:
+        return _path
+
+    _hash = hashlib.sha256(_path.encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"beans_logging-{_hash}.sock")
+
+
+class _QueuedMessage(str):
+    """Message received from queue, with minimal record for rotation functions."""
+
+    record: dict[str, Any]
+
+
+class _Connection:
+    __slots__ = ("buffer", "channel")
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.channel: str | None = None
+
+
+class QueueWriter:
+    """QueueWriter class which owns target sinks (e.g. log files) and writes records received from all processes.
+
+    One writer per socket path is elected with an exclusive file lock: the process which binds the Unix socket
+    becomes the writer, others connect to it as clients. A stale socket file (writer process is gone) is
+    replaced by the next process which needs the writer. Each client connection starts with a channel (handler
+    name) frame, following frames are written into the target sink registered for that channel.
+
+    Attributes:
+        _RECV_SIZE (int): Max bytes to read from a connection at once.
+
+        path    (str): Unix socket path.
+        written (int): Number of written records.
+        dropped (int): Number of records for channels without registered target.
+
+    Methods:
+        acquire()   : Get running writer of this process or start new one if there is no live writer.
+        register()  : Register target sink for channel.
+        unregister(): Unregister and stop target sink of channel, stop writer when there is no target left.
+        stop()      : Stop writer thread after writing already received records.
+    """
+
+    _RECV_SIZE = 262_144
+
+    _writers: dict[str, "QueueWriter"] = {}
+    _writers_lock = threading.Lock()
+
+    def __init__(self, path: str, listener: socket.socket) -> None:
+        """QueueWriter constructor method, use `acquire()` instead.
+
+        Args:
+            path     (str          , required): Unix socket path.
+            listener (socket.socket, required): Bound and listening Unix socket.
+        """
+
+        self.path = path
+        self.written = 0
+        self.dropped = 0
+
+        self._listener = listener
+        self._inode = os.stat(path).st_ino
+        self._targets: dict[str, Any] = {}
+        self._targets_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._selector = selectors.DefaultSelector()
+        self._thread = threading.Thread(
+            target=self._serve, name="beans-logging-queue-writer", daemon=True
+        )
+        self._thread.start()
+
+    @staticmethod
+    def _bind(path: str) -> socket.socket | None:
+        """Bind and listen Unix socket if there is no live writer, under exclusive file lock.
+
+        Args:
+            path (str, required): Unix socket path.
+
+        Returns:
+            socket.socket | None: Listening socket, None if another process is the writer.
+        """
+
+        _dir = os.path.dirname(path)
+        if _dir:
+            os.makedirs(_dir, exist_ok=True)
+
+        _lock_fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(_lock_fd, fcntl.LOCK_EX)
+
+            if os.path.exists(path):
+                _probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    _probe.connect(path)
+                    return None
+                except OSError:
+                    # Stale socket file of a dead writer:
+                    os.unlink(path)
+                finally:
+                    _probe.close()
+
+            _listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                _listener.bind(path)
+                _listener.listen(128)
+            except OSError as err:
+                _listener.close()
+                if err.errno == errno.EADDRINUSE:
+                    return None
+
+                raise
+
+            return _listener
+        finally:
+            os.close(_lock_fd)
+
+    @classmethod
+    def acquire(cls, path: str) -> "QueueWriter | None":
+        """Get running writer of this process or start new one if there is no live writer.
+
+        Args:
+            path (str, required): Unix socket path.
+
+        Returns:
+            QueueWriter | None: Writer of this process, None if another process is the writer.
+        """
+
+        with cls._writers_lock:
+            _writer = cls._writers.get(path)
+            if (_writer is not None) and (not _writer._stop_event.is_set()):
+                return _writer
+
+            _listener = cls._bind(path)
+            if _listener is None:
+                return None
+
+            _writer = cls(path=path, listener=_listener)
+            cls._writers[path] = _writer
+            return _writer
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        # Writer threads don't survive fork, child processes are clients of the parent's writer:
+        for _writer in cls._writers.values():
+            _writer._stop_event.set()
+            for _socket in (_writer._listener, _writer._wakeup_r, _writer._wakeup_w):
+                _socket.close()
+
+        cls._writers = {}
+        cls._writers_lock = threading.Lock()
+
+    def register(self, channel: str, target_factory: Callable[[], Any]) -> None:
+        """Register target sink for channel, target is created only in writer process.
+
+        Args:
+            channel        (str               , required): Channel (handler) name.
+            target_factory (Callable[[], Any] , required): Function to create target sink with 'write()' method.
+        """
+
+        with self._targets_lock:
+            if channel not in self._targets:
+                self._targets[channel] = target_factory()
+
+        return
+
+    def unregister(self, channel: str) -> None:
+        """Unregister and stop target sink of channel, stop writer when there is no target left.
+
+        Args:
+            channel (str, required): Channel (handler) name.
+        """
+
+        with self._targets_lock:
+            _empty = (channel in self._targets) and (len(self._targets) == 1)
+
+        if _empty:
+            self.stop()
+
+        with self._targets_lock:
+            _target = self._targets.pop(channel, None)
+
+        _stop = getattr(_target, "stop", None)
+        if callable(_stop):
+            _stop()
+
+        return
+
+    def _read(self, conn: socket.socket, state: _Connection) -> bool:
+        try:
+            _data = conn.recv(self._RECV_SIZE)
+        except BlockingIOError:
+            return False
+        except OSError:
+            _data = b""
+
+        if not _data:
+            self._selector.unregister(conn)
+            conn.close()
+            return False
+
+        state.buffer += _data
+        # Targets can't be stopped by `unregister()` while writing into them:
+        with self._targets_lock:
+            self._write_frames(state)
+
+        return True
+
+    def _write_frames(self, state: _Connection) -> None:
+        _buffer = state.buffer
+        _offset = 0
+        _header_size = _FRAME_HEADER.size
+        _buffer_size = len(_buffer)
+        while _header_size <= (_buffer_size - _offset):
+            _size, _timestamp = _FRAME_HEADER.unpack_from(_buffer, _offset)
+            _end = _offset + _header_size + _size
+            if _buffer_size < _end:
+                break
+
+            _payload = _buffer[_offset + _header_size : _end].decode(
+                "utf8", errors="replace"
+            )
+            _offset = _end
+            if state.channel is None:
+                state.channel = _payload
+                continue
+
+            _target = self._targets.get(state.channel)
+            if _target is None:
+                self.dropped += 1
+                continue
+
+            _message = _QueuedMessage(_payload)
+            _message.record = {
+                "time": datetime.datetime.fromtimestamp(_timestamp).astimezone()
+            }
+            try:
+                _target.write(_message)
+                self.written += 1
+            except Exception:
+                sys.stderr.write(
+                    "--- Logging error in beans-logging queue writer ---\n"
+                )
+                traceback.print_exc(file=sys.stderr)
+
+        del _buffer[:_offset]
+
+    def _serve(self) -> None:
+        _selector = self._selector
+        _selector.register(self._listener, selectors.EVENT_READ, None)
+        _selector.register(self._wakeup_r, selectors.EVENT_READ, False)
+        while not self._stop_event.is_set():
+            for _key, _ in _selector.select():
+                if _key.data is None:
+                    try:
+                        _conn, _ = self._listener.accept()
+                    except OSError:
+                        continue
+
+                    _conn.setblocking(False)
+                    _selector.register(_conn, selectors.EVENT_READ, _Connection())
+                elif _key.data is not False:
+                    self._read(_key.fileobj, _key.data)  # type: ignore
+
+        # Write already received records before closing, including not yet accepted connections:
+        self._listener.setblocking(False)
+        while True:
+            try:
+                _conn, _ = self._listener.accept()
+            except OSError:
+                break
+
+            _conn.setblocking(False)
+            _selector.register(_conn, selectors.EVENT_READ, _Connection())
+
+        for _key in list(_selector.get_map().values()):
+            if isinstance(_key.data, _Connection):
+                # Clients get EPIPE on next send and resend it to the next writer, already queued data is read:
+                try:
+                    _key.fileobj.shutdown(socket.SHUT_RD)  # type: ignore
+                except OSError:
+                    pass
+
+                while self._read(_key.fileobj, _key.data):  # type: ignore
+                    pass
+
+        for _key in list(_selector.get_map().values()):
+            _selector.unregister(_key.fileobj)
+            _key.fileobj.close()  # type: ignore
+
+        _selector.close()
+
+    def stop(self) -> None:
+        """Stop writer thread after writing already received records, and remove socket file."""
+
+        with self._writers_lock:
+            if self._stop_event.is_set():
+                return
+
+            self._stop_event.set()
+            if self._writers.get(self.path) is self:
+                self._writers.pop(self.path)
+
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            pass
+
+        if self._thread.is_alive() and (self._thread is not threading.current_thread()):
+            self._thread.join()
+
+        self._wakeup_w.close()
+        try:
+            if os.stat(self.path).st_ino == self._inode:
+                os.unlink(self.path)
+        except OSError:
+            pass
+
+        return
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "channels": len(self._targets),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=QueueWriter._after_fork)
+
+
+class QueueSink(BatchSink):
+    """Sink class which pushes records to the queue writer process over Unix socket (multi-process fan-in).
+
+    Logging threads only put messages into the bounded buffer, the sender thread frames them (size, timestamp and
+    text) and sends them in batches to the writer. If there is no live writer, this process becomes the writer
+    and creates the target sink (e.g. file sink with rotation), so only one process opens and rotates the files.
+
+    Attributes:
+        path           (str               ): Unix socket path of queue writer.
+        channel        (str               ): Channel (handler) name, selects target sink in the writer.
+        target_factory (Callable[[], Any] ): Function to create target sink when this process is the writer.
+
+    Methods:
+        stats: Counters of sink, including whether this process is the writer (property).
+    """
+
+    _THREAD_NAME = "beans-logging-queue-sender"
+
+    def __init__(
+        self,
+        path: str,
+        channel: str,
+        target_factory: Callable[[], Any],
+        **kwargs: Any,
+    ) -> None:
+        """QueueSink constructor method.
+
+        Args:
+            path           (str              , required): Unix socket path of queue writer.
+            channel        (str              , required): Channel (handler) name.
+            target_factory (Callable[[], Any], required): Function to create target sink with 'write()' method.
+            **kwargs       (Any              , optional): `BatchSink` arguments.
+
+        Raises:
+            OSError: If Unix sockets are not supported on this platform.
+        """
+
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Queue handler requires Unix domain sockets!")
+
+        self.path = os.path.abspath(path)
+        self.channel = channel
+        self.target_factory = target_factory
+        self._socket: socket.socket | None = None
+        self._writer: QueueWriter | None = None
+        super().__init__(**kwargs)
+
+    def _init_sender(self) -> None:
+        # Writer of the parent process is not inherited by forked child process:
+        self._writer = None
+        super()._init_sender()
+
+    def _encode(self, message: Any) -> bytes:
+        _data = str.__str__(message).encode("utf8", errors="replace")
+        return (
+            _FRAME_HEADER.pack(len(_data), message.record["time"].timestamp()) + _data
+        )
+
+    def _connect(self) -> None:
+        if self._writer is None:
+            self._writer = QueueWriter.acquire(self.path)
+            if self._writer is not None:
+                self._writer.register(self.channel, self.target_factory)
+
+        _socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            _socket.settimeout(self.timeout)
+            _socket.connect(self.path)
+            _channel = self.channel.encode("utf8")
+            _socket.sendall(_FRAME_HEADER.pack(len(_channel), 0.0) + _channel)
+        except Exception:
+            _socket.close()
+            # Writer may be gone, try to take over on next attempt:
+            if (self._writer is not None) and self._writer._stop_event.is_set():
+                self._writer = None
+
+            raise
+
+        self._socket = _socket
+
+    def _send(self, batch: list[bytes]) -> None:
+        self._socket.sendall(b"".join(batch))  # type: ignore
+
+    def _close(self) -> None:
+        if self._socket is not None:
+            _socket, self._socket = self._socket, None
+            _socket.close()
+
+    def stop(self) -> None:
+        """Stop sender thread after sending remaining messages, and stop target sink if this process is writer."""
+
+        super().stop()
+        if self._writer is not None:
+            _writer, self._writer = self._writer, None
+            _writer.unregister(self.channel)
+
+        return
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        return {**super().stats, "writer": int(self._writer is not None)}
+
+
+__all__ = [
+    "get_default_queue_path",
+    "QueueWriter",
+    "QueueSink",
+]
@@ -1,3 +1,4 @@
+import time
 import datetime
 from typing import TextIO, TYPE_CHECKING
 
@@ -8,35 +9,108 @@ if TYPE_CHECKING:
 class Rotator:
     """Rotator class for checking file size and time for rotation.
 
+    File size is tracked incrementally from the encoded message length and only re-synced with the real
+    file size when a new file is opened (first message or after rotation), so there is no syscall per message.
+    When the file is shared by multiple processes, `sync_interval` also re-syncs the size periodically to count
+    messages written by other processes.
+
     Attributes:
-        _size_limit (int              ): File size limit for rotation.
-        _dt_limit   (datetime.datetime): Datetime when the log file should rotate.
+        _size_limit    (int               ): File size limit (bytes) for rotation.
+        _rotate_time   (datetime.time     ): Time of day to anchor rotation boundaries.
+        _interval      (datetime.timedelta): Interval between time based rotations.
+        _dt_limit      (datetime.datetime ): Datetime when the log file should rotate.
+        _ts_limit      (float             ): Cached `_dt_limit` as epoch timestamp.
+        _file          (TextIO | None     ): Currently tracked file.
+        _encoding      (str               ): Encoding of currently tracked file.
+        _size          (int               ): Bytes written into currently tracked file.
+        _sync_interval (float | None      ): Interval (seconds) to re-sync the size with the real file size.
+        _ts_sync       (float             ): Monotonic time of the next periodic re-sync.
 
     Methods:
         should_rotate(): Check if the log file should rotate.
     """
 
-    def __init__(self, *, rotate_size: int, rotate_time: datetime.time):
+    def __init__(
+        self,
+        *,
+        rotate_size: int,
+        rotate_time: datetime.time,
+        rotate_interval: datetime.timedelta | None = None,
+        sync_interval: float | None = None,
+    ):
         """Rotator constructor method.
 
         Args:
-            rotate_size (int,           required): File size limit for rotation.
-            rotate_time (datetime.time, required): Time when the log file should rotate.
+            rotate_size     (int                      , required): File size limit (bytes) for rotation.
+            rotate_time     (datetime.time            , required): Time when the log file should rotate.
+            rotate_interval (datetime.timedelta | None, optional): Interval between rotations anchored at
+                                                                    `rotate_time` (e.g. hourly). Default is None,
+                                                                    which means daily.
+            sync_interval   (float | None             , optional): Interval (seconds) to re-sync the size with the
+                                                                    real file size, for files shared by multiple
+                                                                    processes. Default is None, which means only
+                                                                    when a new file is opened.
         """
 
-        _current_dt = datetime.datetime.now()
+        if rotate_interval is None:
+            rotate_interval = datetime.timedelta(days=1)
+
+        if rotate_interval <= datetime.timedelta(0):
+            raise ValueError(
+                f"'rotate_interval' argument value '{rotate_interval}' is invalid, must be positive!"
+            )
+
+        if (sync_interval is not None) and (sync_interval <= 0):
+            raise ValueError(
+                f"'sync_interval' argument value '{sync_interval}' is invalid, must be positive!"
+            )
 
         self._size_limit = rotate_size
-        self._dt_limit = _current_dt.replace(
-            hour=rotate_time.hour,
-            minute=rotate_time.minute,
-            second=rotate_time.second,
+        self._rotate_time = rotate_time
+        self._interval = rotate_interval
+        self._set_limit(datetime.datetime.now())
+
+        self._file: TextIO | None = None
+        self._encoding = "utf8"
+        self._size = 0
+        self._sync_interval = sync_interval
+        self._ts_sync = 0.0
+
+    def _set_limit(self, current_dt: datetime.datetime) -> None:
+        """Set next rotation datetime after current datetime.
+
+        Args:
+            current_dt (datetime.datetime, required): Current datetime.
+        """
+
+        _anchor_dt = current_dt.replace(
+            hour=self._rotate_time.hour,
+            minute=self._rotate_time.minute,
+            second=self._rotate_time.second,
+            microsecond=0,
         )
+        if current_dt < _anchor_dt:
+            _anchor_dt -= datetime.timedelta(days=1)
+
+        # The current time is already past the anchor time so it would rotate already.
+        # Skip to the next boundary to prevent an immediate rotation.
+        _intervals = (current_dt - _anchor_dt) // self._interval
+        self._dt_limit = _anchor_dt + (self._interval * (_intervals + 1))
+        self._ts_limit = self._dt_limit.timestamp()
 
-        if _current_dt >= self._dt_limit:
-            # The current time is already past the target time so it would rotate already.
-            # Add one day to prevent an immediate rotation.
-            self._dt_limit += datetime.timedelta(days=1)
+    def _sync(self, file: TextIO) -> None:
+        """Re-sync tracked size with the real file size, only when a new file is opened.
+
+        Args:
+            file (TextIO, required): The file to be logged.
+        """
+
+        file.seek(0, 2)
+        self._size = file.tell()
+        self._encoding = getattr(file, "encoding", None) or "utf8"
+        self._file = file
+        if self._sync_interval is not None:
+            self._ts_sync = time.monotonic() + self._sync_interval
 
     def should_rotate(self, message: "Message", file: TextIO) -> bool:
         """Check if the log file should rotate.
@@ -49,18 +123,27 @@ class Rotator:
             bool: True if the log file should rotate, False otherwise.
         """
 
-        file.seek(0, 2)
-        if file.tell() + len(message) > self._size_limit:
+        if file is not self._file:
+            self._sync(file)
+        elif (self._sync_interval is not None) and (time.monotonic() >= self._ts_sync):
+            self._sync(file)
+
+        if message.isascii() or isinstance(message, bytes):
+            _message_size = len(message)
+        else:
+            _message_size = len(message.encode(self._encoding, errors="replace"))
+
+        if self._size and (self._size + _message_size > self._size_limit):
+            self._file = None
             return True
 
-        _elapsed_timestamp = (
-            message.record["time"].timestamp() - self._dt_limit.timestamp()
-        )
-        if _elapsed_timestamp >= 0:
-            _elapsed_days = datetime.timedelta(seconds=_elapsed_timestamp).days
-            self._dt_limit += datetime.timedelta(days=_elapsed_days + 1)
+        _timestamp = message.record["time"].timestamp()
+        if _timestamp >= self._ts_limit:
+            self._set_limit(datetime.datetime.fromtimestamp(_timestamp))
+            self._file = None
             return True
 
+        self._size += _message_size
         return False
 
 
@@ -0,0 +1,280 @@
+import os
+import atexit
+import weakref
+import functools
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from loguru import Record
+
+from loguru import logger
+
+# Indexes of per call-site state list:
+_TOKENS = 0
+_LAST_TS = 1
+_COUNT = 2
+_SUPPRESSED = 3
+
+
+class Sampler:
+    """Sampler class for per call-site (module and line) rate limiting and 1-in-N sampling of log records.
+
+    Each call-site has a small state list (token bucket and counter), so the check is a dictionary lookup and
+    few arithmetic operations without lock. Counters may be slightly off under heavy concurrency, which is
+    acceptable for sampling. The decision is cached in the record itself, so handlers sharing the same sampler
+    check each record only once. Suppressed counts are reported periodically by a background thread.
+
+    Attributes:
+        _MAX_CALL_SITES (int    ): Max number of tracked call-sites, states are reset after report when exceeded.
+        _instances      (WeakSet): Live samplers, re-initialized in the child process after fork.
+
+        rate            (float | None  ): Max messages per second for each call-site (token bucket).
+        burst           (int           ): Max burst messages for each call-site.
+        every_n         (dict[int, int]): Level number to N map, keeps only 1-in-N messages of each call-site.
+        exempt_level_no (int           ): Level number to never sample at and above.
+        report_interval (float         ): Seconds between suppressed counts reports.
+        name            (str | None    ): Sampler name (handler name) to add into reports.
+        record_key      (str           ): Record key to cache sampling decision.
+        suppressed      (int           ): Total number of suppressed messages.
+
+    Methods:
+        __call__(): Check if log record should be kept.
+        report()  : Log and reset suppressed counts of call-sites.
+        stop()    : Stop reporter thread and report remaining suppressed counts.
+        stats     : Counters of sampler (property).
+    """
+
+    _instances: "weakref.WeakSet[Sampler]" = weakref.WeakSet()
+
+    _MAX_CALL_SITES = 65_536
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        every_n: dict[int, int] | None = None,
+        exempt_level_no: int = 40,
+        report_interval: float = 10.0,
+        name: str | None = None,
+    ) -> None:
+        """Sampler constructor method.
+
+        Args:
+            rate            (float | None          , optional): Max messages per second for each call-site.
+                                                                    Default is None (no rate limit).
+            burst           (int | None            , optional): Max burst messages for each call-site.
+                                                                    Default is None (same as 'rate', at least 1).
+            every_n         (dict[int, int] | None , optional): Level number to N map for 1-in-N sampling.
+                                                                    Default is None.
+            exempt_level_no (int                   , optional): Level number to never sample at and above.
+                                                                    Default is 40 (ERROR).
+            report_interval (float                 , optional): Seconds between suppressed counts reports.
+                                                                    Default is 10.0.
+            name            (str | None            , optional): Sampler name to add into reports. Default is None.
+
+        Raises:
+            ValueError: If 'rate' or 'report_interval' argument value is not positive.
+        """
+
+        if (rate is not None) and (rate <= 0):
+            raise ValueError(
+                f"'rate' argument value {rate} is invalid, must be greater than 0!"
+            )
+
+        if report_interval <= 0:
+            raise ValueError(
+                f"'report_interval' argument value {report_interval} is invalid, must be greater than 0!"
+            )
+
+        if burst is None:
+            burst = max(1, int(rate)) if rate else 1
+
+        self.rate = rate
+        self.burst = burst
+        self.every_n = dict(every_n or {})
+        self.exempt_level_no = exempt_level_no
+        self.report_interval = report_interval
+        self.name = name
+        self.record_key = f"sampled_{id(self)}"
+        self.suppressed = 0
+
+        self._states: dict[tuple[str | None, int], list[Any]] = {}
+        self._init_reporter()
+
+        atexit.register(self.stop)
+        Sampler._instances.add(self)
+
+    def _init_reporter(self) -> None:
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        for _self in list(cls._instances):
+            # Threads don't survive fork, reporter thread is started again lazily in the child process:
+            _self._init_reporter()
+
+    def _start_reporter(self) -> None:
+        with self._thread_lock:
+            if (self._thread is not None) or self._stop_event.is_set():
+                return
+
+            self._thread = threading.Thread(
+                target=self._report_loop, name="beans-logging-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def _report_loop(self) -> None:
+        while not self._stop_event.wait(self.report_interval):
+            self.report()
+
+    def _decide(self, record: "Record") -> bool:
+        _level_no = record["level"].no
+        if self.exempt_level_no <= _level_no:
+            return True
+
+        _key = (record["name"], record["line"])
+        _state = self._states.get(_key)
+        if _state is None:
+            _state = self._states.setdefault(_key, [self.burst, monotonic(), 0, 0])
+
+        _keep = True
+        _n = self.every_n.get(_level_no)
+        if _n is not None:
+            _keep = (_state[_COUNT] % _n) == 0
+            _state[_COUNT] += 1
+
+        if _keep and (self.rate is not None):
+            _now = monotonic()
+            _tokens = _state[_TOKENS] + ((_now - _state[_LAST_TS]) * self.rate)
+            if self.burst < _tokens:
+                _tokens = self.burst
+
+            _state[_LAST_TS] = _now
+            if _tokens < 1:
+                _keep = False
+                _state[_TOKENS] = _tokens
+            else:
+                _state[_TOKENS] = _tokens - 1
+
+        if _keep or record["extra"].get("sampling_report"):
+            return True
+
+        _state[_SUPPRESSED] += 1
+        self.suppressed += 1
+        if self._thread is None:
+            self._start_reporter()
+
+        return False
+
+    def __call__(self, record: "Record") -> bool:
+        """Check if log record should be kept, used inside handler filters.
+
+        Args:
+            record (Record, required): Log record as dictionary.
+
+        Returns:
+            bool: True if record should be kept, False if suppressed.
+        """
+
+        _record_key = self.record_key
+        if _record_key in record:
+            return record[_record_key]  # type: ignore
+
+        _decision = self._decide(record)
+        record[_record_key] = _decision  # type: ignore
+        return _decision
+
+    def report(self) -> None:
+        """Log and reset suppressed counts of call-sites."""
+
+        _suffix = f" (handler: {self.name})" if self.name else ""
+        for (_name, _line), _state in list(self._states.items()):
+            _count = _state[_SUPPRESSED]
+            if not _count:
+                continue
+
+            _state[_SUPPRESSED] -= _count
+            logger.bind(sampling_report=True).warning(
+                f"Suppressed {_count} messages from {_name}:{_line}{_suffix}"
+            )
+
+        if self._MAX_CALL_SITES < len(self._states):
+            self._states.clear()
+
+        return
+
+    def stop(self) -> None:
+        """Stop reporter thread and report remaining suppressed counts."""
+
+        self._stop_event.set()
+        _thread = self._thread
+        if (
+            (_thread is not None)
+            and _thread.is_alive()
+            and (_thread is not threading.current_thread())
+        ):
+            _thread.join()
+
+        self.report()
+        atexit.unregister(self.stop)
+        return
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "call_sites": len(self._states),
+            "suppressed": self.suppressed,
+        }
+
+
+if hasattr(os, "register_at_fork"):
+    # Registered once per module, live samplers are tracked in a weak set:
+    os.register_at_fork(after_in_child=Sampler._after_fork)
+
+
+@functools.lru_cache(maxsize=32)
+def get_sampler(
+    rate: float | None = None,
+    burst: int | None = None,
+    every_n: tuple[tuple[int, int], ...] = (),
+    exempt_level_no: int = 40,
+    report_interval: float = 10.0,
+    name: str | None = None,
+) -> Sampler:
+    """Get shared sampler, so handlers with same settings share call-site states and decisions.
+
+    Args:
+        rate            (float | None              , optional): Max messages per second for each call-site.
+                                                                    Default is None.
+        burst           (int | None                , optional): Max burst messages for each call-site.
+                                                                    Default is None.
+        every_n         (tuple[tuple[int, int], ...], optional): Level number and N pairs for 1-in-N sampling.
+                                                                    Default is ().
+        exempt_level_no (int                       , optional): Level number to never sample at and above.
+                                                                    Default is 40 (ERROR).
+        report_interval (float                     , optional): Seconds between suppressed counts reports.
+                                                                    Default is 10.0.
+        name            (str | None                , optional): Sampler name to add into reports. Default is None.
+
+    Returns:
+        Sampler: Shared sampler instance.
+    """
+
+    return Sampler(
+        rate=rate,
+        burst=burst,
+        every_n=dict(every_n),
+        exempt_level_no=exempt_level_no,
+        report_interval=report_interval,
+        name=name,
+    )
+
+
+__all__ = [
+    "Sampler",
+    "get_sampler",
+]
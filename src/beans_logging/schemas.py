@@ -21,7 +21,15 @@ else:
 
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
-from .constants import LogHandlerTypeEnum, LogLevelEnum
+from .constants import (
+    FILE_SINK_ATTRS,
+    LogHandlerTypeEnum,
+    LogLevelEnum,
+    OverflowPolicyEnum,
+    SocketProtocolEnum,
+    FramingEnum,
+    SyslogFormatEnum,
+)
 
 
 class ExtraBaseModel(BaseModel):
@@ -42,11 +50,18 @@ class _SupportsWrite(Protocol):
     def flush(self) -> Any: ...
 
 
+@runtime_checkable
+class _SupportsWriteStop(Protocol):
+    def write(self, __s: str) -> Any: ...
+    def stop(self) -> Any: ...
+
+
 _SinkType = Union[
     str,
     Path,
     TextIO,
     _SupportsWrite,
+    _SupportsWriteStop,
     Callable[[Any], Any],
     Callable[[Any], Awaitable[Any]],
     Handler,
@@ -111,13 +126,142 @@ class LoguruHandlerPM(ExtraBaseModel):
     encoding: str | None = Field(default=None)
 
 
+class BufferPM(ExtraBaseModel):
+    size: int = Field(default=65_536, ge=1)
+    interval: float = Field(default=0.5, gt=0)
+
+
+class RingBufferPM(ExtraBaseModel):
+    capacity: int = Field(default=8_192, ge=1)
+    policy: OverflowPolicyEnum = Field(default=OverflowPolicyEnum.BLOCK)
+    drop_level: str | int | LogLevelEnum = Field(default=LogLevelEnum.WARNING)
+
+
+class MemoryPM(ExtraBaseModel):
+    capacity: int = Field(default=10_000, ge=1)
+    dump_level: str | int | LogLevelEnum = Field(default=LogLevelEnum.ERROR)
+
+
+class TransportPM(ExtraBaseModel):
+    batch_size: int = Field(default=256, ge=1)
+    max_batch_bytes: int | None = Field(default=None, ge=1)
+    flush_interval: float = Field(default=0.0, ge=0)
+    capacity: int = Field(default=8_192, ge=1)
+    policy: OverflowPolicyEnum = Field(default=OverflowPolicyEnum.DROP_OLDEST)
+    timeout: float = Field(default=5.0, gt=0)
+    backoff_min: float = Field(default=0.1, gt=0)
+    backoff_max: float = Field(default=30.0, gt=0)
+
+    @model_validator(mode="after")
+    def _check_all(self) -> Self:
+
+        if self.backoff_max < self.backoff_min:
+            raise ValueError(
+                f"'backoff_min' attribute value {self.backoff_min} is invalid, must be less than or equal to "
+                f"'backoff_max' ({self.backoff_max})!"
+            )
+
+        return self
+
+
+class SocketPM(TransportPM):
+    protocol: SocketProtocolEnum = Field(default=SocketProtocolEnum.TCP)
+    host: str = Field(default="localhost", min_length=1)
+    port: int | None = Field(default=None, ge=1, le=65_535)
+    path: str | None = Field(default=None, min_length=1)
+    framing: FramingEnum = Field(default=FramingEnum.NEWLINE)
+
+    @model_validator(mode="after")
+    def _check_address(self) -> Self:
+
+        if (self.protocol == SocketProtocolEnum.UNIX) and (not self.path):
+            raise ValueError(
+                "'path' attribute is empty, required for 'UNIX' socket protocol!"
+            )
+
+        if (self.protocol != SocketProtocolEnum.UNIX) and (not self.port):
+            raise ValueError(
+                f"'port' attribute is empty, required for '{self.protocol.value}' socket protocol!"
+            )
+
+        return self
+
+
+class HttpPM(TransportPM):
+    url: str = Field(..., min_length=1)
+    method: str = Field(default="POST", min_length=1)
+    headers: dict[str, str] = Field(default_factory=dict)
+    compress_level: int | None = Field(default=6, ge=1, le=9)
+    content_type: str = Field(default="application/x-ndjson", min_length=1)
+    batch_size: int = Field(default=1_000, ge=1)
+    max_batch_bytes: int | None = Field(default=1_048_576, ge=1)
+    flush_interval: float = Field(default=1.0, ge=0)
+
+
+class SyslogPM(TransportPM):
+    syslog_format: SyslogFormatEnum = Field(default=SyslogFormatEnum.RFC5424)
+    protocol: SocketProtocolEnum = Field(default=SocketProtocolEnum.UNIX)
+    host: str = Field(default="localhost", min_length=1)
+    port: int = Field(default=514, ge=1, le=65_535)
+    path: str = Field(default="/dev/log", min_length=1)
+    facility: int = Field(default=1, ge=0, le=23)
+    sd_id: str = Field(default="extra@32473", min_length=1, max_length=32)
+
+
+class QueuePM(TransportPM):
+    path: str | None = Field(default=None, min_length=1)
+    batch_size: int = Field(default=1_024, ge=1)
+    capacity: int = Field(default=65_536, ge=1)
+    policy: OverflowPolicyEnum = Field(default=OverflowPolicyEnum.BLOCK)
+
+
+class SamplingPM(ExtraBaseModel):
+    enabled: bool = Field(default=True)
+    rate: float | None = Field(default=None, gt=0)
+    burst: int | None = Field(default=None, ge=1)
+    every_n: dict[str, int] = Field(default_factory=dict)
+    exempt_level: str | int | LogLevelEnum = Field(default=LogLevelEnum.ERROR)
+    report_interval: float = Field(default=10.0, gt=0)
+
+    @model_validator(mode="after")
+    def _check_all(self) -> Self:
+
+        for _level, _n in self.every_n.items():
+            if _n < 1:
+                raise ValueError(
+                    f"'every_n' attribute value {_n} for '{_level}' level is invalid, must be greater than 0!"
+                )
+
+        if (self.burst is not None) and (self.rate is None):
+            raise ValueError(
+                "'burst' attribute is set but 'rate' attribute is empty, 'burst' can only be used with 'rate'!"
+            )
+
+        return self
+
+
+class DedupPM(ExtraBaseModel):
+    enabled: bool = Field(default=True)
+    window: float = Field(default=10.0, gt=0)
+
+
 class LogHandlerPM(LoguruHandlerPM):
     type_: LogHandlerTypeEnum = Field(default=LogHandlerTypeEnum.UNKNOWN)
     sink: _SinkType | None = Field(default=None)  # type: ignore
     level: str | int | LogLevelEnum | None = Field(default=None)
     custom_serialize: bool | None = Field(default=None)
+    binary: bool | None = Field(default=None)
     error: bool = Field(default=False)
     enabled: bool = Field(default=True)
+    buffer: BufferPM | None = Field(default=None)
+    ring_buffer: RingBufferPM | None = Field(default=None)
+    sampling: SamplingPM | None = Field(default=None)
+    dedup: DedupPM | None = Field(default=None)
+    memory: MemoryPM | None = Field(default=None)
+    socket: SocketPM | None = Field(default=None)
+    http: HttpPM | None = Field(default=None)
+    syslog: SyslogPM | None = Field(default=None)
+    queue: QueuePM | None = Field(default=None)
 
     @model_validator(mode="after")
     def _check_all(self) -> Self:
@@ -130,17 +274,76 @@ class LogHandlerPM(LoguruHandlerPM):
                 "'loop' only can be used with async callable (coroutine function) 'sink'!"
             )
 
+        if (self.buffer is not None) and (self.type_ != LogHandlerTypeEnum.STD):
+            raise ValueError(
+                f"'buffer' attribute is set but 'type_' attribute value '{self.type_.value}' is invalid, "
+                "'buffer' can only be used with 'STD' handler type!"
+            )
+
+        if self.binary and (self.type_ != LogHandlerTypeEnum.FILE):
+            raise ValueError(
+                f"'binary' attribute is set but 'type_' attribute value '{self.type_.value}' is invalid, "
+                "'binary' can only be used with 'FILE' handler type!"
+            )
+
+        if self.binary and (self.serialize or self.custom_serialize):
+            raise ValueError(
+                "'binary' and 'serialize' or 'custom_serialize' attributes can't be used together, "
+                "binary records are already serialized!"
+            )
+
+        if (self.memory is not None) and (self.type_ != LogHandlerTypeEnum.MEMORY):
+            raise ValueError(
+                f"'memory' attribute is set but 'type_' attribute value '{self.type_.value}' is invalid, "
+                "'memory' can only be used with 'MEMORY' handler type!"
+            )
+
+        if (self.socket is not None) and (self.type_ != LogHandlerTypeEnum.SOCKET):
+            raise ValueError(
+                f"'socket' attribute is set but 'type_' attribute value '{self.type_.value}' is invalid, "
+                "'socket' can only be used with 'SOCKET' handler type!"
+            )
+
+        if (self.http is not None) and (self.type_ != LogHandlerTypeEnum.HTTP):
+            raise ValueError(
+                f"'http' attribute is set but 'type_' attribute value '{self.type_.value}' is invalid, "
+                "'http' can only be used with 'HTTP' handler type!"
+            )
+
+        if (self.syslog is not None) and (self.type_ != LogHandlerTypeEnum.SYSLOG):
+            raise ValueError(
+                f"'syslog' attribute is set but 'type_' attribute value '{self.type_.value}' is invalid, "
+                "'syslog' can only be used with 'SYSLOG' handler type!"
+            )
+
+        if (self.queue is not None) and (self.type_ != LogHandlerTypeEnum.QUEUE):
+            raise ValueError(
+                f"'queue' attribute is set but 'type_' attribute value '{self.type_.value}' is invalid, "
+                "'queue' can only be used with 'QUEUE' handler type!"
+            )
+
+        if (
+            (self.dedup is not None)
+            and self.dedup.enabled
+            and (not (hasattr(self.sink, "write") and callable(self.sink.write)))
+            and (
+                isinstance(self.sink, Handler)
+                or inspect.iscoroutinefunction(self.sink)
+                or inspect.iscoroutinefunction(getattr(self.sink, "__call__", None))
+            )
+        ):
+            raise ValueError(
+                f"'dedup' attribute is set but 'sink' attribute type {type(self.sink).__name__} is invalid, "
+                "'dedup' can't be used with 'logging.Handler' or coroutine function 'sink'!"
+            )
+
+        if (self.ring_buffer is not None) and self.enqueue:
+            raise ValueError(
+                "'ring_buffer' and 'enqueue' attributes can't be used together, 'ring_buffer' has own writer thread!"
+            )
+
         if not isinstance(self.sink, (str, os.PathLike)):
-            for _attr in (
-                "rotation",
-                "retention",
-                "compression",
-                "delay",
-                "watch",
-                "mode",
-                "buffering",
-                "encoding",
-            ):
+            for _attr in FILE_SINK_ATTRS:
                 if getattr(self, _attr) is not None:
                     raise ValueError(
                         f"'{_attr}' attribute is set but 'sink' attribute type {type(self.sink).__name__} is invalid, "
@@ -152,6 +355,16 @@ class LogHandlerPM(LoguruHandlerPM):
 
 __all__ = [
     "ExtraBaseModel",
+    "BufferPM",
+    "RingBufferPM",
+    "MemoryPM",
+    "TransportPM",
+    "SocketPM",
+    "HttpPM",
+    "SyslogPM",
+    "QueuePM",
+    "SamplingPM",
+    "DedupPM",
     "LoguruHandlerPM",
     "LogHandlerPM",
     "FormatType",
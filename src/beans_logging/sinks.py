@@ -1,8 +1,29 @@
+import os
 import sys
-from typing import TYPE_CHECKING
+import mmap
+import queue
+import atexit
+import logging
+import inspect
+import datetime
+import threading
+import traceback
+import contextlib
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+from loguru._file_sink import FileSink
+
+from .binary import BinaryFileSink
+from .formats import RECORD_KEYS, format_record
 
 if TYPE_CHECKING:
-    from loguru import Message
+    from loguru import Message, Record
 
 
 def std_sink(message: "Message") -> None:
@@ -22,4 +43,712 @@ def std_sink(message: "Message") -> None:
     return
 
 
-__all__ = ["std_sink"]
+def is_wrappable_sink(sink: Any) -> bool:
+    """Check if sink object can be wrapped by `SinkWrapper`.
+
+    Loguru converts messages into log records for `logging.Handler` sinks (with own terminator and exception
+    prefix), so these sinks are added as they are.
+
+    Args:
+        sink (Any, required): Sink object.
+
+    Returns:
+        bool: True if sink has 'write()' method, or is a coroutine function or callable.
+    """
+
+    if hasattr(sink, "write") and callable(sink.write):
+        return True
+
+    if isinstance(sink, logging.Handler):
+        return False
+
+    return callable(sink)
+
+
+def _is_coroutine_sink(sink: Any) -> bool:
+    return inspect.iscoroutinefunction(sink) or inspect.iscoroutinefunction(
+        getattr(sink, "__call__", None)
+    )
+
+
+class SinkWrapper:
+    """Base sink wrapper class which extends writes of the wrapped sink, without changing how loguru handles it.
+
+    Loguru decides colors, encoding, flushing and completing of stream sinks by the sink object, so `isatty()`,
+    'encoding', 'flush()' and 'complete()' are forwarded to the wrapped stream. Coroutine function sinks are written
+    by `write_async()` through `as_sink()`, which loguru schedules and awaits same as the wrapped coroutine sink.
+
+    Attributes:
+        sink   (Any ): Wrapped sink object with 'write()' method, coroutine function or callable.
+        async_ (bool): Whether wrapped sink is a coroutine function.
+
+    Methods:
+        write()      : Write message into wrapped sink.
+        write_async(): Write message into wrapped coroutine sink.
+        as_sink()    : Get sink object to add into loguru.
+        isatty()     : Check if wrapped stream is a terminal.
+        stop()       : Stop wrapped sink.
+    """
+
+    def __init__(self, sink: Any) -> None:
+        """SinkWrapper constructor method.
+
+        Args:
+            sink (Any, required): Sink object with 'write()' method, coroutine function or callable.
+
+        Raises:
+            TypeError: If 'sink' argument is a `logging.Handler`, or doesn't have 'write()' method and is not
+                            callable.
+        """
+
+        if not is_wrappable_sink(sink):
+            raise TypeError(
+                f"'sink' argument type {type(sink).__name__} is invalid, must have 'write()' method or be callable "
+                "(not 'logging.Handler')!"
+            )
+
+        self.sink = sink
+        self.async_ = False
+        if hasattr(sink, "write") and callable(sink.write):
+            self._write = sink.write
+        elif _is_coroutine_sink(sink):
+            self.async_ = True
+            self._write = sink if inspect.iscoroutinefunction(sink) else sink.__call__
+        else:
+            self._write = sink
+
+        _flush = getattr(sink, "flush", None)
+        if callable(_flush):
+            # Only flushable sinks are flushed by loguru after each write:
+            self.flush = _flush
+
+        _complete = getattr(sink, "complete", None)
+        if inspect.iscoroutinefunction(_complete):
+            self.complete = _complete
+
+    @property
+    def encoding(self) -> str | None:
+        return getattr(self.sink, "encoding", None)
+
+    def isatty(self) -> bool:
+        """Check if wrapped stream is a terminal, used by loguru to colorize messages by default.
+
+        Returns:
+            bool: True if wrapped stream is a terminal.
+        """
+
+        _isatty = getattr(self.sink, "isatty", None)
+        return callable(_isatty) and _isatty()
+
+    def write(self, message: "Message") -> None:
+        """Write message into wrapped sink.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        self._write(message)
+        return
+
+    async def write_async(self, message: "Message") -> None:
+        """Write message into wrapped coroutine sink.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        await self._write(message)
+        return
+
+    def as_sink(self) -> Any:
+        """Get sink object to add into loguru, coroutine sinks are written by `write_async()`.
+
+        Returns:
+            Any: Wrapper itself, or async sink of wrapper for coroutine sinks.
+        """
+
+        if self.async_:
+            return _AsyncSink(self)
+
+        return self
+
+    def stop(self) -> None:
+        """Stop wrapped sink, called by loguru when handler is removed."""
+
+        _stop = getattr(self.sink, "stop", None)
+        if callable(_stop):
+            _stop()
+
+        return
+
+
+class _AsyncSink:
+    """Coroutine sink of wrapper, so loguru schedules and awaits writes of wrapped coroutine sink."""
+
+    def __init__(self, sink: SinkWrapper) -> None:
+        self.sink = sink
+
+    async def __call__(self, message: "Message") -> None:
+        await self.sink.write_async(message)
+
+
+def unwrap_sink(sink: Any) -> Any:
+    """Get the innermost sink object of wrapped sink.
+
+    Args:
+        sink (Any, required): Sink object, maybe wrapped by `SinkWrapper`.
+
+    Returns:
+        Any: Innermost sink object.
+    """
+
+    while isinstance(sink, (SinkWrapper, _AsyncSink)):
+        sink = sink.sink
+
+    return sink
+
+
+class BufferedStdSink:
+    """Buffered sink class which batches stdout messages and flushes them in one write.
+
+    Messages below ERROR level are buffered and flushed by a background thread when the size or latency
+    threshold is hit, so logging threads don't issue a write syscall per message. ERROR and above messages
+    are written to stderr immediately (after flushing pending stdout messages to keep the order).
+    Remaining messages are flushed on `stop()`, which is called by loguru on `logger.remove()` and at
+    interpreter exit, messages written after stop are not buffered.
+
+    Attributes:
+        _MAX_BUFFER_FACTOR (int): Max buffer size as multiple of `buffer_size`, before logging threads
+                                    flush synchronously (backpressure).
+
+        buffer_size    (int  ): Buffered size (characters) threshold to flush.
+        flush_interval (float): Max seconds to keep messages in buffer.
+
+    Methods:
+        write()       : Write message into buffer or stderr.
+        flush_buffer(): Flush buffered messages into stdout.
+        stop()        : Stop background thread and flush remaining messages.
+    """
+
+    _MAX_BUFFER_FACTOR = 16
+
+    def __init__(self, buffer_size: int = 65_536, flush_interval: float = 0.5) -> None:
+        """BufferedStdSink constructor method.
+
+        Args:
+            buffer_size    (int  , optional): Buffered size (characters) threshold to flush. Default is 65536.
+            flush_interval (float, optional): Max seconds to keep messages in buffer. Default is 0.5.
+        """
+
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
+        self._buffer: list[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._stopped = False
+
+        self._thread = threading.Thread(
+            target=self._flush_loop, name="beans-logging-std-flusher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _flush_loop(self) -> None:
+        while not self._stopped:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush_buffer()
+
+    def write(self, message: "Message") -> None:
+        """Write message into buffer or stderr based on log level.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        if self._stopped:
+            # Messages after stop (e.g. logged at exit) are written directly, nothing flushes the buffer anymore:
+            self.flush_buffer()
+            _stream = sys.stdout if message.record["level"].no < 40 else sys.stderr
+            _stream.write(message)
+            _stream.flush()
+        elif message.record["level"].no < 40:
+            with self._lock:
+                self._buffer.append(message)
+                self._size += len(message)
+                _size = self._size
+
+            if (self.buffer_size * self._MAX_BUFFER_FACTOR) <= _size:
+                self.flush_buffer()
+            elif self.buffer_size <= _size:
+                self._flush_event.set()
+        else:
+            self.flush_buffer()
+            sys.stderr.write(message)
+            sys.stderr.flush()
+
+        return
+
+    def flush_buffer(self) -> None:
+        """Flush buffered messages into stdout with a single write."""
+
+        with self._write_lock:
+            with self._lock:
+                if not self._buffer:
+                    return
+
+                _buffer, self._buffer, self._size = self._buffer, [], 0
+
+            sys.stdout.write("".join(_buffer))
+            sys.stdout.flush()
+
+        return
+
+    def stop(self) -> None:
+        """Stop background thread and flush remaining messages."""
+
+        if self._stopped:
+            return
+
+        self._stopped = True
+        self._flush_event.set()
+        if self._thread.is_alive() and (self._thread is not threading.current_thread()):
+            self._thread.join()
+
+        self.flush_buffer()
+        atexit.unregister(self.stop)
+        return
+
+
+class SharedFileSink(FileSink):
+    """Loguru file sink class for a log file shared by multiple processes, with coordinated rotation.
+
+    Rotation is decided under an exclusive lock on the hidden '.{file_name}.lock' file: only the process whose open file is
+    still the file at the path renames it, after bumping the rotation generation stored in the memory-mapped
+    lock file. Other processes compare the shared generation with their own before each write (a memory read,
+    no syscall or lock) and reopen the path, waiting on the lock until the new file is created. Their own
+    rotation decisions for the same rotation only reopen the new file, so each rotation is a single rename.
+
+    Attributes:
+        _lock_path  (str      ): Lock file path, also holds the shared rotation generation.
+        _mmap       (mmap.mmap): Memory-mapped shared rotation generation.
+        _generation (bytes    ): Rotation generation of the currently open file.
+
+    Methods:
+        write(): Reopen file if it was rotated by another process, then write message.
+        stop() : Close file and lock file map.
+    """
+
+    _GENERATION_SIZE = 8
+
+    def __init__(self, path: str | os.PathLike, **kwargs: Any) -> None:
+        """SharedFileSink constructor method.
+
+        Args:
+            path     (str | PathLike, required): Log file path.
+            **kwargs (Any           , optional): Loguru file sink arguments.
+
+        Raises:
+            OSError: If 'fcntl' module is not available (e.g. on Windows), rotation can't be coordinated.
+        """
+
+        if fcntl is None:
+            raise OSError(
+                "Shared file sink requires 'fcntl' module, which is not available on this platform!"
+            )
+
+        super().__init__(str(path), **kwargs)
+
+        _dir, _file_name = os.path.split(os.path.abspath(path))
+        # Hidden name, so it never matches the retention glob patterns of rotated files:
+        self._lock_path = os.path.join(_dir, f".{_file_name}.lock")
+        os.makedirs(os.path.dirname(self._lock_path), exist_ok=True)
+        _fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(_fd).st_size < self._GENERATION_SIZE:
+                # Only extends the file with zeros, so it is safe without the lock:
+                os.ftruncate(_fd, self._GENERATION_SIZE)
+
+            self._mmap = mmap.mmap(_fd, self._GENERATION_SIZE)
+        finally:
+            os.close(_fd)
+
+        self._generation = self._mmap[: self._GENERATION_SIZE]
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[None]:
+        # Opened on each rotation, so forked processes never share the lock's open file description:
+        _fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(_fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(_fd)
+
+    def _is_current(self) -> bool:
+        try:
+            _path_stat = os.stat(self._file_path)
+        except FileNotFoundError:
+            return False
+
+        _file_stat = os.fstat(self._file.fileno())
+        return (_path_stat.st_dev == _file_stat.st_dev) and (
+            _path_stat.st_ino == _file_stat.st_ino
+        )
+
+    def _reopen(self) -> None:
+        with self._lock():
+            self._generation = self._mmap[: self._GENERATION_SIZE]
+            if self._file is not None:
+                _path = self._file_path
+                self._close_file()
+                self._create_file(_path)
+
+    def write(self, message: "Message") -> None:
+        if self._mmap[: self._GENERATION_SIZE] != self._generation:
+            self._reopen()
+
+        super().write(message)
+
+    def _terminate_file(self, *, is_rotating: bool = False) -> None:
+        if (not is_rotating) or (self._file is None):
+            super()._terminate_file(is_rotating=is_rotating)
+            return
+
+        with self._lock():
+            _generation = self._mmap[: self._GENERATION_SIZE]
+            if (_generation == self._generation) and self._is_current():
+                _generation = (int.from_bytes(_generation, "little") + 1).to_bytes(
+                    self._GENERATION_SIZE, "little"
+                )
+                self._mmap[: self._GENERATION_SIZE] = _generation
+                self._generation = _generation
+                super()._terminate_file(is_rotating=True)
+                return
+
+            # Already rotated by another process (or externally), only reopen the new file:
+            self._generation = _generation
+            _path = self._file_path
+            self._close_file()
+            self._create_file(_path)
+
+    def stop(self) -> None:
+        super().stop()
+        self._mmap.close()
+
+
+class SharedBinaryFileSink(SharedFileSink, BinaryFileSink):
+    """Binary file sink class for a log file shared by multiple processes, with coordinated rotation."""
+
+
+def make_file_sink(
+    path: str | os.PathLike, shared: bool = False, binary: bool = False, **kwargs: Any
+) -> Any:
+    """Make loguru file sink object (with rotation, retention and compression) from file path,
+    to be wrapped by other sinks.
+
+    Args:
+        path     (str | PathLike, required): Log file path.
+        shared   (bool          , optional): Make shared file sink with coordinated rotation for multiple processes.
+                                                Default is False.
+        binary   (bool          , optional): Make binary file sink which writes msgpack records ('app_name'
+                                                argument is written into header). Default is False.
+        **kwargs (Any           , optional): Loguru file sink arguments ('rotation', 'retention', 'compression',
+                                                'delay', 'watch', 'mode', 'buffering', 'encoding').
+
+    Returns:
+        Any: Loguru file sink object with 'write()' and 'stop()' methods.
+    """
+
+    if shared and binary:
+        return SharedBinaryFileSink(path, **kwargs)
+    elif shared:
+        return SharedFileSink(path, **kwargs)
+    elif binary:
+        return BinaryFileSink(path, **kwargs)
+
+    return FileSink(path, **kwargs)
+
+
+class _RecordedException(tuple):
+    """Recorded exception of flight recorder as (type, value text, None) with formatted traceback text,
+    so frames are not kept alive. Traceback text is rendered by '{exception}' field.
+    """
+
+    def __new__(cls, exception: Any) -> "_RecordedException":
+        _type, _value, _traceback = exception
+        _self = super().__new__(cls, (_type, str(_value), None))
+        _self.text = "".join(traceback.format_exception(_type, _value, _traceback))
+        return _self
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __format__(self, spec: str) -> str:
+        return format(self.text, spec)
+
+
+class MemorySink:
+    """Flight recorder sink class which keeps recent records in a fixed-capacity in-memory ring.
+
+    Records are recorded by the handler filter (`record()`) as compact tuples, which always returns False, so
+    loguru never formats or writes them. When a record at or above `dump_level_no` arrives, recorded records
+    (oldest first) are taken from the ring and formatted and written into the dump file or sink by a background
+    thread. Exceptions are recorded as formatted text, so the ring doesn't keep frames alive.
+
+    Attributes:
+        dump_sink     (str | Any            ): Dump file path, or sink object with 'write()' method or callable.
+        capacity      (int                  ): Max number of recorded records.
+        dump_level_no (int                  ): Level number to dump at and above.
+        encoding      (str                  ): Dump file encoding.
+        format_       (str | Callable | None): Loguru format (color tags are removed) or dynamic format function.
+        filter_       (Callable | None      ): Handler filter to check before recording.
+        recorded      (int                  ): Number of recorded records.
+        dumps         (int                  ): Number of dumps.
+
+    Methods:
+        record(): Record log record and dump recorded records on dump level, used as handler filter.
+        write() : Record message's record, if memory sink is used without its filter.
+        dump()  : Dump recorded records and clear the ring, waits until it is written.
+        flush() : Wait until pending dumps are written.
+        stop()  : Write pending dumps, stop background thread and clear the ring without dumping.
+        stats   : Counters of memory sink (property).
+    """
+
+    def __init__(
+        self,
+        dump_sink: str | os.PathLike | Any,
+        capacity: int = 10_000,
+        dump_level_no: int = 40,
+        encoding: str = "utf8",
+        format_: str | Callable[["Record"], str] | None = None,
+        filter_: Callable[["Record"], bool] | None = None,
+    ) -> None:
+        """MemorySink constructor method.
+
+        Args:
+            dump_sink     (str | PathLike | Any , required): Dump file path, or sink object with 'write()' method
+                                                                 or callable.
+            capacity      (int                  , optional): Max number of recorded records. Default is 10000.
+            dump_level_no (int                  , optional): Level number to dump at and above. Default is 40 (ERROR).
+            encoding      (str                  , optional): Dump file encoding. Default is 'utf8'.
+            format_       (str | Callable | None, optional): Loguru format or dynamic format function to format
+                                                                 records at dump time. Default is None
+                                                                 ('{time} | {level} | {message}').
+            filter_       (Callable | None      , optional): Handler filter to check before recording.
+                                                                 Default is None.
+
+        Raises:
+            ValueError: If 'capacity' argument value is not positive.
+        """
+
+        if capacity < 1:
+            raise ValueError(
+                f"'capacity' argument value {capacity} is invalid, must be greater than 0!"
+            )
+
+        if isinstance(dump_sink, os.PathLike):
+            dump_sink = os.fspath(dump_sink)
+
+        self.dump_sink = dump_sink
+        self.capacity = capacity
+        self.dump_level_no = dump_level_no
+        self.encoding = encoding
+        self.format_ = format_
+        self.filter_ = filter_
+        self.recorded = 0
+        self.dumps = 0
+
+        self._items: list[tuple | None] = [None] * capacity
+        self._index = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._dump_queue: queue.Queue[tuple[list[tuple], str] | None] = queue.Queue()
+        self._dump_thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def record(self, record: "Record") -> bool:
+        """Record log record as compact tuple and dump recorded records if record level is at or above dump level.
+
+        Args:
+            record (Record, required): Log record as dictionary.
+
+        Returns:
+            bool: Always False, so loguru doesn't format or write the record.
+        """
+
+        if (self.filter_ is not None) and (not self.filter_(record)):
+            return False
+
+        _exception = record["exception"]
+        # Same order as 'RECORD_KEYS':
+        _item = (
+            record["time"],
+            record["level"],
+            record["name"],
+            record["module"],
+            record["function"],
+            record["line"],
+            record["file"],
+            record["process"],
+            record["thread"],
+            record["elapsed"],
+            record["message"],
+            # Shallow copy, later 'bind()' or context changes don't change recorded extra:
+            dict(record["extra"]),
+            None if _exception is None else _RecordedException(_exception),
+        )
+        with self._lock:
+            self._items[self._index] = _item
+            self._index = (self._index + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+
+            self.recorded += 1
+
+        if self.dump_level_no <= record["level"].no:
+            self._submit(reason=record["level"].name)
+
+        return False
+
+    def write(self, message: "Message") -> None:
+        """Record message's record, if memory sink is used without its `record()` filter.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        self.record(message.record)
+        return
+
+    def _pop_all(self) -> list[tuple]:
+        with self._lock:
+            _start = (self._index - self._size) % self.capacity
+            if _start + self._size <= self.capacity:
+                _items = self._items[_start : _start + self._size]
+            else:
+                _items = self._items[_start:] + self._items[: self._index]
+
+            self._items = [None] * self.capacity
+            self._index = 0
+            self._size = 0
+
+        return _items  # type: ignore
+
+    def _submit(self, reason: str) -> int:
+        _items = self._pop_all()
+        if not _items:
+            return 0
+
+        self._dump_queue.put((_items, reason))
+        if (self._dump_thread is None) or (not self._dump_thread.is_alive()):
+            # Started on first dump (and again in forked processes):
+            self._dump_thread = threading.Thread(
+                target=self._dump_loop, name="beans-logging-memory-dumper", daemon=True
+            )
+            self._dump_thread.start()
+
+        return len(_items)
+
+    def _dump_loop(self) -> None:
+        while True:
+            _task = self._dump_queue.get()
+            try:
+                if _task is None:
+                    return
+
+                self._write_dump(*_task)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                self._dump_queue.task_done()
+
+    def _write_dump(self, items: list[tuple], reason: str) -> None:
+        _now = datetime.datetime.now().astimezone().isoformat(timespec="milliseconds")
+        _text = (
+            f"--- Flight recorder dump: {len(items)} messages, reason: {reason}, at: {_now} ---\n"
+            + "".join(
+                format_record(dict(zip(RECORD_KEYS, _item)), self.format_)
+                for _item in items
+            )
+        )
+        if isinstance(self.dump_sink, str):
+            _dir = os.path.dirname(self.dump_sink)
+            if _dir:
+                os.makedirs(_dir, exist_ok=True)
+
+            with open(self.dump_sink, "a", encoding=self.encoding) as _file:
+                _file.write(_text)
+        elif hasattr(self.dump_sink, "write"):
+            self.dump_sink.write(_text)
+            _flush = getattr(self.dump_sink, "flush", None)
+            if callable(_flush):
+                _flush()
+        else:
+            self.dump_sink(_text)
+
+        self.dumps += 1
+        return
+
+    def dump(self, reason: str = "MANUAL") -> int:
+        """Dump recorded records (oldest first) into dump file or sink, and clear the ring.
+        Waits until the dump (and previous pending dumps) are written.
+
+        Args:
+            reason (str, optional): Dump reason to write in dump header. Default is 'MANUAL'.
+
+        Returns:
+            int: Number of dumped records.
+        """
+
+        _count = self._submit(reason=reason)
+        self.flush()
+        return _count
+
+    def flush(self) -> None:
+        """Wait until pending dumps are written by background thread."""
+
+        if (self._dump_thread is not None) and self._dump_thread.is_alive():
+            self._dump_queue.join()
+
+        return
+
+    def stop(self) -> None:
+        """Write pending dumps, stop background thread and clear the ring without dumping,
+        called by loguru when handler is removed.
+        """
+
+        if (self._dump_thread is not None) and self._dump_thread.is_alive():
+            self._dump_queue.put(None)
+            self._dump_thread.join()
+
+        self._dump_thread = None
+        self._pop_all()
+        return
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "capacity": self.capacity,
+            "size": self._size,
+            "recorded": self.recorded,
+            "dumps": self.dumps,
+        }
+
+
+__all__ = [
+    "std_sink",
+    "is_wrappable_sink",
+    "SinkWrapper",
+    "unwrap_sink",
+    "BufferedStdSink",
+    "MemorySink",
+    "SharedFileSink",
+    "SharedBinaryFileSink",
+    "make_file_sink",
+]
@@ -0,0 +1,775 @@
+import os
+import sys
+import gzip
+import atexit
+import socket
+import struct
+import weakref
+import threading
+import traceback
+import http.client
+from abc import ABC, abstractmethod
+from time import perf_counter
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from loguru import Message
+
+from .constants import (
+    OverflowPolicyEnum,
+    SocketProtocolEnum,
+    FramingEnum,
+    SyslogFormatEnum,
+)
+from .buffers import RingBuffer
+
+
+class BatchSink(ABC):
+    """Base sink class for network transports, with bounded buffer, one sender thread, batching and reconnect.
+
+    Logging threads only put messages into a bounded ring buffer. The sender thread takes all buffered messages
+    at once (so batches grow with the load), optionally waits `flush_interval` for more messages, encodes them and
+    sends them in batches of up to `batch_size` messages and `max_batch_bytes` bytes over a persistent
+    connection. On connect or send errors the connection is closed and re-opened with exponential backoff, while
+    messages are kept in the bounded buffer (oldest are dropped by default).
+
+    Subclasses must implement abstract `_connect()`, `_send()` and `_close()` methods. `_send()` returns False
+    when the batch is rejected and must not be retried (it is counted as dropped).
+
+    Attributes:
+        _instances (WeakSet): Live sinks, re-initialized in the child process after fork.
+
+        batch_size      (int       ): Max number of messages in one send.
+        max_batch_bytes (int | None): Max size (bytes) of encoded messages in one send.
+        flush_interval  (float     ): Seconds to wait for more messages before sending a partial batch.
+        timeout         (float     ): Connect and send timeout (seconds).
+        backoff_min     (float     ): Min (first) reconnect delay (seconds).
+        backoff_max     (float     ): Max reconnect delay (seconds).
+        encoding        (str       ): Message encoding.
+        buffer          (RingBuffer): Bounded buffer between logging threads and the sender thread.
+
+    Methods:
+        write(): Put message into buffer.
+        stop() : Stop sender thread after trying to send remaining messages.
+        stats  : Counters of sink (property).
+    """
+
+    _instances: "weakref.WeakSet[BatchSink]" = weakref.WeakSet()
+
+    _THREAD_NAME = "beans-logging-sender"
+
+    def __init__(
+        self,
+        batch_size: int = 256,
+        max_batch_bytes: int | None = None,
+        flush_interval: float = 0.0,
+        capacity: int = 8_192,
+        policy: OverflowPolicyEnum | str = OverflowPolicyEnum.DROP_OLDEST,
+        timeout: float = 5.0,
+        backoff_min: float = 0.1,
+        backoff_max: float = 30.0,
+        encoding: str = "utf8",
+    ) -> None:
+        """BatchSink constructor method.
+
+        Args:
+            batch_size      (int                     , optional): Max number of messages in one send.
+                                                                    Default is 256.
+            max_batch_bytes (int | None              , optional): Max size (bytes) of encoded messages in one
+                                                                    send, a bigger message is sent alone.
+                                                                    Default is None (no limit).
+            flush_interval  (float                   , optional): Seconds to wait for more messages before sending
+                                                                    a partial batch. Default is 0.0 (no wait).
+            capacity        (int                     , optional): Max number of buffered messages. Default is 8192.
+            policy          (OverflowPolicyEnum | str, optional): Overflow policy when buffer is full.
+                                                                    Default is 'DROP_OLDEST'.
+            timeout         (float                   , optional): Connect and send timeout (seconds). Default is 5.0.
+            backoff_min     (float                   , optional): Min (first) reconnect delay (seconds).
+                                                                    Default is 0.1.
+            backoff_max     (float                   , optional): Max reconnect delay (seconds). Default is 30.0.
+            encoding        (str                     , optional): Message encoding. Default is 'utf8'.
+
+        Raises:
+            ValueError: If 'batch_size' argument value is not positive or 'backoff_min' is greater than
+                            'backoff_max'.
+        """
+
+        if batch_size < 1:
+            raise ValueError(
+                f"'batch_size' argument value {batch_size} is invalid, must be greater than 0!"
+            )
+
+        if backoff_max < backoff_min:
+            raise ValueError(
+                f"'backoff_min' argument value {backoff_min} is invalid, must be less than or equal to "
+                f"'backoff_max' ({backoff_max})!"
+            )
+
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.encoding = encoding
+        self.buffer = RingBuffer(capacity=capacity, policy=policy)
+
+        self.sent = 0
+        self.batches = 0
+        self.dropped = 0
+        self.errors = 0
+        self.reconnects = 0
+        self.latency_last = 0.0
+        self.latency_max = 0.0
+        self._latency_total = 0.0
+
+        self._init_sender()
+        atexit.register(self.stop)
+        BatchSink._instances.add(self)
+
+    def _init_sender(self) -> None:
+        self._connected = False
+        self._pending: list[bytes] = []
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._send_loop, name=self._THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        for _self in list(cls._instances):
+            if not _self.buffer.closed:
+                # Connection and sender thread belong to the parent process, re-create them in the child process
+                # (closing child's copy of the connection doesn't affect the parent):
+                _self._disconnect()
+                _self.buffer = RingBuffer(
+                    capacity=_self.buffer.capacity, policy=_self.buffer.policy
+                )
+                _self._init_sender()
+
+    @abstractmethod
+    def _connect(self) -> None:
+        """Open connection, raises error if it fails."""
+
+    @abstractmethod
+    def _send(self, batch: list[bytes]) -> bool | None:
+        """Send encoded messages, raises error on connection failure.
+
+        Args:
+            batch (list[bytes], required): Encoded messages.
+
+        Returns:
+            bool | None: False if batch is rejected and must not be retried, otherwise True or None.
+        """
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Close connection, errors are ignored."""
+
+    def _encode(self, message: str) -> bytes:
+        return message.encode(self.encoding)
+
+    def _disconnect(self) -> None:
+        self._connected = False
+        try:
+            self._close()
+        except Exception:
+            pass
+
+    def _flush_pending(self) -> bool:
+        """Send pending messages in batches, (re)connect if needed.
+
+        Returns:
+            bool: True if all pending messages are sent, False on connect or send error.
+        """
+
+        while self._pending:
+            if not self._connected:
+                try:
+                    self._connect()
+                    self._connected = True
+                except Exception:
+                    self.errors += 1
+                    self._disconnect()
+                    return False
+
+            _batch = self._get_batch()
+            _start = perf_counter()
+            try:
+                _accepted = self._send(_batch)
+            except Exception:
+                self.errors += 1
+                self.reconnects += 1
+                self._disconnect()
+                return False
+
+            _latency = perf_counter() - _start
+            self.latency_last = _latency
+            self._latency_total += _latency
+            if self.latency_max < _latency:
+                self.latency_max = _latency
+
+            del self._pending[: len(_batch)]
+            if _accepted is False:
+                self.dropped += len(_batch)
+            else:
+                self.sent += len(_batch)
+                self.batches += 1
+
+        return True
+
+    def _get_batch(self) -> list[bytes]:
+        _batch = self._pending[: self.batch_size]
+        if self.max_batch_bytes is None:
+            return _batch
+
+        _size = 0
+        for _i, _data in enumerate(_batch):
+            _size += len(_data)
+            if (self.max_batch_bytes < _size) and (0 < _i):
+                return _batch[:_i]
+
+        return _batch
+
+    def _add_pending(self, messages: list[Any]) -> None:
+        if not messages:
+            return
+
+        self._pending.extend(self._encode(_message) for _message in messages)
+        _overflow = len(self._pending) - self.buffer.capacity
+        if 0 < _overflow:
+            del self._pending[:_overflow]
+            self.dropped += _overflow
+
+    def _send_loop(self) -> None:
+        _buffer = self.buffer
+        _delay = self.backoff_min
+        while True:
+            # Don't wait for new messages while there are unsent messages to retry:
+            _messages = _buffer.get_all(timeout=0 if self._pending else None)
+            if (not _messages) and (not self._pending) and _buffer.closed:
+                break
+
+            self._add_pending(_messages)
+            if (
+                self.flush_interval
+                and (len(self._pending) < self.batch_size)
+                and (not self._stop_event.is_set())
+            ):
+                # Linger to collect bigger batch, stop interrupts the wait:
+                self._stop_event.wait(self.flush_interval)
+                self._add_pending(_buffer.get_all(timeout=0))
+
+            try:
+                if self._flush_pending():
+                    _delay = self.backoff_min
+                    continue
+            except Exception:
+                sys.stderr.write(
+                    "--- Logging error in beans-logging transport sink ---\n"
+                )
+                traceback.print_exc(file=sys.stderr)
+
+            # Connect or send failed, wait before reconnect (stop interrupts the wait):
+            if self._stop_event.wait(_delay):
+                break
+
+            _delay = min(_delay * 2, self.backoff_max)
+
+        # Last attempt on stop, remaining messages are dropped if it fails:
+        self._add_pending(_buffer.get_all(timeout=0))
+        if self._pending and (not self._flush_pending()):
+            self.dropped += len(self._pending)
+            self._pending.clear()
+
+        self._disconnect()
+
+    def write(self, message: "Message") -> None:
+        """Put message into buffer, it is sent by the sender thread.
+
+        Args:
+            message (Message, required): Log message.
+        """
+
+        self.buffer.put(message)
+        return
+
+    def stop(self) -> None:
+        """Stop sender thread after trying to send remaining messages, called by loguru when handler is removed."""
+
+        if self.buffer.closed:
+            return
+
+        self._stop_event.set()
+        self.buffer.close()
+        if self._thread.is_alive() and (self._thread is not threading.current_thread()):
+            self._thread.join()
+
+        atexit.unregister(self.stop)
+        return
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "sent": self.sent,
+            "batches": self.batches,
+            "dropped": self.dropped + self.buffer.dropped,
+            "errors": self.errors,
+            "reconnects": self.reconnects,
+            "pending": len(self._pending) + len(self.buffer),
+            "latency_last_ms": self.latency_last * 1000,
+            "latency_max_ms": self.latency_max * 1000,
+            "latency_avg_ms": (
+                (self._latency_total / self.batches * 1000) if self.batches else 0.0
+            ),
+        }
+
+
+if hasattr(os, "register_at_fork"):
+    # One callback for all live batch sinks (including subclasses), fork callbacks can't be unregistered:
+    os.register_at_fork(after_in_child=BatchSink._after_fork)
+
+
+class SocketSink(BatchSink):
+    """Sink class which sends messages over TCP, UDP or Unix domain socket.
+
+    Messages are framed by newline or 4-byte big-endian length prefix. For stream sockets (TCP, Unix) each batch
+    is joined and sent with one `sendall()` call, for UDP batches are packed into datagrams of up to
+    `_MAX_DATAGRAM_SIZE` bytes (bigger messages are sent alone).
+
+    Attributes:
+        _MAX_DATAGRAM_SIZE (int): Max UDP datagram size (bytes) to pack messages into.
+
+        protocol (SocketProtocolEnum   ): Socket protocol.
+        address  (tuple[str, int] | str): Host and port for TCP and UDP, socket file path for Unix.
+        framing  (FramingEnum          ): Message framing.
+    """
+
+    _THREAD_NAME = "beans-logging-socket-sender"
+    _MAX_DATAGRAM_SIZE = 8_192
+
+    def __init__(
+        self,
+        protocol: SocketProtocolEnum | str = SocketProtocolEnum.TCP,
+        host: str = "localhost",
+        port: int | None = None,
+        path: str | None = None,
+        framing: FramingEnum | str = FramingEnum.NEWLINE,
+        **kwargs: Any,
+    ) -> None:
+        """SocketSink constructor method.
+
+        Args:
+            protocol (SocketProtocolEnum | str, optional): Socket protocol (TCP, UDP or UNIX). Default is 'TCP'.
+            host     (str                     , optional): Host for TCP and UDP. Default is 'localhost'.
+            port     (int | None              , optional): Port for TCP and UDP. Default is None.
+            path     (str | None              , optional): Socket file path for Unix. Default is None.
+            framing  (FramingEnum | str       , optional): Message framing (NEWLINE or LENGTH_PREFIXED).
+                                                            Default is 'NEWLINE'.
+            **kwargs (Any                     , optional): `BatchSink` arguments.
+
+        Raises:
+            ValueError: If 'port' argument is empty for TCP or UDP, or 'path' argument is empty for Unix socket.
+        """
+
+        self.protocol = SocketProtocolEnum(protocol)
+        self.framing = FramingEnum(framing)
+        self.address: tuple[str, int] | str
+        if self.protocol == SocketProtocolEnum.UNIX:
+            if not path:
+                raise ValueError(
+                    "'path' argument is empty, required for 'UNIX' socket protocol!"
+                )
+
+            self.address = path
+        else:
+            if not port:
+                raise ValueError(
+                    f"'port' argument is empty, required for '{self.protocol.value}' socket protocol!"
+                )
+
+            self.address = (host, port)
+
+        self._socket: socket.socket | None = None
+        super().__init__(**kwargs)
+
+    def _encode(self, message: str) -> bytes:
+        _data = message.encode(self.encoding)
+        if self.framing == FramingEnum.LENGTH_PREFIXED:
+            if _data.endswith(b"\n"):
+                _data = _data[:-1]
+
+            return struct.pack(">I", len(_data)) + _data
+
+        if not _data.endswith(b"\n"):
+            _data += b"\n"
+
+        return _data
+
+    def _connect(self) -> None:
+        _address: Any
+        if self.protocol == SocketProtocolEnum.UNIX:
+            _socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            _address = self.address
+        else:
+            _type = (
+                socket.SOCK_DGRAM
+                if self.protocol == SocketProtocolEnum.UDP
+                else socket.SOCK_STREAM
+            )
+            _family, _type, _proto, _, _address = socket.getaddrinfo(
+                *self.address, type=_type
+            )[0]
+            _socket = socket.socket(_family, _type, _proto)
+
+        try:
+            _socket.settimeout(self.timeout)
+            if self.protocol == SocketProtocolEnum.TCP:
+                _socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            _socket.connect(_address)
+        except Exception:
+            _socket.close()
+            raise
+
+        self._socket = _socket
+
+    def _send(self, batch: list[bytes]) -> None:
+        _socket: socket.socket = self._socket  # type: ignore
+        if self.protocol != SocketProtocolEnum.UDP:
+            _socket.sendall(b"".join(batch))
+            return
+
+        _datagram: list[bytes] = []
+        _size = 0
+        for _data in batch:
+            if _datagram and (self._MAX_DATAGRAM_SIZE < (_size + len(_data))):
+                _socket.send(b"".join(_datagram))
+                _datagram, _size = [], 0
+
+            _datagram.append(_data)
+            _size += len(_data)
+
+        if _datagram:
+            _socket.send(b"".join(_datagram))
+
+    def _close(self) -> None:
+        if self._socket is not None:
+            _socket, self._socket = self._socket, None
+            _socket.close()
+
+
+class HttpSink(BatchSink):
+    """Sink class which POSTs batches of messages (e.g. JSON lines) to HTTP endpoint.
+
+    Each batch is joined as newline-delimited body, gzip compressed (optional) and sent over one keep-alive
+    connection owned by the sender thread. Connection errors, 408, 429 and 5xx responses are retried with
+    backoff, other non-2xx responses reject the batch (counted as dropped).
+
+    Attributes:
+        url            (str           ): Endpoint URL.
+        method         (str           ): HTTP method.
+        headers        (dict[str, str]): Request headers.
+        compress_level (int | None    ): Gzip compression level, None to disable compression.
+    """
+
+    _THREAD_NAME = "beans-logging-http-sender"
+    _RETRY_STATUSES = (408, 429)
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "POST",
+        headers: dict[str, str] | None = None,
+        compress_level: int | None = 6,
+        content_type: str = "application/x-ndjson",
+        **kwargs: Any,
+    ) -> None:
+        """HttpSink constructor method.
+
+        Args:
+            url            (str                   , required): Endpoint URL ('http://' or 'https://').
+            method         (str                   , optional): HTTP method. Default is 'POST'.
+            headers        (dict[str, str] | None , optional): Extra request headers. Default is None.
+            compress_level (int | None            , optional): Gzip compression level (1-9), None to disable.
+                                                                Default is 6.
+            content_type   (str                   , optional): Body content type.
+                                                                Default is 'application/x-ndjson'.
+            **kwargs       (Any                   , optional): `BatchSink` arguments.
+
+        Raises:
+            ValueError: If 'url' argument value is not valid HTTP or HTTPS URL.
+        """
+
+        _url = urlsplit(url)
+        if (_url.scheme not in ("http", "https")) or (not _url.hostname):
+            raise ValueError(
+                f"'url' argument value '{url}' is invalid, must be 'http://' or 'https://' URL!"
+            )
+
+        self.url = url
+        self.method = method.upper()
+        self.compress_level = compress_level
+        self.headers = {
+            "Content-Type": content_type,
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+        if compress_level is not None:
+            self.headers["Content-Encoding"] = "gzip"
+
+        self._scheme = _url.scheme
+        self._host = _url.hostname
+        self._port = _url.port
+        self._path = (_url.path or "/") + (f"?{_url.query}" if _url.query else "")
+        self._connection: http.client.HTTPConnection | None = None
+        self.last_status: int | None = None
+        super().__init__(**kwargs)
+
+    def _encode(self, message: str) -> bytes:
+        _data = message.encode(self.encoding)
+        if not _data.endswith(b"\n"):
+            _data += b"\n"
+
+        return _data
+
+    def _connect(self) -> None:
+        _connection_class = (
+            http.client.HTTPSConnection
+            if self._scheme == "https"
+            else http.client.HTTPConnection
+        )
+        _connection = _connection_class(
+            self._host, self._port, timeout=self.timeout  # type: ignore
+        )
+        _connection.connect()
+        self._connection = _connection
+
+    def _send(self, batch: list[bytes]) -> bool:
+        _connection: http.client.HTTPConnection = self._connection  # type: ignore
+        _body = b"".join(batch)
+        if self.compress_level is not None:
+            _body = gzip.compress(_body, compresslevel=self.compress_level, mtime=0)
+
+        _connection.request(self.method, self._path, body=_body, headers=self.headers)
+        _response = _connection.getresponse()
+        # Response must be read fully to reuse the connection:
+        _response.read()
+        self.last_status = _response.status
+        if _response.will_close:
+            self._disconnect()
+
+        if (_response.status in self._RETRY_STATUSES) or (500 <= _response.status):
+            raise ConnectionError(
+                f"HTTP endpoint responded with retryable status {_response.status}!"
+            )
+
+        return 200 <= _response.status < 300
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            _connection, self._connection = self._connection, None
+            _connection.close()
+
+
+class SyslogSink(SocketSink):
+    """Sink class which sends RFC 5424 (or RFC 3164) syslog messages to local syslog socket or UDP/TCP endpoint.
+
+    Per-process header parts (hostname, app name, pid) and priority prefixes of each severity are rendered once
+    (and again after fork), so each message only adds timestamp, structured data and the formatted message.
+    `sd_keys` (global extra keys) are mapped to one structured-data element from each record's extra values.
+    Datagram sockets (UDP, '/dev/log') get one message per datagram, TCP uses octet-counting framing (RFC 6587).
+
+    Attributes:
+        syslog_format (SyslogFormatEnum): Syslog message format.
+        facility      (int             ): Syslog facility code.
+        app_name      (str             ): APP-NAME (RFC 5424) or TAG (RFC 3164).
+        sd_id         (str             ): Structured-data element ID.
+        sd_keys       (list[str]       ): Record extra keys to add as structured-data parameters.
+    """
+
+    _THREAD_NAME = "beans-logging-syslog-sender"
+    # Level number thresholds to syslog severities:
+    _SEVERITIES = ((50, 2), (40, 3), (30, 4), (25, 5), (20, 6))
+    _MONTHS = (
+        "Jan",
+        "Feb",
+        "Mar",
+        "Apr",
+        "May",
+        "Jun",
+        "Jul",
+        "Aug",
+        "Sep",
+        "Oct",
+        "Nov",
+        "Dec",
+    )
+
+    def __init__(
+        self,
+        syslog_format: SyslogFormatEnum | str = SyslogFormatEnum.RFC5424,
+        facility: int = 1,
+        app_name: str = "app",
+        sd_id: str = "extra@32473",
+        sd_keys: list[str] | None = None,
+        protocol: SocketProtocolEnum | str = SocketProtocolEnum.UNIX,
+        path: str | None = "/dev/log",
+        **kwargs: Any,
+    ) -> None:
+        """SyslogSink constructor method.
+
+        Args:
+            syslog_format (SyslogFormatEnum | str , optional): Syslog message format (RFC5424 or RFC3164).
+                                                                Default is 'RFC5424'.
+            facility      (int                    , optional): Syslog facility code (0-23). Default is 1 (user).
+            app_name      (str                    , optional): APP-NAME or TAG. Default is 'app'.
+            sd_id         (str                    , optional): Structured-data element ID.
+                                                                Default is 'extra@32473'.
+            sd_keys       (list[str] | None       , optional): Record extra keys to add as structured-data
+                                                                parameters. Default is None.
+            protocol      (SocketProtocolEnum | str, optional): Socket protocol (TCP, UDP or UNIX).
+                                                                Default is 'UNIX'.
+            path          (str | None             , optional): Local syslog socket path. Default is '/dev/log'.
+            **kwargs      (Any                    , optional): `SocketSink` and `BatchSink` arguments.
+
+        Raises:
+            ValueError: If 'facility' argument value is out of range.
+        """
+
+        if not (0 <= facility <= 23):
+            raise ValueError(
+                f"'facility' argument value {facility} is invalid, must be between 0 and 23!"
+            )
+
+        self.syslog_format = SyslogFormatEnum(syslog_format)
+        self.facility = facility
+        self.app_name = self._to_printable(app_name, 48) or "-"
+        self.sd_id = self._to_printable(sd_id, 32) or "extra@32473"
+        self.sd_keys = list(sd_keys or [])
+        self._sd_params = [
+            (_key, f' {self._to_printable(_key, 32)}="') for _key in self.sd_keys
+        ]
+        self._is_datagram = False
+        super().__init__(protocol=protocol, path=path, **kwargs)
+
+    @staticmethod
+    def _to_printable(value: str, max_length: int) -> str:
+        # Header fields and SD names allow only printable US-ASCII (without space, '=', ']' and '"' for names):
+        return "".join(
+            _char if (("!" <= _char <= "~") and (_char not in '=]"')) else "_"
+            for _char in value
+        )[:max_length]
+
+    @staticmethod
+    def _escape_sd_value(value: Any) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("]", "\\]")
+
+    def _init_sender(self) -> None:
+        # Pre-render per-process header parts, pid changes after fork:
+        _hostname = self._to_printable(socket.gethostname(), 255) or "-"
+        _pid = os.getpid()
+        if self.syslog_format == SyslogFormatEnum.RFC3164:
+            self._prefixes = {
+                _severity: f"<{(self.facility * 8) + _severity}>"
+                for _severity in range(8)
+            }
+            self._header = f" {_hostname.split('.')[0]} {self.app_name}[{_pid}]: "
+        else:
+            self._prefixes = {
+                _severity: f"<{(self.facility * 8) + _severity}>1 "
+                for _severity in range(8)
+            }
+            self._header = f" {_hostname} {self.app_name} {_pid} - "
+
+        super()._init_sender()
+
+    def _get_severity(self, level_no: int) -> int:
+        for _level_no, _severity in self._SEVERITIES:
+            if _level_no <= level_no:
+                return _severity
+
+        return 7
+
+    def _get_structured_data(self, extra: dict[str, Any]) -> str:
+        _params = [
+            f'{_param}{self._escape_sd_value(extra[_key])}"'
+            for _key, _param in self._sd_params
+            if extra.get(_key) not in (None, "")
+        ]
+        if not _params:
+            return "-"
+
+        return f"[{self.sd_id}{''.join(_params)}]"
+
+    def _encode(self, message: Any) -> bytes:
+        _record = message.record
+        _text = str.__str__(message).rstrip("\n")
+        _prefix = self._prefixes[self._get_severity(_record["level"].no)]
+        _time = _record["time"]
+        if self.syslog_format == SyslogFormatEnum.RFC3164:
+            _line = (
+                f"{_prefix}{self._MONTHS[_time.month - 1]} {_time.day:>2} {_time:%H:%M:%S}"
+                f"{self._header}{_text}"
+            )
+        else:
+            _line = (
+                f"{_prefix}{_time.isoformat(timespec='microseconds')}{self._header}"
+                f"{self._get_structured_data(_record['extra'])} {_text}"
+            )
+
+        _data = _line.encode(self.encoding, errors="replace")
+        if self.protocol == SocketProtocolEnum.TCP:
+            # Octet-counting framing (RFC 6587):
+            return f"{len(_data)} ".encode() + _data
+
+        return _data
+
+    def _connect(self) -> None:
+        if self.protocol != SocketProtocolEnum.UNIX:
+            self._is_datagram = self.protocol == SocketProtocolEnum.UDP
+            super()._connect()
+            return
+
+        # Local syslog socket ('/dev/log') is usually datagram, fall back to stream:
+        for _type in (socket.SOCK_DGRAM, socket.SOCK_STREAM):
+            _socket = socket.socket(socket.AF_UNIX, _type)
+            try:
+                _socket.settimeout(self.timeout)
+                _socket.connect(self.address)
+            except OSError:
+                _socket.close()
+                if _type == socket.SOCK_STREAM:
+                    raise
+
+                continue
+
+            self._is_datagram = _type == socket.SOCK_DGRAM
+            self._socket = _socket
+            return
+
+    def _send(self, batch: list[bytes]) -> None:
+        _socket: socket.socket = self._socket  # type: ignore
+        if self._is_datagram:
+            # One message per datagram:
+            for _data in batch:
+                _socket.send(_data)
+
+            return
+
+        if self.protocol == SocketProtocolEnum.UNIX:
+            # Local stream syslog socket messages are null-terminated:
+            _socket.sendall(b"\x00".join(batch) + b"\x00")
+            return
+
+        _socket.sendall(b"".join(batch))
+
+
+__all__ = [
+    "BatchSink",
+    "SocketSink",
+    "HttpSink",
+    "SyslogSink",
+]
@@ -0,0 +1,207 @@
+import os
+import sys
+import select
+import threading
+import traceback
+from collections.abc import Callable
+
+# inotify constants from <sys/inotify.h>:
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+
+
+def _init_inotify(dir_path: str) -> int | None:
+    """Initialize non-blocking inotify file descriptor watching the directory, with ctypes (Linux only).
+
+    Args:
+        dir_path (str, required): Directory path to watch.
+
+    Returns:
+        int | None: inotify file descriptor, None if inotify is not available.
+    """
+
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        import ctypes
+        import ctypes.util
+
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        _fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if _fd < 0:
+            return None
+
+        if _libc.inotify_add_watch(_fd, os.fsencode(dir_path), _IN_MASK) < 0:
+            os.close(_fd)
+            return None
+
+        return _fd
+    except (OSError, AttributeError):
+        return None
+
+
+class ConfigWatcher:
+    """ConfigWatcher class for watching config file changes on a background thread.
+
+    Parent directory is watched with inotify where available (so editors replacing the file and symlink swaps
+    are detected too), otherwise file is polled by modification time. Callback is called only when file's
+    signature (mtime, size, inode) is changed, and never when the file is missing.
+
+    Attributes:
+        _DEBOUNCE (float): Seconds to wait for more events before checking the file (e.g. multiple writes).
+
+        path     (str                 ): Watched file path.
+        callback (Callable[[], None]  ): Function to call when the file is changed.
+        interval (float               ): Polling interval (seconds), also max stop delay for inotify backend.
+        backend  (str                 ): Used backend, 'inotify' or 'polling'.
+
+    Methods:
+        start(): Start watcher thread.
+        stop() : Stop watcher thread.
+    """
+
+    _DEBOUNCE = 0.05
+
+    def __init__(
+        self,
+        path: str,
+        callback: Callable[[], None],
+        interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        """ConfigWatcher constructor method.
+
+        Args:
+            path        (str               , required): File path to watch.
+            callback    (Callable[[], None], required): Function to call when the file is changed.
+            interval    (float             , optional): Polling interval (seconds). Default is 1.0.
+            use_inotify (bool              , optional): Use inotify if available. Default is True.
+
+        Raises:
+            ValueError: If 'interval' argument value is not positive.
+        """
+
+        if interval <= 0:
+            raise ValueError(
+                f"'interval' argument value {interval} is invalid, must be greater than 0!"
+            )
+
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self.interval = interval
+
+        self._inotify_fd: int | None = None
+        if use_inotify:
+            self._inotify_fd = _init_inotify(os.path.dirname(self.path))
+
+        self.backend = "inotify" if self._inotify_fd is not None else "polling"
+        self._signature = self._get_signature()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _get_signature(self) -> tuple[int, int, int] | None:
+        try:
+            _stat = os.stat(self.path)
+        except OSError:
+            return None
+
+        return (_stat.st_mtime_ns, _stat.st_size, _stat.st_ino)
+
+    def _check(self) -> None:
+        _signature = self._get_signature()
+        if (_signature is None) or (_signature == self._signature):
+            return
+
+        self._signature = _signature
+        try:
+            self.callback()
+        except Exception:
+            sys.stderr.write("--- Error in beans-logging config watcher callback ---\n")
+            traceback.print_exc(file=sys.stderr)
+
+    def _drain_inotify(self) -> None:
+        try:
+            while os.read(self._inotify_fd, 65_536):  # type: ignore
+                pass
+        except BlockingIOError:
+            pass
+
+    def _watch_inotify(self) -> None:
+        _fd: int = self._inotify_fd  # type: ignore
+        while not self._stop_event.is_set():
+            try:
+                _readable, _, _ = select.select([_fd], [], [], self.interval)
+            except (OSError, ValueError):
+                # File descriptor is closed by `stop()`:
+                break
+
+            if not _readable:
+                continue
+
+            self._drain_inotify()
+            # Wait for following events of the same change (e.g. truncate and write):
+            if self._stop_event.wait(self._DEBOUNCE):
+                break
+
+            self._drain_inotify()
+            self._check()
+
+    def _watch_polling(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._check()
+
+    def start(self) -> None:
+        """Start watcher thread."""
+
+        if (self._thread is not None) and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=(
+                self._watch_inotify
+                if self._inotify_fd is not None
+                else self._watch_polling
+            ),
+            name="beans-logging-config-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+        return
+
+    def stop(self) -> None:
+        """Stop watcher thread and close inotify file descriptor."""
+
+        self._stop_event.set()
+        if (
+            (self._thread is not None)
+            and self._thread.is_alive()
+            and (self._thread is not threading.current_thread())
+        ):
+            self._thread.join()
+
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+        return
+
+
+__all__ = [
+    "ConfigWatcher",
+]
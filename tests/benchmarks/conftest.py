@@ -0,0 +1,213 @@
+import time
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterator
+from multiprocessing import get_context
+
+import pytest
+
+if TYPE_CHECKING:
+    from loguru import Record
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.constants import DEFAULT_HANDLER_NAMES
+
+_BENCHMARKS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Benchmarks are excluded from the default test run by 'benchmarks' marker (see 'pytest.ini'):
+    for _item in items:
+        if _BENCHMARKS_DIR in _item.path.parents:
+            _item.add_marker(pytest.mark.benchmarks)
+
+
+@pytest.fixture
+def all_handlers_logger(tmp_path) -> Iterator[Logger]:
+    _logger_loader = LoggerLoader(
+        file={"logs_dir": str(tmp_path)},
+        handlers={_name: {"enabled": True} for _name in DEFAULT_HANDLER_NAMES},
+    )
+    _logger = _logger_loader.load()
+
+    yield _logger
+
+    _logger_loader.remove_handler()
+
+
+@pytest.fixture
+def make_record() -> Iterator[Callable[..., "Record"]]:
+    from loguru import logger
+
+    _records: list["Record"] = []
+    _handler_id = logger.add(
+        lambda message: _records.append(message.record), level=0, format="{message}"
+    )
+
+    def _make_record(
+        message: str = "Benchmarking record.",
+        exception: bool = False,
+        extra: dict[str, Any] | None = None,
+    ) -> "Record":
+        _logger = logger.bind(**(extra or {}))
+        if exception:
+            try:
+                raise ValueError("Benchmarking exception.")
+            except ValueError:
+                _logger.exception(message)
+        else:
+            _logger.info(message)
+
+        return _records.pop()
+
+    yield _make_record
+
+    logger.remove(_handler_id)
+
+
+def get_handler_options(
+    logs_dir: str, handler_name: str, handler_type: str | None = None
+) -> dict[str, Any]:
+    """Get logger loader options with only one default handler enabled, optionally with another handler type."""
+
+    _handlers: dict[str, Any] = {
+        _name: {"enabled": _name == handler_name} for _name in DEFAULT_HANDLER_NAMES
+    }
+    if handler_type:
+        _handlers[handler_name]["type_"] = handler_type
+
+    return {"file": {"logs_dir": logs_dir}, "handlers": _handlers}
+
+
+def get_handler_level(handler_name: str) -> str:
+    """Get level to log at, so error handlers don't filter out benchmarking records."""
+
+    return "ERROR" if handler_name.startswith("err_") else "INFO"
+
+
+def summarize(latencies_ns: list[int], elapsed: float) -> dict[str, float]:
+    """Summarize per-call latencies into throughput and percentiles."""
+
+    _latencies = sorted(latencies_ns)
+    _count = len(_latencies)
+
+    def _percentile(percent: float) -> float:
+        return _latencies[min(_count - 1, int(_count * percent / 100))] / 1_000
+
+    return {
+        "records": _count,
+        "ops_per_sec": round(_count / elapsed, 2),
+        "p50_us": _percentile(50),
+        "p99_us": _percentile(99),
+        "max_us": _latencies[-1] / 1_000,
+    }
+
+
+def _measure(func: Callable[[], Any], iterations: int, latencies_ns: list[int]) -> None:
+    _perf_counter_ns = time.perf_counter_ns
+    for _ in range(iterations):
+        _start = _perf_counter_ns()
+        func()
+        latencies_ns.append(_perf_counter_ns() - _start)
+
+
+def run_threads(
+    func: Callable[[], Any], threads: int, iterations: int
+) -> dict[str, float]:
+    """Call function from multiple threads at the same time and summarize latencies.
+
+    Args:
+        func       (Callable[[], Any], required): Function to benchmark.
+        threads    (int              , required): Number of threads.
+        iterations (int              , required): Number of calls per thread.
+
+    Returns:
+        dict[str, float]: Throughput (ops/sec) and p50/p99/max latencies (microseconds).
+    """
+
+    _barrier = threading.Barrier(threads + 1)
+    _latencies_list: list[list[int]] = [[] for _ in range(threads)]
+
+    def _worker(latencies_ns: list[int]) -> None:
+        _barrier.wait()
+        _measure(func=func, iterations=iterations, latencies_ns=latencies_ns)
+
+    _threads = [
+        threading.Thread(target=_worker, args=(_latencies,))
+        for _latencies in _latencies_list
+    ]
+    for _thread in _threads:
+        _thread.start()
+
+    _barrier.wait()
+    _start = time.perf_counter()
+    for _thread in _threads:
+        _thread.join()
+
+    _elapsed = time.perf_counter() - _start
+    return summarize(
+        latencies_ns=[_ns for _latencies in _latencies_list for _ns in _latencies],
+        elapsed=_elapsed,
+    )
+
+
+def _process_worker(
+    args: tuple[str, str, str | None, int],
+) -> tuple[list[int], float]:
+    _logs_dir, _handler_name, _handler_type, _iterations = args
+
+    from loguru import logger
+    from beans_logging import LoggerLoader
+
+    _logger_loader = LoggerLoader(
+        **get_handler_options(_logs_dir, _handler_name, _handler_type)
+    )
+    _logger_loader.load()
+    _level = get_handler_level(_handler_name)
+
+    _latencies_ns: list[int] = []
+    _start = time.perf_counter()
+    _measure(
+        func=lambda: logger.log(
+            _level, "Benchmarking records from multiple processes."
+        ),
+        iterations=_iterations,
+        latencies_ns=_latencies_ns,
+    )
+    _elapsed = time.perf_counter() - _start
+
+    _logger_loader.remove_handler()
+    return _latencies_ns, _elapsed
+
+
+def run_processes(
+    logs_dir: str,
+    handler_name: str,
+    processes: int,
+    iterations: int,
+    handler_type: str | None = None,
+) -> dict[str, float]:
+    """Log from multiple processes into the same handler and summarize latencies.
+
+    Args:
+        logs_dir     (str       , required): Logs directory.
+        handler_name (str       , required): Default handler name to enable.
+        processes    (int       , required): Number of processes.
+        iterations   (int       , required): Number of records per process.
+        handler_type (str | None, optional): Handler type to override (e.g. 'QUEUE'). Default is None.
+
+    Returns:
+        dict[str, float]: Throughput (ops/sec) and p50/p99/max latencies (microseconds).
+    """
+
+    with get_context("spawn").Pool(processes=processes) as _pool:
+        _results = _pool.map(
+            _process_worker,
+            [(logs_dir, handler_name, handler_type, iterations)] * processes,
+        )
+
+    return summarize(
+        latencies_ns=[_ns for _latencies, _ in _results for _ns in _latencies],
+        elapsed=max(_elapsed for _, _elapsed in _results),
+    )
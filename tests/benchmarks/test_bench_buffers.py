@@ -0,0 +1,24 @@
+from typing import Any
+
+import pytest
+from loguru import logger
+
+from beans_logging import LoggerLoader
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"enqueue": True}, {"ring_buffer": {"capacity": 65_536, "policy": "DROP_OLDEST"}}],
+    ids=["enqueue", "ring_buffer"],
+)
+def test_bench_file_queue(benchmark, tmp_path, options: dict[str, Any]):
+    logger.remove()
+    _logger_loader = LoggerLoader(file={"logs_dir": str(tmp_path)})
+    _logger_loader.add_handler(
+        name="bench_file_handler",
+        handler={"type_": "FILE", "sink": "bench.log", **options},
+    )
+
+    benchmark(logger.info, "Benchmarking file handler queue.")
+
+    _logger_loader.remove_handler()
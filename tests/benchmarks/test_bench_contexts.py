@@ -0,0 +1,68 @@
+import pytest
+
+from beans_logging.contexts import ContextFields, reset_context, set_context
+from beans_logging.filters import add_level_short, patch_record
+
+_HEADERS = [
+    (b"host", b"localhost"),
+    (b"user-agent", b"bench"),
+    (b"x-request-id", b"req-1"),
+    (b"x-trace-id", b"trace-1"),
+    (b"x-user-id", b"user-1"),
+]
+
+
+@pytest.mark.parametrize("method", ["bind", "contextualize", "context"])
+def test_bench_context_request(benchmark, method: str):
+    """Per-request overhead of setting request values, before any record is logged."""
+
+    from loguru import logger
+
+    _fields = ContextFields()
+
+    def _bind() -> None:
+        logger.bind(**_fields.from_asgi_headers(_HEADERS))
+
+    def _contextualize() -> None:
+        with logger.contextualize(**_fields.from_asgi_headers(_HEADERS)):
+            pass
+
+    def _context() -> None:
+        reset_context(set_context(**_fields.from_asgi_headers(_HEADERS)))
+
+    benchmark(
+        {"bind": _bind, "contextualize": _contextualize, "context": _context}[method]
+    )
+
+
+@pytest.mark.parametrize("method", ["bind", "contextualize", "context"])
+def test_bench_context_record(benchmark, method: str):
+    """Per-record overhead of logging with request values (enriching filter included)."""
+
+    from loguru import logger
+
+    _values = {"request_id": "req-1", "trace_id": "trace-1", "user_id": "user-1"}
+    _records: list = []
+    logger.configure(extra={"request_id": "", "trace_id": "", "user_id": ""})
+    _handler_id = logger.add(
+        lambda message: _records.append(message.record["extra"]["request_id"]),
+        format="{message}",
+        filter=add_level_short if method != "context" else patch_record,
+    )
+    try:
+        if method == "bind":
+            benchmark(logger.bind(**_values).info, "Benchmarking record.")
+        elif method == "contextualize":
+            with logger.contextualize(**_values):
+                benchmark(logger.info, "Benchmarking record.")
+        else:
+            _token = set_context(**_values)
+            try:
+                benchmark(logger.info, "Benchmarking record.")
+            finally:
+                reset_context(_token)
+    finally:
+        logger.remove(_handler_id)
+        logger.configure(extra={})
+
+    assert _records[-1] == "req-1"
@@ -0,0 +1,71 @@
+import pytest
+
+from beans_logging import Logger
+from beans_logging.filters import add_level_short, build_filter
+
+
+def test_bench_all_handlers(benchmark, all_handlers_logger: Logger):
+    _logger = all_handlers_logger
+
+    benchmark.extra_info["handlers"] = 5
+    benchmark(_logger.info, "Benchmarking records/sec with all default handlers.")
+
+
+def test_bench_compiled_filter(benchmark, all_handlers_logger: Logger):
+    _records = []
+    _handler_id = all_handlers_logger.add(
+        lambda message: _records.append(message.record),
+        level="INFO",
+        format="{message}",
+    )
+    all_handlers_logger.info("Capturing record.")
+    all_handlers_logger.remove(_handler_id)
+
+    _record = add_level_short(_records[0])
+    _filters = [build_filter(f"handler_{_i}") for _i in range(5)]
+
+    def _run_filters() -> bool:
+        for _filter in _filters:
+            if not _filter(_record):
+                return False
+        return True
+
+    assert benchmark(_run_filters)
+
+
+def test_bench_sampled_filter(benchmark, make_record):
+    from beans_logging.samplers import Sampler
+
+    _record = add_level_short(make_record())
+    _sampler = Sampler(rate=1_000_000_000)
+    _filter = build_filter("handler_0", sampler=_sampler)
+
+    def _run_filter() -> bool:
+        _record.pop(_sampler.record_key, None)
+        return _filter(_record)
+
+    assert benchmark(_run_filter)
+    _sampler.stop()
+
+
+@pytest.mark.parametrize("repeated", [False, True], ids=["unique", "repeated"])
+def test_bench_dedup_filter(benchmark, make_record, repeated: bool):
+    from beans_logging.deduplicators import Deduplicator
+
+    _records = [add_level_short(make_record(f"Record {_i}.")) for _i in range(2)]
+    _dedup = Deduplicator(window=3_600, filter_=build_filter("handler_0"))
+
+    if repeated:
+        _record = _records[0]
+        benchmark(_dedup, _record)
+    else:
+        _i = 0
+
+        def _run_filter() -> bool:
+            nonlocal _i
+            _i ^= 1
+            return _dedup(_records[_i])
+
+        assert benchmark(_run_filter)
+
+    _dedup.stop()
@@ -0,0 +1,84 @@
+import pytest
+
+from beans_logging.constants import JsonBackendEnum
+from beans_logging.formats import JsonFormatter
+
+_LARGE_EXTRA = {
+    f"key_{_i}": {"value": _i, "items": list(range(10))} for _i in range(50)
+}
+
+
+@pytest.mark.parametrize("backend", list(JsonBackendEnum))
+@pytest.mark.parametrize(
+    "case",
+    [
+        {},
+        {"exception": True},
+        {"extra": _LARGE_EXTRA},
+    ],
+    ids=["plain", "exception", "large_extra"],
+)
+def test_bench_json_format(benchmark, make_record, backend: JsonBackendEnum, case):
+    try:
+        _json_formatter = JsonFormatter(backend=backend)
+    except ImportError as err:
+        pytest.skip(str(err))
+
+    _record = make_record(**case)
+    benchmark.extra_info["backend"] = backend.value
+    benchmark(_json_formatter.serialize, _record)
+
+
+@pytest.mark.parametrize("exception", [False, True], ids=["plain", "exception"])
+def test_bench_json_format_func(benchmark, make_record, exception: bool):
+    from beans_logging.formats import json_format, get_json_formatter
+
+    _record = make_record(exception=exception)
+    _record_key = get_json_formatter().record_key
+
+    def _format() -> str:
+        # Serialized record is cached in the record, so remove it to measure every call:
+        _record.pop(_record_key, None)
+        return json_format(_record)
+
+    benchmark(_format)
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        {},
+        {"exception": True},
+        {"extra": _LARGE_EXTRA},
+    ],
+    ids=["plain", "exception", "large_extra"],
+)
+def test_bench_binary_format(benchmark, make_record, case):
+    from beans_logging.binary import BinaryEncoder
+
+    _record = make_record(**case)
+    benchmark(BinaryEncoder().encode, _record)
+
+
+@pytest.mark.parametrize("colorize", [False, True], ids=["plain", "colorized"])
+@pytest.mark.parametrize("cached", [False, True], ids=["static", "cached"])
+def test_bench_text_format(benchmark, cached: bool, colorize: bool):
+    from loguru._logger import Core, Logger
+
+    from beans_logging.config import get_default_handlers
+    from beans_logging.filters import add_level_short
+    from beans_logging.formats import TextFormatter
+
+    # Separate logger core, so only the benchmarked handler formats each record:
+    _logger = Logger(Core(), None, 0, False, False, False, False, True, [], {})
+    _format = get_default_handlers()["std_handler"].format_
+    _logger.add(
+        lambda message: None,
+        format=TextFormatter(_format) if cached else _format,  # type: ignore
+        colorize=colorize,
+        filter=add_level_short,
+    )
+    try:
+        benchmark(_logger.info, "Benchmarking record.")
+    finally:
+        _logger.remove()
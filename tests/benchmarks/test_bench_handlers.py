@@ -0,0 +1,168 @@
+from collections.abc import Iterator
+
+import pytest
+from loguru import logger
+
+from beans_logging import LoggerLoader
+from beans_logging.constants import DEFAULT_HANDLER_NAMES
+from beans_logging.binary import read_binary_records
+
+from .conftest import (
+    get_handler_options,
+    get_handler_level,
+    run_threads,
+    run_processes,
+)
+
+# Total records per concurrent run, split between threads:
+_RECORDS = 2_000
+
+
+@pytest.fixture(params=DEFAULT_HANDLER_NAMES)
+def handler_name(request, tmp_path) -> Iterator[str]:
+    _logger_loader = LoggerLoader(**get_handler_options(str(tmp_path), request.param))
+    _logger_loader.load()
+
+    yield request.param
+
+    _logger_loader.remove_handler()
+
+
+def test_bench_handler(benchmark, handler_name: str):
+    benchmark.extra_info["handler"] = handler_name
+    benchmark(logger.log, get_handler_level(handler_name), "Benchmarking record.")
+
+
+@pytest.mark.parametrize("threads", [1, 8, 32])
+def test_bench_handler_threads(benchmark, handler_name: str, threads: int):
+    _level = get_handler_level(handler_name)
+
+    _result = benchmark.pedantic(
+        run_threads,
+        kwargs={
+            "func": lambda: logger.log(_level, "Benchmarking record from threads."),
+            "threads": threads,
+            "iterations": _RECORDS // threads,
+        },
+        rounds=1,
+        iterations=1,
+    )
+    benchmark.extra_info.update(handler=handler_name, threads=threads, **_result)
+    assert _result["records"] == (_RECORDS // threads) * threads
+
+
+@pytest.mark.parametrize("handler_name", ["file_handler", "json_handler"])
+def test_bench_handler_processes(benchmark, tmp_path, handler_name: str):
+    _processes = 4
+    _result = benchmark.pedantic(
+        run_processes,
+        kwargs={
+            "logs_dir": str(tmp_path),
+            "handler_name": handler_name,
+            "processes": _processes,
+            "iterations": _RECORDS // _processes,
+        },
+        rounds=1,
+        iterations=1,
+    )
+    benchmark.extra_info.update(handler=handler_name, processes=_processes, **_result)
+    assert _result["records"] == _RECORDS
+
+
+@pytest.mark.parametrize("handler_type", ["FILE", "QUEUE"])
+def test_bench_file_handler_processes(benchmark, tmp_path, handler_type: str):
+    _processes = 8
+    _options = get_handler_options(str(tmp_path), "file_handler", handler_type)
+    # This process owns the file (queue writer), workers only push records to it:
+    _logger_loader = LoggerLoader(**_options)
+    _logger_loader.load()
+    logger.info("Benchmarking file handler from multiple processes.")
+
+    _result = benchmark.pedantic(
+        run_processes,
+        kwargs={
+            "logs_dir": str(tmp_path),
+            "handler_name": "file_handler",
+            "handler_type": handler_type,
+            "processes": _processes,
+            "iterations": _RECORDS // _processes,
+        },
+        rounds=1,
+        iterations=1,
+    )
+    _logger_loader.remove_handler()
+
+    benchmark.extra_info.update(
+        handler="file_handler",
+        handler_type=handler_type,
+        processes=_processes,
+        **_result,
+    )
+    assert _result["records"] == _RECORDS
+    _lines = [
+        _line
+        for _path in tmp_path.glob("*.all.log")
+        for _line in _path.read_text().splitlines()
+        if _line.endswith("Benchmarking records from multiple processes.")
+    ]
+    assert len(_lines) == _RECORDS
+
+
+@pytest.mark.parametrize("binary", [False, True], ids=["json", "binary"])
+def test_bench_binary_file_handler(benchmark, tmp_path, binary: bool):
+    _logger_loader = LoggerLoader(
+        file={"logs_dir": str(tmp_path)},
+        handlers={_name: {"enabled": False} for _name in DEFAULT_HANDLER_NAMES},
+    )
+    _logger_loader.load()
+    _options: dict = {"binary": True} if binary else {"custom_serialize": True}
+    _logger_loader.add_handler(
+        name="bench_file_handler",
+        handler={"type_": "FILE", "sink": "bench.log", **_options},
+    )
+    _logger = logger.bind(request_id="bench-request", user_id=1_000)
+
+    benchmark(_logger.info, "Benchmarking record.")
+    _logger_loader.remove_handler()
+
+    # Disk volume per record, compared between json lines and binary records:
+    _path = tmp_path / "bench.log"
+    if binary:
+        _records = sum(1 for _ in read_binary_records(str(_path)))
+    else:
+        _records = len(_path.read_text().splitlines())
+
+    _size = _path.stat().st_size
+    benchmark.extra_info.update(
+        format="binary" if binary else "json",
+        file_size=_size,
+        bytes_per_record=round(_size / _records, 2),
+    )
+
+
+@pytest.mark.parametrize("metrics", [False, True], ids=["no_metrics", "metrics"])
+def test_bench_handler_metrics(benchmark, tmp_path, metrics: bool):
+    _options = get_handler_options(str(tmp_path), "file_handler")
+    _options["handlers"]["file_handler"]["enqueue"] = False
+    _logger_loader = LoggerLoader(metrics={"enabled": metrics}, **_options)
+    _logger_loader.load()
+    try:
+        benchmark(logger.info, "Benchmarking record with metrics.")
+    finally:
+        _logger_loader.remove_handler()
+
+
+@pytest.mark.parametrize("profiling", [False, True], ids=["no_profiling", "profiling"])
+def test_bench_handler_profiling(benchmark, tmp_path, profiling: bool):
+    _options = get_handler_options(str(tmp_path), "file_handler")
+    _options["handlers"]["file_handler"]["enqueue"] = False
+    _logger_loader = LoggerLoader(**_options)
+    _logger_loader.load()
+    if profiling:
+        _logger_loader.start_profiling()
+
+    try:
+        benchmark(logger.info, "Benchmarking record with profiling.")
+    finally:
+        _logger_loader.stop_profiling()
+        _logger_loader.remove_handler()
@@ -0,0 +1,54 @@
+import sys
+import subprocess
+
+# Generous budgets (microseconds of cumulative import time), slow CI runners shouldn't fail:
+_IMPORT_BUDGET_US = 100_000
+_AUTO_IMPORT_BUDGET_US = 3_000_000
+
+
+def _get_import_times(module: str) -> dict[str, int]:
+    """Import module in a fresh interpreter with '-X importtime' and parse cumulative times per module."""
+
+    _result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    _import_times: dict[str, int] = {}
+    for _line in _result.stderr.splitlines():
+        if not _line.startswith("import time:"):
+            continue
+
+        _parts = _line.split("|")
+        try:
+            _import_times[_parts[2].strip()] = int(_parts[1])
+        except ValueError:
+            # Header line:
+            continue
+
+    return _import_times
+
+
+def test_bench_import(benchmark):
+    _import_times = benchmark.pedantic(
+        _get_import_times, args=("beans_logging",), rounds=3, iterations=1
+    )
+    benchmark.extra_info["import_time_us"] = _import_times["beans_logging"]
+
+    for _module in ("pydantic", "loguru", "potato_util"):
+        assert _module not in _import_times, f"'{_module}' is imported eagerly!"
+
+    assert _import_times["beans_logging"] < _IMPORT_BUDGET_US
+
+
+def test_bench_import_auto(benchmark, tmp_path, monkeypatch):
+    # Run in empty directory, so no config file or logs directory is used:
+    monkeypatch.chdir(tmp_path)
+    _import_times = benchmark.pedantic(
+        _get_import_times, args=("beans_logging.auto",), rounds=3, iterations=1
+    )
+    benchmark.extra_info["import_time_us"] = _import_times["beans_logging.auto"]
+
+    assert _import_times["beans_logging.auto"] < _AUTO_IMPORT_BUDGET_US
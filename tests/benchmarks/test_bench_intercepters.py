@@ -0,0 +1,31 @@
+import logging
+from collections.abc import Iterator
+
+import pytest
+from loguru import logger
+
+from beans_logging.intercepters import InterceptHandler
+
+
+@pytest.fixture
+def std_logger() -> Iterator[logging.Logger]:
+    _std_logger = logging.getLogger("beans_logging.benchmarks.intercepted")
+    _std_logger.handlers = [InterceptHandler()]
+    _std_logger.propagate = False
+    _std_logger.setLevel(1)
+
+    logger.remove()
+    _handler_id = logger.add(lambda _: None, level="INFO", format="{message}")
+
+    yield _std_logger
+
+    logger.remove(_handler_id)
+    _std_logger.handlers = []
+
+
+def test_bench_intercepted_accepted(benchmark, std_logger: logging.Logger):
+    benchmark(std_logger.info, "Intercepted %s message.", "stdlib")
+
+
+def test_bench_intercepted_below_min_level(benchmark, std_logger: logging.Logger):
+    benchmark(std_logger.debug, "Intercepted %s message.", "stdlib")
@@ -0,0 +1,26 @@
+from typing import Any
+
+import pytest
+
+from beans_logging import LoggerLoader
+from beans_logging.constants import DEFAULT_HANDLER_NAMES
+
+
+@pytest.fixture
+def all_handlers_options(tmp_path) -> dict[str, Any]:
+    return {
+        "file": {"logs_dir": str(tmp_path)},
+        "handlers": {_name: {"enabled": True} for _name in DEFAULT_HANDLER_NAMES},
+    }
+
+
+def test_bench_loader_init(benchmark, all_handlers_options: dict[str, Any]):
+    benchmark(LoggerLoader, **all_handlers_options)
+
+
+def test_bench_loader_load(benchmark, all_handlers_options: dict[str, Any]):
+    _logger_loader = LoggerLoader(**all_handlers_options)
+
+    benchmark(_logger_loader.load)
+
+    _logger_loader.remove_handler()
@@ -0,0 +1,46 @@
+import json
+import datetime
+
+import pytest
+
+from beans_logging.queries import LogQuery, write_index, get_index_path
+
+_START_DT = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+_RECORDS = 100_000
+
+
+@pytest.fixture(scope="module")
+def json_log_path(tmp_path_factory) -> str:
+    _path = tmp_path_factory.mktemp("queries") / "bench.json.log"
+    with open(_path, "w") as _file:
+        for _i in range(_RECORDS):
+            _dt = _START_DT + datetime.timedelta(seconds=_i)
+            _record = {
+                "timestamp": _dt.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "level": "INFO",
+                "level_no": 20,
+                "name": "bench",
+                "message": f"Benchmarking record {_i}.",
+                "extra": {"request_id": f"req-{_i}"},
+            }
+            _file.write(json.dumps(_record) + "\n")
+
+    return str(_path)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["scan", "index"])
+def test_bench_query_time_range(benchmark, json_log_path: str, indexed: bool):
+    if indexed:
+        write_index(json_log_path, every=1_000)
+    else:
+        _index_path = get_index_path(json_log_path)
+        with open(_index_path, "w"):
+            pass  # Invalid index, so the whole file is scanned.
+
+    _query = LogQuery(
+        since=_START_DT + datetime.timedelta(seconds=50_000),
+        until=_START_DT + datetime.timedelta(seconds=50_099),
+    )
+    _lines = benchmark(lambda: list(_query.search(json_log_path)))
+    benchmark.extra_info.update(records=_RECORDS, indexed=indexed)
+    assert len(_lines) == 100
@@ -0,0 +1,21 @@
+import datetime
+
+import pytest
+
+from beans_logging.rotators import Rotator
+
+
+class _Message(str):
+    record: dict
+
+
+@pytest.mark.parametrize(
+    "text", ["Benchmarking record.", "日本語のログ。"], ids=["ascii", "utf8"]
+)
+def test_bench_should_rotate(benchmark, tmp_path, text: str):
+    _rotator = Rotator(rotate_size=1_000_000_000, rotate_time=datetime.time(0, 0, 0))
+    _message = _Message(text * 4 + "\n")
+    _message.record = {"time": datetime.datetime.now().astimezone()}
+
+    with open(tmp_path / "bench.log", "a", encoding="utf8") as _file:
+        assert not benchmark(_rotator.should_rotate, _message, _file)
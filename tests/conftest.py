@@ -14,3 +14,12 @@ def setup_and_teardown():
 
     # Equivalent of tearDown
     logger.info("Tearing down!")
+
+
+@pytest.fixture(name="logger")
+def loguru_logger():
+    from beans_logging import logger as _logger
+
+    yield _logger
+
+    del _logger
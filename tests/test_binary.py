@@ -0,0 +1,75 @@
+import io
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.__main__ import main
+from beans_logging.binary import (
+    packb,
+    unpackb,
+    read_binary_records,
+    convert_to_json,
+)
+
+
+def test_packb():
+    _obj = {
+        "str": "日本語" * 20,
+        "int": [0, 127, 128, -1, -33, 65_536, -70_000, 2**63, 2**70],
+        "float": 1.5,
+        "bool": [True, False, None],
+        "bytes": b"\x00\x01",
+        "nested": {"list": list(range(20))},
+    }
+    _expected = dict(
+        _obj,
+        int=[0, 127, 128, -1, -33, 65_536, -70_000, 2**63, "1180591620717411303424"],
+    )
+    assert unpackb(packb(_obj)) == _expected
+
+
+def test_binary_handler(logger: Logger, tmp_path):
+    logger.info("Testing binary handler...")
+
+    _logger_loader = LoggerLoader(app_name="test", file={"logs_dir": str(tmp_path)})
+    _logger_loader.add_handler(
+        name="binary_handler",
+        handler={"type_": "FILE", "sink": "{app_name}.bin.log", "binary": True},
+    )
+    _logger_loader.add_handler(
+        name="json_file_handler",
+        handler={
+            "type_": "FILE",
+            "sink": "{app_name}.json.log",
+            "custom_serialize": True,
+        },
+    )
+
+    _logger = logger.bind(disable_std_handler=True)
+    _logger.bind(key="value", number=1).info("Binary message 日本語")
+    try:
+        raise ValueError("Binary error.")
+    except ValueError:
+        _logger.exception("Binary exception")
+
+    _logger_loader.remove_handler("binary_handler")
+    _logger_loader.remove_handler("json_file_handler")
+
+    _path = str(tmp_path / "test.bin.log")
+    _records = list(read_binary_records(_path))
+    assert [_record["message"] for _record in _records] == [
+        "Binary message 日本語",
+        "Binary exception",
+    ]
+    assert _records[0]["extra"]["key"] == "value"
+    assert _records[1]["error"][0] == "ValueError"
+
+    # Converted json lines are same as the json handler output:
+    _output = io.StringIO()
+    assert convert_to_json(_path, _output) == 2
+    _json_lines = (tmp_path / "test.json.log").read_text()
+    assert _output.getvalue() == _json_lines
+
+    _json_path = tmp_path / "converted.json.log"
+    assert main(["convert", _path, "-o", str(_json_path)]) == 0
+    assert _json_path.read_text() == _json_lines
+
+    logger.success("Done: binary handler.\n")
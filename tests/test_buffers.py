@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.constants import OverflowPolicyEnum
+from beans_logging.buffers import RingBuffer, RingBufferSink
+
+
+class _Message(str):
+    record: dict
+
+
+def _make_message(text: str, level_no: int = 20) -> _Message:
+    _message = _Message(text)
+    _message.record = {"level": SimpleNamespace(no=level_no)}
+    return _message
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (OverflowPolicyEnum.DROP_OLDEST, ["2", "3", "4"]),
+        (OverflowPolicyEnum.DROP_NEWEST, ["0", "1", "2"]),
+        (OverflowPolicyEnum.DROP_BELOW_LEVEL, ["0", "1", "2"]),
+    ],
+)
+def test_ring_buffer_policies(policy: OverflowPolicyEnum, expected: list[str]):
+    _ring_buffer = RingBuffer(capacity=3, policy=policy)
+    for _i in range(5):
+        _ring_buffer.put(_make_message(str(_i)))
+
+    assert _ring_buffer.get_all() == expected
+    assert _ring_buffer.enqueued == (
+        len(expected) + (2 if policy == OverflowPolicyEnum.DROP_OLDEST else 0)
+    )
+    assert _ring_buffer.dropped == 2
+    assert _ring_buffer.high_water == 3
+
+
+def test_ring_buffer_sink(logger: Logger, tmp_path):
+    logger.info("Testing 'RingBufferSink' with file handler...")
+
+    _logger_loader = LoggerLoader(app_name="test", file={"logs_dir": str(tmp_path)})
+    _logger_loader.add_handler(
+        name="ring_file_handler",
+        handler={
+            "type_": "FILE",
+            "sink": "{app_name}.ring.log",
+            "format": "{message}",
+            "ring_buffer": {"capacity": 16, "policy": "BLOCK"},
+        },
+    )
+    _sink = _logger_loader.get_handler_sink("ring_file_handler")
+    assert isinstance(_sink, RingBufferSink)
+
+    for _i in range(100):
+        logger.bind(disable_std_handler=True).info(f"Ring message {_i}")
+
+    _logger_loader.remove_handler("ring_file_handler")
+    _lines = (tmp_path / "test.ring.log").read_text().splitlines()
+    _ring_lines = [_line for _line in _lines if _line.startswith("Ring message")]
+    assert _ring_lines == [f"Ring message {_i}" for _i in range(100)]
+    assert _sink.stats["enqueued"] >= 100
+    assert _sink.stats["dropped"] == 0
+
+    logger.success("Done: 'RingBufferSink' with file handler.\n")
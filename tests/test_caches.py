@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from beans_logging import LoggerLoader
+from beans_logging.caches import ConfigCache, get_default_cache_dir
+
+_CONFIG_TEMPLATE = """
+logger:
+  app_name: {app_name}
+  level:
+    base: DEBUG
+  handlers:
+    file_handler:
+      enabled: true
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch) -> str:
+    monkeypatch.setattr(LoggerLoader, "_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+
+    _config_path = tmp_path / "logger.yml"
+    _config_path.write_text(_CONFIG_TEMPLATE.format(app_name="cached-app"))
+    return str(_config_path)
+
+
+def _load_config(config_path: str) -> LoggerLoader:
+    _logger_loader = LoggerLoader(config_path=config_path)
+    _logger_loader._load_config_file()
+    return _logger_loader
+
+
+def test_config_cache_hit(config_path: str, monkeypatch):
+    _config = _load_config(config_path).config
+    assert len(os.listdir(LoggerLoader._CONFIG_CACHE_DIR)) == 1
+
+    def _fail_read(*args, **kwargs):
+        raise AssertionError("Config file shouldn't be parsed when snapshot matches!")
+
+    monkeypatch.setattr("beans_logging._core.io_utils.read_config_file", _fail_read)
+    _cached_config = _load_config(config_path).config
+
+    assert _cached_config.app_name == "cached-app"
+    assert _cached_config.model_dump() == _config.model_dump()
+
+
+def test_config_cache_changed(config_path: str):
+    _load_config(config_path)
+
+    with open(config_path, "w") as _file:
+        _file.write(_CONFIG_TEMPLATE.format(app_name="changed-app"))
+
+    assert _load_config(config_path).config.app_name == "changed-app"
+    # Snapshot is replaced, not accumulated:
+    assert len(os.listdir(LoggerLoader._CONFIG_CACHE_DIR)) == 1
+
+
+def test_config_cache_broken(config_path: str):
+    _load_config(config_path)
+
+    _cache_dir = LoggerLoader._CONFIG_CACHE_DIR
+    for _file_name in os.listdir(_cache_dir):
+        with open(os.path.join(_cache_dir, _file_name), "wb") as _file:
+            _file.write(b"broken snapshot")
+
+    assert _load_config(config_path).config.app_name == "cached-app"
+
+
+def test_config_cache_base_config(config_path: str):
+    _config_cache = ConfigCache(cache_dir=LoggerLoader._CONFIG_CACHE_DIR)
+    _key = _config_cache.get_key(
+        config_path=config_path, base_config=LoggerLoader().config
+    )
+    _other_key = _config_cache.get_key(
+        config_path=config_path, base_config=LoggerLoader(app_name="other").config
+    )
+
+    assert _key and _other_key
+    assert _key["name"] != _other_key["name"]
+
+
+def test_default_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("BEANS_LOGGING_CACHE_DIR", raising=False)
+    assert get_default_cache_dir() is None
+
+    monkeypatch.setenv("BEANS_LOGGING_CACHE_DIR", "false")
+    assert get_default_cache_dir() is None
+
+    monkeypatch.setenv("BEANS_LOGGING_CACHE_DIR", str(tmp_path))
+    assert get_default_cache_dir() == str(tmp_path)
+
+    # Home and relative paths are resolved, not created under current directory:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("BEANS_LOGGING_CACHE_DIR", "~/.cache/beans_logging")
+    assert get_default_cache_dir() == os.path.join(
+        str(tmp_path), ".cache", "beans_logging"
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BEANS_LOGGING_CACHE_DIR", "cache")
+    assert get_default_cache_dir() == os.path.join(str(tmp_path), "cache")
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("BEANS_LOGGING_CACHE_DIR", "true")
+    assert get_default_cache_dir() == os.path.join(str(tmp_path), "beans_logging")
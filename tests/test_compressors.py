@@ -0,0 +1,90 @@
+import os
+import gzip
+import time
+
+import pytest
+
+from beans_logging.compressors import Compressor
+
+
+def _write_log(path, text: str, mtime: float) -> str:
+    with open(path, "w", encoding="utf8") as _file:
+        _file.write(text)
+
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_compressor_compress(tmp_path):
+    _compressor = Compressor(format_="GZIP", level=1)
+    try:
+        _path = _write_log(tmp_path / "app.2024-01-01.log", "line\n" * 1000, 1_000)
+        _compressor.compress(_path)
+        _compressor.wait()
+
+        assert not os.path.exists(_path)
+        assert not os.path.exists(f"{_path}.gz.part")
+        with gzip.open(f"{_path}.gz", "rt", encoding="utf8") as _file:
+            assert _file.read() == "line\n" * 1000
+
+        # Original mtime is kept, so retention orders compressed files the same way:
+        assert os.stat(f"{_path}.gz").st_mtime == 1_000
+    finally:
+        _compressor.shutdown()
+
+
+def test_compressor_retention_waits(tmp_path):
+    _compressor = Compressor(format_="GZIP", workers=2)
+    try:
+        _now = time.time()
+        _paths = [
+            _write_log(tmp_path / f"app.{_i}.log", "line\n", _now - (100 - _i))
+            for _i in range(4)
+        ]
+        _retention = _compressor.make_retention(2)
+        for _path in _paths:
+            _compressor.compress(_path)
+
+        # Loguru calls retention right after compression with the uncompressed paths:
+        _retention(_paths)
+        _compressor.wait()
+
+        assert sorted(os.listdir(tmp_path)) == ["app.2.log.gz", "app.3.log.gz"]
+    finally:
+        _compressor.shutdown()
+
+
+def test_compressor_after_shutdown(tmp_path):
+    _compressor = Compressor(format_="BZ2")
+    _compressor.shutdown()
+
+    _path = _write_log(tmp_path / "app.log", "line\n", time.time())
+    _compressor.compress(_path)
+    assert os.path.exists(f"{_path}.bz2")
+
+
+def test_compressor_invalid_workers():
+    with pytest.raises(ValueError):
+        Compressor(workers=0)
+
+
+def test_compressor_invalid_level():
+    with pytest.raises(ValueError):
+        Compressor(format_="GZIP", level=15)
+    with pytest.raises(ValueError):
+        Compressor(format_="BZ2", level=0)
+
+    assert Compressor(format_="GZIP", level=0).level == 0
+
+
+def test_file_config_compression_level():
+    from pydantic import ValidationError
+
+    from beans_logging.config import FileConfigPM
+
+    with pytest.raises(ValidationError):
+        FileConfigPM(compression="GZIP", compression_level=15)
+
+    assert (
+        FileConfigPM(compression="ZSTD", compression_level=15).compression_level == 15
+    )
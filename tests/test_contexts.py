@@ -0,0 +1,111 @@
+import asyncio
+import contextvars
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.contexts import (
+    ContextFields,
+    context_scope,
+    get_context,
+    reset_context,
+    set_context,
+)
+from beans_logging.middlewares import ContextASGIMiddleware, ContextWSGIMiddleware
+
+
+def test_context_patcher(logger: Logger, tmp_path):
+    logger.info("Testing request context patcher...")
+
+    _logger_loader = LoggerLoader(
+        app_name="test",
+        file={"logs_dir": str(tmp_path)},
+        context={"fields": {"request_id": "X-Request-ID", "tenant_id": "X-Tenant-ID"}},
+    )
+    # Patcher of the application is kept after load:
+    logger.configure(patcher=lambda record: record["extra"].update(patched=True))
+    _logger_loader.load()
+    _extras: list[dict] = []
+    _handler_id = logger.add(
+        lambda message: _extras.append(dict(message.record["extra"])),
+        format="{message}",
+        filter=lambda record: "capture" in record["extra"],
+    )
+
+    _token = set_context(request_id="req-1", tenant_id="tenant-1")
+    try:
+        logger.bind(capture=True).info("Context message.")
+        # Bound values are kept over context values:
+        logger.bind(capture=True, request_id="bound").info("Bound message.")
+        with context_scope(tenant_id="tenant-2"):
+            assert get_context() == {"request_id": "req-1", "tenant_id": "tenant-2"}
+            logger.bind(capture=True).info("Scoped message.")
+    finally:
+        reset_context(_token)
+
+    logger.bind(capture=True).info("No context message.")
+    logger.remove(_handler_id)
+    _logger_loader.remove_handler()
+    logger.configure(patcher=lambda record: None)
+
+    assert [(_extra["request_id"], _extra.get("tenant_id")) for _extra in _extras] == [
+        ("req-1", "tenant-1"),
+        ("bound", "tenant-1"),
+        ("req-1", "tenant-2"),
+        ("", None),
+    ]
+    assert all(_extra["level_short"] and _extra["patched"] for _extra in _extras)
+
+    logger.success("Done: request context patcher.\n")
+
+
+def test_context_middlewares(logger: Logger):
+    logger.info("Testing request context ASGI/WSGI middlewares...")
+
+    _fields = ContextFields(
+        fields={"request_id": "X-Request-ID", "user_id": "X-User-ID"}
+    )
+    _contexts: list[dict[str, str]] = []
+
+    async def _asgi_app(scope, receive, send) -> None:
+        _contexts.append(get_context())
+
+    _asgi_middleware = ContextASGIMiddleware(_asgi_app, fields=_fields)
+    asyncio.run(
+        _asgi_middleware(
+            {
+                "type": "http",
+                "headers": [(b"x-request-id", b"req-1"), (b"x-user-id", b"user-1")],
+            },
+            None,  # type: ignore
+            None,  # type: ignore
+        )
+    )
+    asyncio.run(_asgi_middleware({"type": "http", "headers": []}, None, None))  # type: ignore
+    asyncio.run(_asgi_middleware({"type": "lifespan"}, None, None))  # type: ignore
+
+    def _wsgi_app(environ, start_response):
+        _contexts.append(get_context())
+        yield b"body"
+        _contexts.append(get_context())
+
+    _wsgi_middleware = ContextWSGIMiddleware(_wsgi_app, fields=_fields)
+    _response = _wsgi_middleware({"HTTP_X_REQUEST_ID": "req-2"}, lambda *args: None)
+    assert list(_response) == [b"body"]
+    _response.close()  # type: ignore
+
+    assert _contexts[0] == {"request_id": "req-1", "user_id": "user-1"}
+    # Missing request id is generated:
+    assert len(_contexts[1]["request_id"]) == 32
+    assert _contexts[2] == {}
+    assert _contexts[3] == _contexts[4] == {"request_id": "req-2"}
+    assert get_context() == {}
+
+    # Context values don't leak between chunks, and iteration can continue in another context:
+    _iterator = iter(
+        _wsgi_middleware({"HTTP_X_REQUEST_ID": "req-3"}, lambda *args: None)
+    )
+    assert next(_iterator) == b"body"
+    assert get_context() == {}
+    assert contextvars.copy_context().run(list, _iterator) == []
+    assert _contexts[-1] == {"request_id": "req-3"}
+
+    logger.success("Done: request context ASGI/WSGI middlewares.\n")
@@ -0,0 +1,190 @@
+import json
+import time
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.deduplicators import Deduplicator
+
+
+def test_dedup_handler(logger: Logger, tmp_path):
+    logger.info("Testing deduplication of repeated messages...")
+
+    _logger_loader = LoggerLoader(app_name="test", file={"logs_dir": str(tmp_path)})
+    _logger_loader.add_handler(
+        name="dedup_handler",
+        handler={
+            "type_": "FILE",
+            "sink": "{app_name}.dedup.log",
+            "format": "{level} {name}:{line} {message}",
+            "enqueue": False,
+            "dedup": {"window": 60},
+        },
+    )
+    _logger_loader.add_handler(
+        name="all_handler",
+        handler={
+            "type_": "FILE",
+            "sink": "{app_name}.all.log",
+            "format": "{level} {message}",
+            "enqueue": False,
+        },
+    )
+
+    # Plain handler without config filter:
+    _messages: list[str] = []
+    _handler_id = logger.add(_messages.append, format="{message}", level="WARNING")
+
+    for _ in range(100):
+        logger.error("Dependency is down!")
+
+    logger.error("Dependency is up.")
+    for _ in range(3):
+        logger.warning("Retrying...")
+
+    _logger_loader.remove_handler("dedup_handler")
+    _logger_loader.remove_handler("all_handler")
+    logger.remove(_handler_id)
+
+    _lines = (tmp_path / "test.dedup.log").read_text().splitlines()
+    assert [_line.split(" ", 1)[0] for _line in _lines] == [
+        "ERROR",
+        "ERROR",
+        "ERROR",
+        "WARNING",
+        "WARNING",
+    ]
+    assert _lines[0].endswith("Dependency is down!")
+    # Summary is logged from the same call-site as repeated records:
+    assert _lines[1].split(" ", 2)[1] == _lines[0].split(" ", 2)[1]
+    assert "Last message repeated 99 times between " in _lines[1]
+    assert _lines[2].endswith("Dependency is up.")
+    assert _lines[3].endswith("Retrying...")
+    # Pending summary is flushed when handler is removed:
+    assert "Last message repeated 2 times" in _lines[4]
+
+    # Summaries are routed only into the deduplicated handler:
+    _lines = (tmp_path / "test.all.log").read_text().splitlines()
+    assert len(_lines) == 104
+    assert not any("repeated" in _line for _line in _lines)
+    assert len(_messages) == 104
+    assert not any("repeated" in _message for _message in _messages)
+
+    logger.success("Done: deduplication of repeated messages.\n")
+
+
+def test_dedup_window(logger: Logger):
+    _records: list[dict] = []
+    _dedup = Deduplicator(window=0.2)
+    _handler_id = logger.add(
+        _dedup.wrap_sink(
+            lambda message: _records.append(message.record["extra"]),
+            format_="{message}",
+        ),
+        format="{message}",
+        filter=_dedup,
+    )
+    try:
+        for _ in range(10):
+            logger.info("Repeated message.")
+
+        assert len(_records) == 1
+
+        # Pending summary is flushed by background thread after window expiry:
+        _deadline = time.monotonic() + 5
+        while (len(_records) < 2) and (time.monotonic() < _deadline):
+            time.sleep(0.05)
+
+        assert _records[1]["repeat_count"] == 9
+        assert _records[1]["repeat_first"] <= _records[1]["repeat_last"]
+
+        logger.info("Repeated message.")
+        assert len(_records) == 3
+        assert _dedup.stats == {"repeated": 9, "summaries": 1}
+    finally:
+        _dedup.stop()
+        logger.remove(_handler_id)
+
+
+def test_dedup_json_handler(logger: Logger, tmp_path):
+    logger.info("Testing deduplication of json handlers...")
+
+    _logger_loader = LoggerLoader(app_name="test", file={"logs_dir": str(tmp_path)})
+    for _name, _serialize in (("json", "serialize"), ("custom", "custom_serialize")):
+        _logger_loader.add_handler(
+            name=f"{_name}_handler",
+            handler={
+                "type_": "FILE",
+                "sink": f"{{app_name}}.{_name}.json.log",
+                _serialize: True,
+                "enqueue": False,
+                "dedup": {"window": 60},
+            },
+        )
+
+    for _ in range(10):
+        logger.error("Dependency is down!")
+
+    logger.error("Dependency is up.")
+    _logger_loader.remove_handler("json_handler")
+    _logger_loader.remove_handler("custom_handler")
+
+    # Every line (including summary) is a json record same as handler's other records:
+    _records = [
+        json.loads(_line)
+        for _line in (tmp_path / "test.json.json.log").read_text().splitlines()
+    ]
+    assert [_record["record"]["message"] for _record in _records] == [
+        "Dependency is down!",
+        _records[1]["record"]["message"],
+        "Dependency is up.",
+    ]
+    assert "Last message repeated 9 times between " in _records[1]["text"]
+    assert _records[1]["record"]["extra"]["repeat_count"] == 9
+    assert _records[1]["record"]["line"] == _records[0]["record"]["line"]
+
+    _records = [
+        json.loads(_line)
+        for _line in (tmp_path / "test.custom.json.log").read_text().splitlines()
+    ]
+    assert len(_records) == 3
+    assert _records[1]["message"].startswith("Last message repeated 9 times between ")
+    assert _records[1]["extra"]["repeat_count"] == 9
+    assert _records[1]["error"] is None
+
+    logger.success("Done: deduplication of json handlers.\n")
+
+
+class _TtyStream:
+    encoding = "utf8"
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write(self, message: str) -> None:
+        self.lines.append(message)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+
+def test_dedup_tty_stream(logger: Logger):
+    _tty_stream = _TtyStream()
+    _logger_loader = LoggerLoader(handlers={"std_handler": {"enabled": False}})
+    _logger_loader.add_handler(
+        name="tty_handler",
+        handler={
+            "sink": _tty_stream,
+            "format": "<red>{message}</red>",
+            "dedup": {"window": 60},
+        },
+    )
+    for _ in range(3):
+        logger.info("Repeated message.")
+
+    _logger_loader.remove_handler("tty_handler")
+
+    # Colorized same as unwrapped terminal stream, summaries are written without colors:
+    assert _tty_stream.lines[0] == "\x1b[31mRepeated message.\x1b[0m\n"
+    assert _tty_stream.lines[1].startswith("Last message repeated 2 times between ")
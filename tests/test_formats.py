@@ -0,0 +1,124 @@
+import json
+import threading
+
+import pytest
+
+from beans_logging import Logger
+from beans_logging.constants import JsonBackendEnum
+from beans_logging.formats import JsonFormatter
+
+
+@pytest.mark.parametrize("backend", list(JsonBackendEnum))
+def test_json_formatter(logger: Logger, backend: JsonBackendEnum):
+    logger.info(f"Testing 'JsonFormatter' with '{backend.value}' backend...")
+
+    try:
+        _json_formatter = JsonFormatter(backend=backend)
+    except ImportError as err:
+        pytest.skip(str(err))
+
+    _messages: list[str] = []
+    _handler_id = logger.add(_messages.append, format=_json_formatter)
+    _other_extras: list[dict] = []
+    _other_id = logger.add(
+        lambda message: _other_extras.append(dict(message.record["extra"])),
+        format="{message}",
+    )
+    try:
+        try:
+            raise ValueError("Test error.")
+        except ValueError:
+            logger.bind(key="value").exception("Test message.")
+
+        # Message same as placeholder of pre-encoded process and thread parts:
+        _thread = threading.Thread(
+            target=lambda: logger.info("\x00process"), name="test-thread"
+        )
+        _thread.start()
+        _thread.join()
+    finally:
+        logger.remove(_handler_id)
+        logger.remove(_other_id)
+
+    _json_record = json.loads(_messages[0])
+    # Same schema and key order as baseline `json_format()`:
+    assert list(_json_record) == [
+        "timestamp",
+        "level",
+        "level_no",
+        "file",
+        "line",
+        "name",
+        "process",
+        "thread_name",
+        "message",
+        "extra",
+        "error",
+        "elapsed",
+    ]
+    assert _json_record["message"] == "Test message."
+    assert _json_record["extra"]["key"] == "value"
+    assert _json_record["error"]["type"] == "ValueError"
+    assert "id" in _json_record["process"]
+    assert "id" in _json_record["thread_name"]
+    assert not any(_key.startswith("serialized") for _key in _other_extras[0])
+
+    # Process and thread parts are encoded per thread:
+    _json_record = json.loads(_messages[1])
+    assert _json_record["message"] == "\x00process"
+    assert _json_record["process"] == json.loads(_messages[0])["process"]
+    assert _json_record["thread_name"] == {"name": "test-thread", "id": _thread.ident}
+
+    logger.success(f"Done: 'JsonFormatter' with '{backend.value}' backend.\n")
+
+
+@pytest.mark.parametrize("colorize", [False, True], ids=["plain", "colorized"])
+def test_text_formatter(logger: Logger, colorize: bool):
+    from beans_logging.config import LoggerConfigPM, get_default_handlers
+    from beans_logging.filters import add_level_short
+    from beans_logging.formats import TextFormatter
+
+    logger.info("Testing 'TextFormatter' output is same as static format...")
+
+    _formats = [
+        LoggerConfigPM().default_format,
+        get_default_handlers()["std_handler"].format_,
+        "{time:YYYY-MM-DD HH:mm:ss.SSS ZZ} {time:HH:mm:ss.SSS} {level.icon} {message}",
+    ]
+    for _format in _formats:
+        _text_formatter = TextFormatter(_format)  # type: ignore
+        assert _text_formatter.cached
+
+        _static_messages: list[str] = []
+        _dynamic_messages: list[str] = []
+        _handler_ids = [
+            logger.add(
+                _static_messages.append,
+                format=_format,
+                colorize=colorize,
+                filter=add_level_short,
+            ),
+            logger.add(
+                _dynamic_messages.append,
+                format=_text_formatter,
+                colorize=colorize,
+                filter=add_level_short,
+            ),
+        ]
+        try:
+            for _level in ("DEBUG", "INFO", "SUCCESS", "WARNING"):
+                logger.log(_level, "Test <message> {braces}.")
+
+            try:
+                raise ValueError("Test error.")
+            except ValueError:
+                logger.opt(colors=colorize).exception("Test <red>exception</red>.")
+        finally:
+            for _handler_id in _handler_ids:
+                logger.remove(_handler_id)
+
+        assert _dynamic_messages == _static_messages
+
+    assert not TextFormatter("{time} {message}").cached
+
+    logger.success("Done: 'TextFormatter'.\n")
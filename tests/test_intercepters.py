@@ -0,0 +1,132 @@
+import logging
+from collections.abc import Iterator
+
+import pytest
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.intercepters import InterceptHandler
+
+
+def test_intercept_level(logger: Logger, tmp_path):
+    logger.info("Testing intercepted standard logging levels...")
+
+    _logger_loader = LoggerLoader(
+        app_name="test",
+        file={"logs_dir": str(tmp_path)},
+        level={"base": "INFO"},
+    )
+    _logger_loader.load()
+    # Standard logging level is not synced with loguru handlers:
+    assert logging.root.level == 0
+
+    _messages: list[str] = []
+    _handler_id = logger.add(_messages.append, level="DEBUG", format="{message}")
+    try:
+        _std_logger = logging.getLogger("test.intercepted")
+        _std_logger.debug("Intercepted debug message.")
+        logger.remove(_handler_id)
+        _std_logger.debug("Dropped debug message.")
+    finally:
+        _logger_loader.remove_handler()
+
+    assert _messages == ["Intercepted debug message.\n"]
+
+    logger.success("Done: intercepted standard logging levels.\n")
+
+
+class _CountedArg:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __str__(self) -> str:
+        self.count += 1
+        return "counted"
+
+
+@pytest.fixture
+def std_logger() -> Iterator[logging.Logger]:
+    _std_logger = logging.getLogger("test.intercept_handler")
+    _std_logger.handlers = [InterceptHandler()]
+    _std_logger.setLevel(1)
+    _std_logger.propagate = False
+
+    yield _std_logger
+
+    _std_logger.handlers = []
+    _std_logger.propagate = True
+
+
+def test_intercept_level_mapping(logger: Logger, std_logger: logging.Logger):
+    logging.addLevelName(15, "TEST_VERBOSE")
+    _records: list[dict] = []
+    _handler_id = logger.add(
+        lambda message: _records.append(message.record), level=0, format="{message}"
+    )
+    try:
+        for _level in (
+            logging.DEBUG,
+            logging.INFO,
+            logging.WARNING,
+            logging.ERROR,
+            logging.CRITICAL,
+            15,
+        ):
+            std_logger.log(_level, "Level %d message.", _level)
+
+        try:
+            raise ValueError("Test error.")
+        except ValueError:
+            std_logger.exception("Exception message.")
+    finally:
+        logger.remove(_handler_id)
+
+    assert [(_record["level"].name, _record["level"].no) for _record in _records] == [
+        ("DEBUG", 10),
+        ("INFO", 20),
+        ("WARNING", 30),
+        ("ERROR", 40),
+        ("CRITICAL", 50),
+        # Standard level without loguru level is logged by its number:
+        ("Level 15", 15),
+        ("ERROR", 40),
+    ]
+    assert _records[0]["message"] == "Level 10 message."
+    # Caller is the standard logging call-site, not logging or intercepter frames:
+    assert {_record["function"] for _record in _records} == {
+        "test_intercept_level_mapping"
+    }
+    assert _records[-1]["exception"].type is ValueError
+
+
+def _make_record(level: int, arg: _CountedArg) -> logging.LogRecord:
+    return logging.LogRecord(
+        "test.intercept_handler", level, __file__, 1, "Level %s message.", (arg,), None
+    )
+
+
+def test_intercept_min_level(logger: Logger):
+    # Handler is called directly, standard logger handlers (pytest log capture) format records themselves:
+    _handler = InterceptHandler()
+    _messages: list[str] = []
+    _handler_id = logger.add(_messages.append, level="INFO", format="{message}")
+    _arg = _CountedArg()
+    try:
+        # Below minimum level of all loguru handlers, message is not formatted:
+        _handler.handle(_make_record(5, _arg))
+        assert _arg.count == 0
+
+        _handler.handle(_make_record(logging.INFO, _arg))
+        assert _arg.count == 1
+
+        # Minimum level follows added and removed loguru handlers:
+        _trace_id = logger.add(lambda _: None, level="TRACE")
+        _handler.handle(_make_record(5, _arg))
+        assert _arg.count == 2
+
+        logger.remove(_trace_id)
+        _handler.handle(_make_record(5, _arg))
+        assert _arg.count == 2
+    finally:
+        logger.remove(_handler_id)
+
+    assert _messages == ["Level counted message.\n"]
@@ -0,0 +1,249 @@
+import asyncio
+import logging
+import urllib.request
+from typing import Any
+
+import pytest
+
+from beans_logging import Logger, LoggerLoader, LogHandlerPM, logger
+from beans_logging.metrics import MetricsFilter, MetricsSink
+
+
+def test_handler_metrics(logger: Logger, tmp_path):
+    logger.info("Testing handler metrics...")
+
+    _metrics_path = tmp_path / "metrics.prom"
+    _logger_loader = LoggerLoader(
+        app_name="test",
+        file={"logs_dir": str(tmp_path), "rotate_size": 1_000},
+        metrics={"enabled": True, "export_path": str(_metrics_path), "http_port": 0},
+        handlers={
+            "std_handler": {"enabled": False},
+            "err_file_handler": {"enabled": True, "enqueue": False},
+        },
+    )
+    _logger_loader.load()
+    _logger_loader.add_handler(
+        name="ring_handler",
+        handler={
+            "type_": "FILE",
+            "sink": "{app_name}.ring.log",
+            "ring_buffer": {"capacity": 1_000},
+        },
+    )
+
+    for _i in range(50):
+        logger.info(f"Metrics message {_i}.")
+        logger.error(f"Metrics error message {_i}.")
+
+    logger.bind(disable_err_file_handler=True).error("Disabled error message.")
+
+    _stats = _logger_loader.stats()
+    assert "std_handler" not in _stats
+    _err_stats = _stats["err_file_handler"]
+    assert _err_stats["accepted"] == _err_stats["written"] == 50
+    # Levels below handler level are not passed into filter, only disabled record is filtered:
+    assert _err_stats["filtered"] == 1
+    assert _err_stats["bytes_written"] == sum(
+        _path.stat().st_size for _path in tmp_path.glob("test.err*.log")
+    )
+    assert _err_stats["rotations"] >= 1
+    assert _err_stats["queue_depth"] == 0
+    assert _err_stats["write_latency"]["count"] == 50
+    assert _err_stats["write_latency"]["buckets"]["+Inf"] == 50
+
+    _host, _port = _logger_loader._metrics_exporter.server_address  # type: ignore
+    with urllib.request.urlopen(f"http://{_host}:{_port}/metrics") as _response:
+        _text = _response.read().decode("utf-8")
+
+    assert (
+        'beans_logging_records_written_total{app="test",handler="err_file_handler"} 50'
+        in _text
+    )
+    assert "# TYPE beans_logging_write_latency_seconds histogram" in _text
+    assert (
+        'beans_logging_write_latency_seconds_bucket{app="test",handler="ring_handler",le="+Inf"}'
+        in _text
+    )
+
+    _logger_loader.remove_handler()
+    _logger_loader._metrics_exporter.stop()  # type: ignore
+    assert "beans_logging_records_accepted_total" in _metrics_path.read_text()
+
+    logger.success("Done: handler metrics.\n")
+
+
+class _TtyStream:
+    encoding = "utf8"
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write(self, message: str) -> None:
+        self.lines.append(message)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def test_metrics_sink_kinds(logger: Logger):
+    logger.info("Testing handler metrics with sink kinds...")
+
+    _tty_stream = _TtyStream()
+    _log_handler = _ListHandler()
+    _async_messages: list[str] = []
+
+    async def _async_sink(message) -> None:
+        await asyncio.sleep(0)
+        _async_messages.append(message)
+
+    _logger_loader = LoggerLoader(
+        metrics={"enabled": True}, handlers={"std_handler": {"enabled": False}}
+    )
+    _logger_loader.load()
+    for _name, _sink in (
+        ("tty_handler", _tty_stream),
+        ("log_handler", _log_handler),
+        ("async_handler", _async_sink),
+    ):
+        _logger_loader.add_handler(
+            name=_name,
+            handler={"sink": _sink, "format": "<red>{message}</red>", "level": "INFO"},
+        )
+
+    async def _log_messages() -> None:
+        for _i in range(3):
+            logger.info(f"Metrics message {_i}.")
+
+        await logger.complete()
+
+    asyncio.run(_log_messages())
+    _stats = _logger_loader.stats()
+    _logger_loader.remove_handler()
+
+    # Colorized same as unwrapped terminal stream:
+    assert _tty_stream.lines[0] == "\x1b[31mMetrics message 0.\x1b[0m\n"
+    assert _log_handler.messages == [f"Metrics message {_i}." for _i in range(3)]
+    assert _async_messages == [f"Metrics message {_i}.\n" for _i in range(3)]
+
+    assert _stats["tty_handler"]["written"] == 3
+    assert _stats["async_handler"]["written"] == 3
+    assert _stats["async_handler"]["bytes_written"] == sum(map(len, _async_messages))
+    # Logging handler sink is not wrapped, only its filter is counted:
+    assert _stats["log_handler"]["accepted"] == 3
+    assert _stats["log_handler"]["written"] == 0
+
+    with pytest.raises(ValueError, match="'dedup' can't be used"):
+        LogHandlerPM(sink=_log_handler, dedup={"window": 1})
+
+    with pytest.raises(ValueError, match="'dedup' can't be used"):
+        LogHandlerPM(sink=_async_sink, dedup={"window": 1})
+
+    logger.success("Done: handler metrics with sink kinds.\n")
+
+
+def _unwrap_chain(obj: Any, attr: str) -> list[Any]:
+    _chain = [obj]
+    while hasattr(_chain[-1], attr):
+        _chain.append(getattr(_chain[-1], attr))
+
+    return _chain
+
+
+def _get_loguru_handler(logger_loader: LoggerLoader, name: str) -> Any:
+    return logger._core.handlers[logger_loader.handlers_map[name]]  # type: ignore
+
+
+def test_metrics_runtime(logger: Logger):
+    logger.info("Testing handler metrics at runtime...")
+
+    _messages: list[str] = []
+    # Only handlers from config are rebuilt by reload:
+    _logger_loader = LoggerLoader(
+        app_name="test",
+        handlers={
+            "std_handler": {"enabled": False},
+            "list_handler": {
+                "sink": _messages.append,
+                "format": "{message}",
+                "level": "INFO",
+            },
+        },
+    )
+    _logger_loader.load()
+
+    # Disabled by default, handler filter and sink are not wrapped by metrics:
+    _handler = _get_loguru_handler(_logger_loader, "list_handler")
+    assert not any(
+        isinstance(_filter, MetricsFilter)
+        for _filter in _unwrap_chain(_handler._filter, "filter_")
+    )
+    assert not any(
+        isinstance(_sink, MetricsSink)
+        for _sink in _unwrap_chain(_handler._sink._stream, "sink")
+    )
+    assert _logger_loader.get_handler_sink("list_handler") == _messages.append
+    logger.info("Not counted message.")
+    assert _logger_loader.stats() == {}
+    assert "records_written_total{" not in _logger_loader.export_metrics()
+
+    # Enabled at runtime, handlers are rebuilt with metrics:
+    _logger_loader.update_config(config={"metrics": {"enabled": True}})
+    _logger_loader.reload(load_config_file=False)
+    _handler = _get_loguru_handler(_logger_loader, "list_handler")
+    assert any(
+        isinstance(_filter, MetricsFilter)
+        for _filter in _unwrap_chain(_handler._filter, "filter_")
+    )
+    for _i in range(5):
+        logger.info(f"Counted message {_i}.")
+
+    logger.debug("Below level message.")
+    logger.bind(disable_list_handler=True).info("Disabled message.")
+
+    _stats = _logger_loader.stats()["list_handler"]
+    assert _stats["accepted"] == _stats["written"] == 5
+    assert _stats["filtered"] == 1
+    assert _stats["bytes_written"] == sum(map(len, _messages[1:]))
+    assert _stats["write_latency"]["count"] == 5
+
+    _text = _logger_loader.export_metrics()
+    for _metric in (
+        'beans_logging_records_accepted_total{app="test",handler="list_handler"} 5',
+        'beans_logging_records_filtered_total{app="test",handler="list_handler"} 1',
+        'beans_logging_records_written_total{app="test",handler="list_handler"} 5',
+        'beans_logging_write_latency_seconds_count{app="test",handler="list_handler"} 5',
+        'beans_logging_write_latency_seconds_bucket{app="test",handler="list_handler",le="+Inf"} 5',
+    ):
+        assert _metric in _text.splitlines()
+
+    assert "# TYPE beans_logging_records_written_total counter" in _text
+    assert "# TYPE beans_logging_queue_depth gauge" in _text
+
+    # Disabled at runtime, handlers are rebuilt without metrics:
+    _logger_loader.update_config(config={"metrics": {"enabled": False}})
+    _logger_loader.reload(load_config_file=False)
+    _handler = _get_loguru_handler(_logger_loader, "list_handler")
+    assert not any(
+        isinstance(_filter, MetricsFilter)
+        for _filter in _unwrap_chain(_handler._filter, "filter_")
+    )
+    assert _logger_loader.stats() == {}
+    logger.info("Not counted message.")
+    assert len(_messages) == 7
+
+    _logger_loader.remove_handler()
+
+    logger.success("Done: handler metrics at runtime.\n")
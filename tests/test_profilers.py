@@ -0,0 +1,241 @@
+import json
+import asyncio
+import logging
+
+import pytest
+
+from beans_logging import Logger, LoggerLoader
+
+
+def test_profiler(logger: Logger, tmp_path):
+    logger.info("Testing call-site profiler...")
+
+    _logger_loader = LoggerLoader(
+        app_name="test",
+        file={"logs_dir": str(tmp_path)},
+        handlers={
+            "std_handler": {"enabled": False},
+            "file_handler": {"enabled": True, "enqueue": False},
+            "err_file_handler": {"enabled": True},
+        },
+    )
+    _logger_loader.load()
+    _handlers_map = dict(_logger_loader.handlers_map)
+    _logger_loader.start_profiling(sample_rate=1)
+
+    def _log_messages() -> None:
+        for _i in range(20):
+            logger.info(f"Profiled message {_i}.")
+            logger.error(f"Profiled error message {_i}.")
+
+    _log_messages()
+    logger.complete()
+    _logger_loader.stop_profiling()
+    # Not profiled after stop:
+    logger.info("Not profiled message.")
+    # Handlers are not rebuilt by starting and stopping profiling:
+    assert _logger_loader.handlers_map == _handlers_map
+
+    _report = json.loads(_logger_loader.profile_report(top=5, format_="JSON"))
+    assert _report["sample_rate"] == 1
+    assert _report["samples"] == 40
+    _totals = [_row["total_seconds"] for _row in _report["call_sites"]]
+    assert _totals == sorted(_totals, reverse=True)
+    assert {_row["name"].rsplit(":", 1)[0] for _row in _report["call_sites"]} == {
+        f"{__name__}:_log_messages"
+    }
+    assert all(_row["samples"] == 20 for _row in _report["call_sites"])
+
+    _handlers = {_row["name"]: _row for _row in _report["handlers"]}
+    assert set(_handlers) == {"file_handler", "err_file_handler"}
+    assert _handlers["file_handler"]["samples"] == 40
+    # Levels below handler level are not passed into filter:
+    assert _handlers["err_file_handler"]["samples"] == 20
+    for _row in _handlers.values():
+        assert _row["filter_seconds"] > 0
+        assert _row["format_seconds"] > 0
+        assert _row["write_seconds"] > 0
+        assert _row["total_seconds"] == (
+            _row["filter_seconds"] + _row["format_seconds"] + _row["write_seconds"]
+        )
+
+    _table = _logger_loader.profile_report(top=1)
+    assert _table.startswith("Profiled records: 40 (sample rate: 1/1)")
+    # Title line, then blank, header and one row for call-sites and handlers:
+    assert len(_table.splitlines()) == 7
+
+    _logger_loader.remove_handler()
+
+    logger.success("Done: call-site profiler.\n")
+
+
+class _TtyStream:
+    encoding = "utf8"
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write(self, message: str) -> None:
+        self.lines.append(message)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def test_profiler_sink_kinds(logger: Logger):
+    logger.info("Testing call-site profiler with sink kinds...")
+
+    _tty_stream = _TtyStream()
+    _log_handler = _ListHandler()
+    _async_messages: list[str] = []
+
+    async def _async_sink(message) -> None:
+        await asyncio.sleep(0)
+        _async_messages.append(message)
+
+    _logger_loader = LoggerLoader(handlers={"std_handler": {"enabled": False}})
+    _logger_loader.load()
+    for _name, _sink in (
+        ("tty_handler", _tty_stream),
+        ("log_handler", _log_handler),
+        ("async_handler", _async_sink),
+    ):
+        _logger_loader.add_handler(
+            name=_name,
+            handler={"sink": _sink, "format": "<red>{message}</red>", "level": "INFO"},
+        )
+
+    # Logging handler sink is added as it is, loguru converts messages into log records:
+    assert _logger_loader.get_handler_sink("log_handler") is _log_handler
+    assert _logger_loader.get_handler_sink("async_handler") is _async_sink
+
+    async def _log_messages(message: str) -> None:
+        logger.info(message)
+        await logger.complete()
+
+    for _profiling in (False, True, False):
+        if _profiling:
+            _logger_loader.start_profiling(sample_rate=1)
+        else:
+            _logger_loader.stop_profiling()
+
+        _message = f"Profiling {_profiling}."
+        asyncio.run(_log_messages(_message))
+        # Colorized same as unwrapped terminal stream:
+        assert _tty_stream.lines[-1] == f"\x1b[31m{_message}\x1b[0m\n"
+        assert _log_handler.messages[-1] == _message
+        assert _async_messages[-1] == f"{_message}\n"
+
+    assert len(_async_messages) == 3
+
+    _report = json.loads(_logger_loader.profile_report(format_="JSON"))
+    assert _report["samples"] == 1
+    _handlers = {_row["name"]: _row for _row in _report["handlers"]}
+    assert set(_handlers) == {"tty_handler", "log_handler", "async_handler"}
+    assert _handlers["tty_handler"]["write_seconds"] > 0
+    assert _handlers["async_handler"]["write_seconds"] > 0
+    # Only filter (and format) time of logging handler sink is profiled:
+    assert _handlers["log_handler"]["filter_seconds"] > 0
+    assert _handlers["log_handler"]["write_seconds"] == 0
+
+    _logger_loader.remove_handler()
+
+    logger.success("Done: call-site profiler with sink kinds.\n")
+
+
+def test_profiler_runtime(logger: Logger):
+    logger.info("Testing call-site profiler at runtime...")
+
+    _messages: list[str] = []
+    _logger_loader = LoggerLoader(handlers={"std_handler": {"enabled": False}})
+    _logger_loader.load()
+    _logger_loader.add_handler(
+        name="list_handler",
+        handler={"sink": _messages.append, "format": "{message}", "level": "INFO"},
+    )
+
+    def _log_sites() -> None:
+        # Five call-sites (lines):
+        logger.info("Site message 0.")
+        logger.info("Site message 1.")
+        logger.info("Site message 2.")
+        logger.info("Site message 3.")
+        logger.info("Site message 4.")
+
+    # Disabled by default:
+    _log_sites()
+    assert json.loads(_logger_loader.profile_report(format_="JSON"))["samples"] == 0
+
+    _logger_loader.start_profiling(sample_rate=1)
+    _log_sites()
+    _logger_loader.stop_profiling()
+    _log_sites()
+    # Restarted without reset, collected profile is kept:
+    _logger_loader.start_profiling(sample_rate=1, reset=False)
+    _log_sites()
+    _logger_loader.stop_profiling()
+
+    _report = json.loads(_logger_loader.profile_report(top=3, format_="JSON"))
+    assert _report["samples"] == 10
+    assert len(_report["call_sites"]) == 3
+    assert all(_row["samples"] == 2 for _row in _report["call_sites"])
+    _totals = [_row["total_seconds"] for _row in _report["call_sites"]]
+    assert _totals == sorted(_totals, reverse=True)
+    assert [_row["name"] for _row in _report["handlers"]] == ["list_handler"]
+    assert _report["handlers"][0]["samples"] == 10
+
+    _table = _logger_loader.profile_report(top=3).splitlines()
+    assert _table[0] == "Profiled records: 10 (sample rate: 1/1)"
+    assert _table[2].split() == [
+        "Top",
+        "call-sites",
+        "samples",
+        "filter_ms",
+        "format_ms",
+        "write_ms",
+        "mean_us",
+        "total_ms",
+        "est_ms",
+    ]
+    # Title line, then blank, header and top rows for call-sites and handlers:
+    assert len(_table) == 1 + (2 + 3) + (2 + 1)
+    assert _table[3].startswith(f"{__name__}:_log_sites:")
+    assert _table[-1].split()[:2] == ["list_handler", "10"]
+
+    # Invalid sample rate doesn't start profiling:
+    with pytest.raises(ValueError, match="'sample_rate' argument value 0 is invalid"):
+        _logger_loader.start_profiling(sample_rate=0)
+
+    _log_sites()
+    assert json.loads(_logger_loader.profile_report(format_="JSON"))["samples"] == 10
+
+    # Restarted with reset, one of every N records is sampled:
+    _logger_loader.start_profiling(sample_rate=10)
+    for _ in range(400):
+        _log_sites()
+
+    _logger_loader.stop_profiling()
+    _report = json.loads(_logger_loader.profile_report(format_="JSON"))
+    assert _report["sample_rate"] == 10
+    # Randomly sampled, expected 200 of 2000 records:
+    assert 120 <= _report["samples"] <= 280
+    assert _report["handlers"][0]["samples"] == _report["samples"]
+    _row = _report["handlers"][0]
+    assert _row["estimated_seconds"] == pytest.approx(_row["total_seconds"] * 10)
+    assert len(_messages) == 5 * 405
+
+    _logger_loader.remove_handler()
+
+    logger.success("Done: call-site profiler at runtime.\n")
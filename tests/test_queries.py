@@ -0,0 +1,109 @@
+import json
+import datetime
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.__main__ import main
+from beans_logging.compressors import get_compressor
+from beans_logging.queries import LogQuery, write_index, read_index
+
+_START_DT = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _make_line(index: int) -> str:
+    _dt = _START_DT + datetime.timedelta(seconds=index)
+    return json.dumps(
+        {
+            "timestamp": _dt.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "level": "ERROR" if index % 10 == 0 else "INFO",
+            "level_no": 40 if index % 10 == 0 else 20,
+            "name": "app.api" if index % 2 else "app",
+            "message": f"Message {index}",
+            "extra": {"request_id": f"req-{index % 7}"},
+        }
+    )
+
+
+def test_log_query_index(tmp_path):
+    _path = tmp_path / "app.json.log"
+    _path.write_text("".join(_make_line(_i) + "\n" for _i in range(1_000)))
+
+    assert write_index(str(_path), every=10) == str(tmp_path / ".app.json.log.idx")
+    _index = read_index(str(_path))
+    assert _index is not None
+    assert len(_index["entries"]) == 100
+    assert _index["records"] == 1_000
+
+    _query = LogQuery(
+        since=_START_DT + datetime.timedelta(seconds=500),
+        until=_START_DT + datetime.timedelta(seconds=599),
+        level_no=40,
+        name="app",
+    )
+    # Time range is binary-searched in the index, only a small part of the file is scanned:
+    _start, _end = _query._get_offsets(_index, _path.stat().st_size)  # type: ignore
+    assert 0 < _start < _end < _path.stat().st_size
+
+    _messages = [json.loads(_line)["message"] for _line in _query.search(str(_path))]
+    assert _messages == [f"Message {_i}" for _i in range(500, 600, 10)]
+
+    _query = LogQuery(name="app.api", extra={"request_id": "req-3"})
+    _messages = [json.loads(_line)["message"] for _line in _query.search(str(_path))]
+    assert _messages == [
+        f"Message {_i}" for _i in range(1_000) if (_i % 2) and (_i % 7 == 3)
+    ]
+
+    # Out of range files are skipped by the index:
+    _query = LogQuery(since=_START_DT + datetime.timedelta(days=1))
+    assert list(_query.search(str(_path))) == []
+
+
+def test_query_rotated(logger: Logger, tmp_path):
+    logger.info("Testing query of rotated json logs...")
+
+    _logger_loader = LoggerLoader(
+        app_name="test",
+        file={"logs_dir": str(tmp_path), "rotate_size": 5_000, "compression": "GZIP"},
+    )
+    _logger_loader.add_handler(
+        name="json_file_handler",
+        handler={
+            "type_": "FILE",
+            "sink": "{app_name}.json.log",
+            "custom_serialize": True,
+            "enqueue": False,
+        },
+    )
+    for _i in range(100):
+        logger.bind(disable_std_handler=True, request_id=f"req-{_i % 3}").info(
+            f"Query message {_i}"
+        )
+
+    _logger_loader.remove_handler("json_file_handler")
+    _logger_loader.remove_handler()
+    get_compressor(format_="GZIP", level=None, workers=1).wait()
+
+    assert list(tmp_path.glob("test.json.*.log.gz"))
+    assert list(tmp_path.glob(".test.json.*.log.idx"))
+
+    _output_path = tmp_path / "output.json.log"
+    assert (
+        main(
+            [
+                "query",
+                str(tmp_path / "test.json*.log*"),
+                "--level",
+                "INFO",
+                "--extra",
+                "request_id=req-1",
+                "-o",
+                str(_output_path),
+            ]
+        )
+        == 0
+    )
+    _messages = [
+        json.loads(_line)["message"] for _line in _output_path.read_text().splitlines()
+    ]
+    assert _messages == [f"Query message {_i}" for _i in range(1, 100, 3)]
+
+    logger.success("Done: query of rotated json logs.\n")
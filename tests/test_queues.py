@@ -0,0 +1,64 @@
+import os
+import multiprocessing
+
+import pytest
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.queues import QueueSink
+
+
+def _log_from_child(index: int) -> None:
+    from loguru import logger
+
+    for _i in range(100):
+        logger.bind(disable_std_handler=True).info(f"Child {index} message {_i}")
+
+    # Forked processes exit without atexit handlers, stop handlers to send remaining messages:
+    logger.remove()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork."
+)
+def test_queue_handler(logger: Logger, tmp_path):
+    logger.info("Testing queue handler...")
+
+    _logger_loader = LoggerLoader(app_name="test", file={"logs_dir": str(tmp_path)})
+    _logger_loader.add_handler(
+        name="queue_handler",
+        handler={
+            "type_": "QUEUE",
+            "sink": "{app_name}.queue.log",
+            "format": "{message}",
+        },
+    )
+    _sink = _logger_loader.get_handler_sink("queue_handler")
+    assert isinstance(_sink, QueueSink)
+
+    logger.bind(disable_std_handler=True).info("Parent message")
+    _context = multiprocessing.get_context("fork")
+    _processes = [
+        _context.Process(target=_log_from_child, args=(_i,)) for _i in range(4)
+    ]
+    for _process in _processes:
+        _process.start()
+
+    for _process in _processes:
+        _process.join()
+        assert _process.exitcode == 0
+
+    # Parent is the writer, removing its handler writes remaining messages and closes the file:
+    assert _sink.stats["writer"] == 1
+    _logger_loader.remove_handler("queue_handler")
+
+    _lines = (tmp_path / "test.queue.log").read_text().splitlines()
+    assert len(_lines) == 401
+    # Parent messages are also sent by sender thread, so order is kept only within each process:
+    assert _lines.count("Parent message") == 1
+    for _i in range(4):
+        _child_lines = [_line for _line in _lines if _line.startswith(f"Child {_i} ")]
+        assert _child_lines == [f"Child {_i} message {_j}" for _j in range(100)]
+
+    assert not os.path.exists(tmp_path / ".test.queue.sock")
+
+    logger.success("Done: queue handler.\n")
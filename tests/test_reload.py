@@ -0,0 +1,213 @@
+import os
+import time
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.watchers import ConfigWatcher
+
+_CONFIG_TEMPLATE = """
+logger:
+  app_name: app
+  level:
+    base: {level}
+  handlers:
+    std_handler:
+      enabled: false
+    file_handler:
+      enabled: true
+    json_handler:
+      enabled: {json_enabled}
+"""
+
+
+@pytest.fixture
+def logger_loader(tmp_path, monkeypatch) -> Iterator[LoggerLoader]:
+    monkeypatch.setattr(LoggerLoader, "_CONFIG_CACHE_DIR", None)
+
+    _config_path = tmp_path / "logger.yml"
+    _config_path.write_text(_CONFIG_TEMPLATE.format(level="INFO", json_enabled="true"))
+
+    _logger_loader = LoggerLoader(
+        config_path=str(_config_path), file={"logs_dir": str(tmp_path / "logs")}
+    )
+    _logger_loader.load(load_config_file=True)
+
+    yield _logger_loader
+
+    _logger_loader.unwatch_config()
+    _logger_loader.remove_handler()
+
+
+def _write_config(logger_loader: LoggerLoader, level: str, json_enabled: bool) -> None:
+    with open(logger_loader.config_path, "w") as _file:
+        _file.write(
+            _CONFIG_TEMPLATE.format(level=level, json_enabled=str(json_enabled).lower())
+        )
+
+
+def test_reload_unchanged(logger_loader: LoggerLoader):
+    _handlers_map = dict(logger_loader.handlers_map)
+    assert set(_handlers_map) == {"file_handler", "json_handler"}
+
+    logger_loader.reload()
+    assert logger_loader.handlers_map == _handlers_map
+
+
+def test_reload_changed(logger: Logger, logger_loader: LoggerLoader):
+    _handlers_map = dict(logger_loader.handlers_map)
+    _custom_id = logger_loader.add_handler(
+        name="custom_handler", handler={"type_": "STD", "sink": lambda _: None}
+    )
+
+    logger.debug("Debug before reload.")
+    _write_config(logger_loader, level="DEBUG", json_enabled=False)
+    logger_loader.reload()
+    logger.debug("Debug after reload.")
+
+    # Changed handler is replaced, disabled handler is removed, custom handler is kept:
+    assert logger_loader.handlers_map["file_handler"] != _handlers_map["file_handler"]
+    assert "json_handler" not in logger_loader.handlers_map
+    assert logger_loader.handlers_map["custom_handler"] == _custom_id
+
+    logger_loader.remove_handler("file_handler")
+    with open(os.path.join(logger_loader.config.file.logs_dir, "app.all.log")) as _file:
+        _content = _file.read()
+
+    assert "Debug before reload." not in _content
+    assert "Debug after reload." in _content
+
+
+def test_reload_keeps_updated_config(logger_loader: LoggerLoader):
+    logger_loader.update_config(config={"file": {"rotate_size": 1_000_000}})
+    logger_loader.reload()
+
+    assert logger_loader.config.file.rotate_size == 1_000_000
+    assert logger_loader.config.app_name == "app"
+
+
+def test_reload_keeps_records(logger: Logger, tmp_path):
+    _messages: list[str] = []
+
+    def _get_config(level: str) -> dict:
+        return {
+            "file": {"logs_dir": str(tmp_path)},
+            "handlers": {
+                "std_handler": {"enabled": False},
+                "list_handler": {
+                    "sink": _messages.append,
+                    "format": "{message}",
+                    "level": level,
+                },
+            },
+        }
+
+    _logger_loader = LoggerLoader(config=_get_config("INFO"))
+    _logger_loader.load()
+
+    _stop_event = threading.Event()
+    _sent: list[int] = []
+
+    def _log_messages() -> None:
+        _i = 0
+        while not _stop_event.is_set():
+            logger.info(f"Message {_i}.")
+            _i += 1
+
+        _sent.append(_i)
+
+    _thread = threading.Thread(target=_log_messages)
+    _thread.start()
+    try:
+        for _i in range(20):
+            _handler_id = _logger_loader.handlers_map["list_handler"]
+            _logger_loader.reload(
+                config=_get_config("INFO" if _i % 2 else "DEBUG"),
+                load_config_file=False,
+            )
+            assert _logger_loader.handlers_map["list_handler"] != _handler_id
+    finally:
+        _stop_event.set()
+        _thread.join()
+        _logger_loader.remove_handler()
+
+    # Records logged while handler is replaced may be written twice, but never lost:
+    assert set(_messages) == {f"Message {_i}.\n" for _i in range(_sent[0])}
+
+
+def test_reload_failure_keeps_config(logger: Logger, logger_loader: LoggerLoader):
+    _handlers_map = dict(logger_loader.handlers_map)
+    with pytest.raises(ValueError):
+        logger_loader.reload(
+            config={
+                "app_name": "app",
+                "level": {"base": "DEBUG"},
+                "file": {"logs_dir": logger_loader.config.file.logs_dir},
+                "handlers": {
+                    "std_handler": {"enabled": False},
+                    "file_handler": {"enabled": True},
+                    "json_handler": {"enabled": True},
+                    # Socket handler without sink or socket address can't be built:
+                    "socket_handler": {"type_": "SOCKET"},
+                },
+            },
+        )
+
+    # Already replaced handler is restored together with the previous config:
+    assert logger_loader.handlers_map == _handlers_map
+    assert logger_loader.config.level.base == "INFO"
+    logger_loader.reload()
+    assert logger_loader.handlers_map == _handlers_map
+
+    logger.info("Info after failed reload.")
+    logger.debug("Debug after failed reload.")
+    logger_loader.remove_handler("file_handler")
+    with open(os.path.join(logger_loader.config.file.logs_dir, "app.all.log")) as _file:
+        _content = _file.read()
+
+    assert "Info after failed reload." in _content
+    assert "Debug after failed reload." not in _content
+
+
+@pytest.mark.parametrize("use_inotify", [True, False], ids=["inotify", "polling"])
+def test_config_watcher(tmp_path, use_inotify: bool):
+    _path = tmp_path / "logger.yml"
+    _path.write_text("logger: {}\n")
+
+    _calls = []
+    _watcher = ConfigWatcher(
+        path=str(_path),
+        callback=lambda: _calls.append(1),
+        interval=0.1,
+        use_inotify=use_inotify,
+    )
+    if use_inotify and (_watcher.backend != "inotify"):
+        pytest.skip("inotify is not available.")
+
+    _watcher.start()
+    try:
+        time.sleep(0.05)
+        _path.write_text("logger:\n  app_name: changed\n")
+
+        _deadline = time.monotonic() + 2
+        while (not _calls) and (time.monotonic() < _deadline):
+            time.sleep(0.02)
+
+        assert len(_calls) == 1
+    finally:
+        _watcher.stop()
+
+
+def test_watch_config(logger_loader: LoggerLoader):
+    logger_loader.watch_config(interval=0.1)
+    _write_config(logger_loader, level="DEBUG", json_enabled=True)
+
+    _deadline = time.monotonic() + 2
+    while (logger_loader.config.level.base != "DEBUG") and (
+        time.monotonic() < _deadline
+    ):
+        time.sleep(0.02)
+
+    assert logger_loader.config.level.base == "DEBUG"
@@ -0,0 +1,148 @@
+import datetime
+import multiprocessing
+
+import pytest
+
+from beans_logging.rotators import Rotator
+from beans_logging.sinks import make_file_sink
+
+
+class _Message(str):
+    record: dict
+
+
+def _make_message(text: str, dt: datetime.datetime | None = None) -> _Message:
+    _message = _Message(text)
+    _message.record = {"time": dt or datetime.datetime.now().astimezone()}
+    return _message
+
+
+def test_rotator_size(tmp_path):
+    _rotator = Rotator(rotate_size=1_000, rotate_time=datetime.time(0, 0, 0))
+    with open(tmp_path / "test.log", "a", encoding="utf8") as _file:
+        _seek_calls = []
+        _seek = _file.seek
+
+        def _counted_seek(*args):
+            _seek_calls.append(args)
+            return _seek(*args)
+
+        _file.seek = _counted_seek  # type: ignore
+
+        # 3 bytes per character in UTF-8, so should rotate by encoded size, not by length:
+        _message = _make_message("日本語" * 30 + "\n")
+        _rotated = False
+        for _ in range(20):
+            if _rotator.should_rotate(_message, _file):
+                _rotated = True
+                break
+            _file.write(_message)
+
+        assert _rotated
+        assert _file.tell() + len(_message.encode("utf8")) > 1_000
+        assert len(_seek_calls) == 1
+
+
+def _get_next_hour(dt: datetime.datetime) -> datetime.datetime:
+    return dt.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1)
+
+
+def test_rotator_interval():
+    # Time is captured around construction, so the test also passes across an hour boundary:
+    _before = datetime.datetime.now()
+    _rotator = Rotator(
+        rotate_size=1_000_000,
+        rotate_time=datetime.time(0, 0, 0),
+        rotate_interval=datetime.timedelta(hours=1),
+    )
+    _after = datetime.datetime.now()
+    assert _rotator._dt_limit in (_get_next_hour(_before), _get_next_hour(_after))
+    _next_hour = _rotator._dt_limit
+
+    _message = _make_message("test\n", _next_hour.astimezone())
+
+    class _File:
+        def seek(self, *args):
+            return 0
+
+        def tell(self):
+            return 0
+
+    assert _rotator.should_rotate(_message, _File())  # type: ignore
+    assert _rotator._dt_limit == _next_hour + datetime.timedelta(hours=1)
+
+
+def _make_shared_sink(path) -> object:
+    _rotator = Rotator(
+        rotate_size=1_000, rotate_time=datetime.time(0, 0, 0), sync_interval=0.01
+    )
+    return make_file_sink(path, shared=True, rotation=_rotator.should_rotate)
+
+
+def test_shared_file_sink(tmp_path):
+    _path = tmp_path / "shared.log"
+    _sink_1 = _make_shared_sink(_path)
+    _sink_2 = _make_shared_sink(_path)
+    _message = _make_message("x" * 99 + "\n")
+    for _ in range(10):
+        _sink_1.write(_message)
+
+    # First sink rotates, second sink reopens the new file instead of renaming it again:
+    _sink_1.write(_message)
+    _sink_2.write(_message)
+    _sink_1.stop()
+    _sink_2.stop()
+
+    _files = sorted(tmp_path.glob("shared.*log"))
+    assert len(_files) == 2
+    assert (tmp_path / ".shared.log.lock").exists()
+    assert _path.read_text() == _message * 2
+
+
+def _write_shared(path, index: int) -> None:
+    _sink = _make_shared_sink(path)
+    for _i in range(200):
+        _sink.write(_make_message(f"Process {index} message {_i:03}\n"))
+
+    _sink.stop()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork."
+)
+def test_shared_file_sink_without_fcntl(tmp_path, monkeypatch):
+    from pydantic import ValidationError
+
+    from beans_logging import config, sinks
+
+    monkeypatch.setattr(config, "fcntl", None)
+    monkeypatch.setattr(sinks, "fcntl", None)
+
+    with pytest.raises(ValidationError):
+        config.FileConfigPM(rotate_shared=True)
+
+    with pytest.raises(OSError):
+        make_file_sink(tmp_path / "app.log", shared=True)
+
+
+def test_shared_file_sink_processes(tmp_path):
+    _path = tmp_path / "shared.log"
+    _context = multiprocessing.get_context("fork")
+    _processes = [
+        _context.Process(target=_write_shared, args=(_path, _i)) for _i in range(4)
+    ]
+    for _process in _processes:
+        _process.start()
+
+    for _process in _processes:
+        _process.join()
+        assert _process.exitcode == 0
+
+    _lines = []
+    for _file in tmp_path.glob("shared.*log"):
+        _lines.extend(_file.read_text().splitlines())
+
+    # No message is lost into a renamed or overwritten file:
+    assert sorted(_lines) == sorted(
+        f"Process {_i} message {_j:03}" for _i in range(4) for _j in range(200)
+    )
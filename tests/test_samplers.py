@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import pytest
+
+from beans_logging.config import LoggerConfigPM
+from beans_logging.schemas import LogHandlerPM
+from beans_logging.filters import build_filter
+from beans_logging.samplers import Sampler
+from beans_logging._builder import build_handler
+
+
+def _make_record(level_no: int = 20, line: int = 1, extra: dict | None = None) -> dict:
+    return {
+        "level": SimpleNamespace(no=level_no, name="INFO"),
+        "name": "tests.module",
+        "line": line,
+        "extra": {"level_short": "INFO", **(extra or {})},
+    }
+
+
+def test_sampler_every_n():
+    _sampler = Sampler(every_n={20: 10})
+    try:
+        _kept = sum(_sampler(_make_record()) for _ in range(100))
+        assert _kept == 10
+        assert _sampler.suppressed == 90
+
+        # Other call-sites and exempt levels are not affected:
+        assert _sampler(_make_record(line=2))
+        assert all(_sampler(_make_record(level_no=40)) for _ in range(10))
+    finally:
+        _sampler.stop()
+
+
+def test_sampler_rate():
+    _sampler = Sampler(rate=0.001, burst=5)
+    try:
+        _kept = sum(_sampler(_make_record()) for _ in range(100))
+        assert _kept == 5
+        assert _sampler.stats == {"call_sites": 1, "suppressed": 95}
+    finally:
+        _sampler.stop()
+
+
+def test_sampler_decision_cached():
+    _sampler = Sampler(rate=0.001, burst=1)
+    try:
+        _filters = [build_filter(f"handler_{_i}", sampler=_sampler) for _i in range(3)]
+        _record = _make_record()
+        assert all(_filter(_record) for _filter in _filters)
+
+        _record = _make_record()
+        assert not any(_filter(_record) for _filter in _filters)
+        assert _sampler.suppressed == 1
+
+        # Disabled records don't consume sampling budget:
+        _record = _make_record(extra={"disable_handler_0": True})
+        assert not _filters[0](_record)
+        assert _sampler.suppressed == 1
+    finally:
+        _sampler.stop()
+
+
+def test_sampler_report(logger):
+    _messages = []
+    _handler_id = logger.add(
+        lambda message: _messages.append(str(message)), format="{message}"
+    )
+    _sampler = Sampler(every_n={20: 2})
+    try:
+        for _ in range(10):
+            _sampler(_make_record())
+
+        _sampler.report()
+        assert _messages == ["Suppressed 5 messages from tests.module:1\n"]
+    finally:
+        _sampler.stop()
+        logger.remove(_handler_id)
+
+
+def test_build_handler_sampling_override():
+    _config = LoggerConfigPM(sampling={"rate": 10})
+    _shared_0 = build_handler(
+        handler=LogHandlerPM(type_="STD"), config=_config, name="a"
+    )
+    _shared_1 = build_handler(
+        handler=LogHandlerPM(type_="STD"), config=_config, name="b"
+    )
+    _disabled = build_handler(
+        handler=LogHandlerPM(type_="STD", sampling={"enabled": False}), config=_config
+    )
+
+    _record = _make_record()
+    assert _shared_0["filter"](_record) and _shared_1["filter"](_record)
+    assert len([_key for _key in _record if _key.startswith("sampled_")]) == 1
+    assert _disabled["filter"](_make_record())
+
+
+def test_sampling_invalid():
+    with pytest.raises(ValueError):
+        LogHandlerPM(type_="STD", sampling={"every_n": {"INFO": 0}})
+
+    with pytest.raises(ValueError):
+        LogHandlerPM(type_="STD", sampling={"burst": 10})
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.sinks import BufferedStdSink, MemorySink
+
+
+class _Message(str):
+    record: dict
+
+
+def _make_message(text: str, level_no: int) -> _Message:
+    _message = _Message(text)
+    _message.record = {"level": SimpleNamespace(no=level_no)}
+    return _message
+
+
+def test_buffered_std_sink(logger: Logger, capsys):
+    logger.info("Testing 'BufferedStdSink'...")
+    capsys.readouterr()
+
+    _sink = BufferedStdSink(buffer_size=1_000_000, flush_interval=60)
+    _sink.write(_make_message("Buffered message.\n", 20))
+    assert "Buffered message." not in capsys.readouterr().out
+
+    _sink.write(_make_message("Error message.\n", 40))
+    _captured = capsys.readouterr()
+    assert "Buffered message." in _captured.out
+    assert "Error message." in _captured.err
+
+    _sink.write(_make_message("Last message.\n", 20))
+    _sink.stop()
+    assert "Last message." in capsys.readouterr().out
+
+    # Not buffered after stop, e.g. messages logged at exit:
+    _sink.write(_make_message("Stopped message.\n", 20))
+    assert "Stopped message." in capsys.readouterr().out
+
+    logger.success("Done: 'BufferedStdSink'.\n")
+
+
+def test_memory_sink(logger: Logger, tmp_path):
+    logger.info("Testing memory handler (flight recorder)...")
+
+    _logger_loader = LoggerLoader(app_name="test", file={"logs_dir": str(tmp_path)})
+    _logger_loader.add_handler(
+        name="memory_handler",
+        handler={
+            "type_": "MEMORY",
+            "level": "TRACE",
+            "format": "<level>{level}</level> {message}",
+            "memory": {"capacity": 3},
+        },
+    )
+    _sink = _logger_loader.get_handler_sink("memory_handler")
+    assert isinstance(_sink, MemorySink)
+
+    _dump_path = tmp_path / "test.dump.log"
+    for _i in range(5):
+        logger.bind(disable_std_handler=True).trace(f"Memory trace {_i}")
+
+    assert not _dump_path.exists()
+    assert len(_sink) == 3
+
+    logger.bind(disable_std_handler=True).error("Memory error")
+    # Dumps are written by background thread:
+    _sink.flush()
+    _lines = _dump_path.read_text().splitlines()
+    assert _lines[0].startswith("--- Flight recorder dump: 3 messages, reason: ERROR")
+    assert _lines[1:] == [
+        "TRACE Memory trace 3",
+        "TRACE Memory trace 4",
+        "ERROR Memory error",
+    ]
+    assert len(_sink) == 0
+
+    logger.bind(disable_std_handler=True).debug("Memory debug")
+    assert _logger_loader.dump_memory() == 1
+    assert _dump_path.read_text().splitlines()[-1] == "DEBUG Memory debug"
+    assert _sink.stats == {"capacity": 3, "size": 0, "recorded": 7, "dumps": 2}
+
+    try:
+        raise ValueError("Memory exception")
+    except ValueError:
+        logger.bind(disable_std_handler=True).exception("Memory exception")
+
+    _sink.flush()
+    assert "ValueError: Memory exception" in _dump_path.read_text()
+
+    _logger_loader.remove_handler("memory_handler")
+    logger.success("Done: memory handler (flight recorder).\n")
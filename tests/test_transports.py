@@ -0,0 +1,277 @@
+import os
+import gzip
+import re
+import json
+import time
+import socket
+import struct
+import threading
+import http.server
+from typing import Any
+from collections.abc import Iterator
+
+import pytest
+
+from beans_logging import Logger, LoggerLoader
+from beans_logging.transports import BatchSink, SocketSink, HttpSink
+
+
+class _Server:
+    def __init__(self, family: int, type_: int, address) -> None:
+        self.data = b""
+        self._socket = socket.socket(family, type_)
+        self._socket.bind(address)
+        self.address = self._socket.getsockname()
+        if type_ == socket.SOCK_STREAM:
+            self._socket.listen()
+
+        self._type = type_
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        if self._type == socket.SOCK_DGRAM:
+            while True:
+                _data = self._socket.recv(65_536)
+                if not _data:
+                    break
+                self.data += _data
+            return
+
+        while True:
+            try:
+                _conn, _ = self._socket.accept()
+            except OSError:
+                break
+
+            with _conn:
+                while _data := _conn.recv(65_536):
+                    self.data += _data
+
+    def wait_for(self, size: int, timeout: float = 5.0) -> bytes:
+        _deadline = time.monotonic() + timeout
+        while (len(self.data) < size) and (time.monotonic() < _deadline):
+            time.sleep(0.01)
+
+        return self.data
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+def _get_free_port() -> int:
+    with socket.socket() as _socket:
+        _socket.bind(("127.0.0.1", 0))
+        return _socket.getsockname()[1]
+
+
+@pytest.mark.parametrize("protocol", ["TCP", "UDP", "UNIX"])
+def test_socket_sink(tmp_path, protocol: str):
+    if protocol == "UNIX":
+        _server = _Server(
+            socket.AF_UNIX, socket.SOCK_STREAM, str(tmp_path / "log.sock")
+        )
+        _kwargs = {"path": _server.address}
+    else:
+        _server = _Server(
+            socket.AF_INET,
+            socket.SOCK_DGRAM if protocol == "UDP" else socket.SOCK_STREAM,
+            ("127.0.0.1", 0),
+        )
+        _kwargs = {"host": "127.0.0.1", "port": _server.address[1]}
+
+    _sink = SocketSink(protocol=protocol, **_kwargs)
+    _messages = [f"Socket message {_i}\n" for _i in range(100)]
+    for _message in _messages:
+        _sink.write(_message)  # type: ignore
+
+    _expected = "".join(_messages).encode()
+    assert _server.wait_for(len(_expected)) == _expected
+
+    _sink.stop()
+    _server.close()
+    assert _sink.stats["sent"] == 100
+    assert _sink.stats["dropped"] == 0
+    assert _sink.stats["batches"] <= 100
+
+
+def test_batch_sink_abstract():
+    with pytest.raises(TypeError):
+        BatchSink()  # type: ignore
+
+
+def test_socket_sink_reconnect():
+    _port = _get_free_port()
+    _sink = SocketSink(
+        port=_port,
+        host="127.0.0.1",
+        framing="LENGTH_PREFIXED",
+        backoff_min=0.01,
+        backoff_max=0.05,
+        capacity=10,
+    )
+    for _i in range(15):
+        _sink.write(f"Message {_i}\n")  # type: ignore
+
+    time.sleep(0.1)
+    _server = _Server(socket.AF_INET, socket.SOCK_STREAM, ("127.0.0.1", _port))
+    _data = _server.wait_for(sum(4 + len(f"Message {_i}") for _i in range(5, 15)))
+
+    _frames: list[str] = []
+    while _data:
+        (_size,) = struct.unpack(">I", _data[:4])
+        _frames.append(_data[4 : 4 + _size].decode())
+        _data = _data[4 + _size :]
+
+    _sink.stop()
+    _server.close()
+    # Disconnected buffer is bounded, oldest messages are dropped:
+    assert _frames == [f"Message {_i}" for _i in range(5, 15)]
+    assert _sink.stats["dropped"] == 5
+    assert _sink.stats["errors"] >= 1
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Requires Unix sockets.")
+def test_socket_handler(logger: Logger, tmp_path):
+    logger.info("Testing socket handler...")
+
+    _path = str(tmp_path / "handler.sock")
+    _server = _Server(socket.AF_UNIX, socket.SOCK_STREAM, _path)
+    _logger_loader = LoggerLoader()
+    _logger_loader.add_handler(
+        name="socket_handler",
+        handler={
+            "type_": "SOCKET",
+            "format": "{message}",
+            "socket": {"protocol": "UNIX", "path": _path},
+        },
+    )
+    logger.bind(disable_std_handler=True).info("Socket handler message")
+    _logger_loader.remove_handler("socket_handler")
+
+    assert _server.wait_for(1) == b"Socket handler message\n"
+    _server.close()
+    os.remove(_path)
+
+    logger.success("Done: socket handler.\n")
+
+
+class _HttpHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        _body = self.rfile.read(int(self.headers["Content-Length"]))
+        _server: Any = self.server
+        if _server.fail_count:
+            _server.fail_count -= 1
+            _status = 503
+        else:
+            _status = 200
+            _server.bodies.append(gzip.decompress(_body))
+            _server.connections.add(self.client_address)
+
+        self.send_response(_status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def http_server() -> Iterator[Any]:
+    _server: Any = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _HttpHandler)
+    _server.bodies = []
+    _server.connections = set()
+    _server.fail_count = 0
+    _thread = threading.Thread(target=_server.serve_forever, daemon=True)
+    _thread.start()
+
+    yield _server
+
+    _server.shutdown()
+    _server.server_close()
+
+
+def test_http_sink(http_server: Any):
+    http_server.fail_count = 1
+    _sink = HttpSink(
+        url=f"http://127.0.0.1:{http_server.server_address[1]}/logs",
+        batch_size=10,
+        flush_interval=0.05,
+        backoff_min=0.01,
+    )
+    for _i in range(25):
+        _sink.write(f'{{"message": "HTTP message {_i}"}}\n')  # type: ignore
+
+    _sink.stop()
+    _lines = b"".join(http_server.bodies).decode().splitlines()
+    assert _lines == [f'{{"message": "HTTP message {_i}"}}' for _i in range(25)]
+    # Batched by count, retried after 503 and sent over one keep-alive connection:
+    assert all(_body.count(b"\n") <= 10 for _body in http_server.bodies)
+    assert _sink.stats["sent"] == 25
+    assert _sink.stats["errors"] == 1
+    assert len(http_server.connections) <= 2
+
+
+def test_http_handler(logger: Logger, http_server: Any):
+    logger.info("Testing HTTP handler...")
+
+    _logger_loader = LoggerLoader()
+    _logger_loader.add_handler(
+        name="http_handler",
+        handler={
+            "type_": "HTTP",
+            "http": {"url": f"http://127.0.0.1:{http_server.server_address[1]}/"},
+        },
+    )
+    logger.bind(disable_std_handler=True).info("HTTP handler message")
+    _logger_loader.remove_handler("http_handler")
+
+    _records = [
+        json.loads(_line) for _line in b"".join(http_server.bodies).splitlines()
+    ]
+    assert [_record["message"] for _record in _records] == ["HTTP handler message"]
+
+    logger.success("Done: HTTP handler.\n")
+
+
+@pytest.mark.parametrize(
+    "syslog_format, pattern",
+    [
+        (
+            "RFC5424",
+            r"<14>1 \d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}[+-]\d\d:\d\d \S+ test_app \d+ - "
+            r'\[extra@32473 request_id="req-\\"1\\]"\] \S*tests\.test_transports:\d+: Syslog message$',
+        ),
+        (
+            "RFC3164",
+            r"<14>[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d \S+ test_app\[\d+\]: "
+            r"\S*tests\.test_transports:\d+: Syslog message$",
+        ),
+    ],
+)
+def test_syslog_handler(logger: Logger, syslog_format: str, pattern: str):
+    logger.info(f"Testing syslog handler ({syslog_format})...")
+
+    _server = _Server(socket.AF_INET, socket.SOCK_DGRAM, ("127.0.0.1", 0))
+    _logger_loader = LoggerLoader(app_name="test app")
+    _logger_loader.add_handler(
+        name="syslog_handler",
+        handler={
+            "type_": "SYSLOG",
+            "syslog": {
+                "syslog_format": syslog_format,
+                "protocol": "UDP",
+                "host": "127.0.0.1",
+                "port": _server.address[1],
+            },
+        },
+    )
+    logger.bind(disable_std_handler=True, request_id='req-"1]').info("Syslog message")
+    _logger_loader.remove_handler("syslog_handler")
+
+    assert re.match(pattern, _server.wait_for(1).decode())
+    _server.close()
+
+    logger.success(f"Done: syslog handler ({syslog_format}).\n")